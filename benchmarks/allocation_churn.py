@@ -0,0 +1,98 @@
+"""Measure how much of a long endless run goes into making shots and monsters.
+
+Plays endless levels holding fire (cycling normal, rapid, spread and missile
+shots) and warps through the portal every few seconds. Counts the missiles
+and monsters made and times their constructors, and counts the garbage
+collections run by generation. Bullets go straight into the projectile
+store, so none are made. The constructor time is all that recycling shots
+and monsters through object pools could save.
+
+    python benchmarks/allocation_churn.py --levels 40
+"""
+import argparse
+import gc
+import time
+
+from session_ticks import ROOT  # Also sets up the game directory
+
+import pygame
+import game_session
+import player
+from bullet import Missile
+from game_session import GameSession, FrameInput
+
+TICKS_PER_LEVEL = 300
+
+
+def play(levels, seed):
+    made = {'missiles': 0, 'monsters': 0}
+    making = [0.0]
+    collections = [0, 0, 0]
+    create_monster = game_session.create_monster
+
+    class TimedMissile(Missile):
+        def __init__(self, *args):
+            start = time.perf_counter()
+            super().__init__(*args)
+            making[0] += time.perf_counter() - start
+            made['missiles'] += 1
+
+    def timed_create_monster(*args):
+        start = time.perf_counter()
+        monster = create_monster(*args)
+        making[0] += time.perf_counter() - start
+        made['monsters'] += 1
+        return monster
+
+    def count(phase, info):
+        if phase == 'start':
+            collections[info['generation']] += 1
+
+    player.Missile = TimedMissile
+    game_session.create_monster = timed_create_monster
+    try:
+        session = GameSession("endless", seed=seed)
+        gc.collect()
+        gc.callbacks.append(count)
+        start = time.perf_counter()
+        ticks = 0
+        for _ in range(levels):
+            for tick in range(TICKS_PER_LEVEL):
+                if session.game_over:
+                    session.start()
+                ant = session.player
+                ant.has_rapid = ant.has_spread = ant.has_missile = True
+                ant.health = ant.max_health
+                walk = pygame.K_d if (tick // 100) % 2 == 0 else pygame.K_a
+                weapon = (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4)[(tick // 75) % 4]
+                session.step(FrameInput([walk, pygame.K_RSHIFT, weapon]))
+                ticks += 1
+            # Warp into the portal
+            session.has_spore = True
+            session.portal.activate()
+            session.player.x, session.player.y = session.portal.x + 10, session.portal.y + 10
+            session.step(FrameInput())
+            ticks += 1
+        elapsed = time.perf_counter() - start
+    finally:
+        gc.callbacks.remove(count)
+        player.Missile = Missile
+        game_session.create_monster = create_monster
+    return elapsed, ticks, made, making[0], collections
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--levels', type=int, default=40)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    elapsed, ticks, made, making, collections = play(args.levels, args.seed)
+    print(f"levels={args.levels} ticks={ticks} time={elapsed:.2f}s ({ticks / elapsed:.0f} ticks/s)")
+    print(f"made: missiles={made['missiles']} monsters={made['monsters']} "
+          f"in {making * 1000:.1f}ms ({making / elapsed:.2%} of the run)")
+    print(f"gc runs: gen0={collections[0]} gen1={collections[1]} gen2={collections[2]}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+"""Measure bullet-monster hit detection with heavy fire.
+
+Runs the crowded test level from platform_collisions.py with the player
+holding fire, cycling through rapid, spread and homing missile shots that
+pierce. Once testing every pair of bodies and every bullet against every
+body in the contact pass, and once with its sweep and prune broadphase and
+batched bullet tests (missiles always use the shared TargetIndex).
+First checks that a lock-on missile keeps its target and that bullets hit
+monsters before the monsters move.
+
+    python benchmarks/bullet_hits.py --monsters 80
+"""
+import argparse
+import time
+
+from platform_collisions import make_map  # Also sets up the game directory
+
+import pygame
+import game_session
+from game_session import GameSession, FrameInput
+from contacts import Contacts
+from monsters import Walker
+
+
+class AllPairs(Contacts):
+    """No broadphase - every body is tested against every other, and every
+    bullet against every body"""
+
+    def _pairs(self):
+        rects = self.rects
+        return [(i, j) for i in range(len(rects)) for j in range(i + 1, len(rects))
+                if rects[i].colliderect(rects[j])]
+
+    def _batch_pairs(self, boxes, layer, mask):
+        pairs = []
+        for row, (left, top, right, bottom) in enumerate(zip(*(column.tolist() for column in boxes))):
+            rect = pygame.Rect(left, top, right - left, bottom - top)
+            for index, (_, body_layer, body_mask) in enumerate(self.bodies):
+                if (mask & body_layer or body_mask & layer) and rect.colliderect(self.rects[index]):
+                    pairs.append((row, index))
+        return pairs
+
+
+def check_sticky_missile():
+    """A lock-on missile keeps chasing the monster it locked onto when a
+    nearer one turns up; a plain missile switches to the nearer one"""
+    map_data = {
+        'name': 'Sticky missile', 'width': 1200, 'height': 800,
+        'background_color': [120, 145, 170], 'player_spawn': {'x': 100, 'y': 500},
+        'platforms': [{'x': 0, 'y': 560, 'width': 1200, 'height': 40, 'color': [100, 100, 100]}],
+        'monsters': [{'type': 'walker', 'x': 450, 'y': 520, 'patrol_range': 0, 'speed': 0, 'health': 50}],
+    }
+    for sticky in (True, False):
+        game_session.Contacts = Contacts
+        session = GameSession("test", map_data=map_data)
+        player = session.player
+        player.has_missile = True
+        player.missile_lock = sticky
+        session.step(FrameInput([pygame.K_4, pygame.K_RSHIFT]))
+        for _ in range(5):
+            session.step(FrameInput([]))
+        missile, = session.bullets.live_missiles()
+        locked = session.monsters[0]
+        if missile.target is not locked:
+            raise SystemExit("Missile didn't home on the only monster in range")
+        nearer = Walker(missile.x + 80, locked.y, 0, 0, 50)
+        session.monsters.append(nearer)
+        session.step(FrameInput([]))
+        expected = locked if sticky else nearer
+        if missile.target is not expected:
+            kind = "Sticky" if sticky else "Plain"
+            raise SystemExit(f"{kind} missile chased the wrong monster when a nearer one appeared")
+
+
+def check_hits_before_monsters_move():
+    """A bullet hits a monster where it stood at the start of the tick, even
+    if the monster then moves out of the bullet's way"""
+    map_data = {
+        'name': 'Hits before moving', 'width': 1200, 'height': 800,
+        'background_color': [120, 145, 170], 'player_spawn': {'x': 100, 'y': 500},
+        'platforms': [{'x': 0, 'y': 560, 'width': 1200, 'height': 40, 'color': [100, 100, 100]}],
+        'monsters': [{'type': 'walker', 'x': 600, 'y': 520, 'patrol_range': 500, 'speed': 30, 'health': 5}],
+    }
+    game_session.Contacts = Contacts
+    session = GameSession("test", map_data=map_data)
+    walker = session.monsters[0]
+    session.bullets.fire_bullet(walker.x - 20, walker.y + 15, 1)
+    session.step(FrameInput([]))
+    if walker.health != 4:
+        raise SystemExit("Bullet missed a monster that only moved out of its way after it hit")
+
+
+def run(map_data, ticks, seed, contacts_class):
+    game_session.Contacts = contacts_class
+    session = GameSession("test", map_data=map_data, seed=seed)
+    bullet_ticks = 0
+    start = time.perf_counter()
+    for tick in range(ticks):
+        if session.game_over or session.victory:
+            session.start()
+        player = session.player
+        player.has_rapid = player.has_spread = player.has_missile = player.has_pierce = True
+        player.health = player.max_health
+        walk = pygame.K_d if (tick // 200) % 2 == 0 else pygame.K_a
+        weapon = (pygame.K_2, pygame.K_3, pygame.K_4)[(tick // 100) % 3]  # Rapid, spread, missile
+        session.step(FrameInput([walk, pygame.K_RSHIFT, weapon]))
+        bullet_ticks += len(session.bullets)
+    elapsed = time.perf_counter() - start
+    return elapsed, bullet_ticks / ticks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--platforms', type=int, default=50)
+    parser.add_argument('--monsters', type=int, default=80)
+    parser.add_argument('--ticks', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    check_sticky_missile()
+    check_hits_before_monsters_move()
+    map_data = make_map(args.platforms, args.monsters, args.seed)
+    for label, contacts_class in (("all pairs", AllPairs), ("sweep and prune", Contacts)):
+        elapsed, bullets = run(map_data, args.ticks, args.seed, contacts_class)
+        print(f"{label}: monsters={args.monsters} bullets/tick={bullets:.1f} ticks={args.ticks} "
+              f"time={elapsed:.2f}s ({args.ticks / elapsed:.0f} ticks/s)")
+
+
+if __name__ == '__main__':
+    main()
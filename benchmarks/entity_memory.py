@@ -0,0 +1,105 @@
+"""Measure the memory and attribute access cost of the entity classes.
+
+Builds a horde of every entity class (player, shots, platforms, spores, the
+portal, shop items, the shopkeeper and every monster type) and reports, per
+class, the bytes each instance takes with its __slots__ layout and with the
+same attributes in an instance __dict__ (how the classes used to be laid
+out), then times reading and writing x and y across the whole horde in both
+layouts.
+
+    python benchmarks/entity_memory.py --count 5000
+"""
+import argparse
+import time
+import tracemalloc
+
+from session_ticks import ROOT  # Also sets up the game directory
+
+from bullet import Bullet, Missile
+from game_platform import Platform
+from monsters import create_monster
+from player import Player
+from portal import Portal
+from shop_ant import ShopAnt
+from shop_item import ShopItem
+from snapshot import slot_names
+from spore import Spore
+
+MONSTER_TYPES = ['walker', 'flyer', 'spider', 'blob', 'taterbug', 'razorback', 'chompy', 'snake', 'shriek']
+
+
+def make_entities():
+    """One of each entity class"""
+    entities = [Player(100, 600), Bullet(100, 600, 1), Missile(100, 600, 1), Spore(600, 400), Portal(560, 10),
+                Platform(0, 750, 1200, 50, (100, 100, 100)), ShopItem("Extra Life", 'life', 5, "+1 Life", 270, 550),
+                ShopAnt(600, 680)]
+    for monster_type in MONSTER_TYPES:
+        entities.append(create_monster({'type': monster_type, 'x': 300, 'y': 700, 'patrol_range': 100,
+                                        'speed': 2, 'health': 3}))
+    return entities
+
+
+def dict_backed(cls):
+    """A class laid out like the entities used to be: attributes in a __dict__"""
+    return type(cls.__name__ + 'Dict', (), {})
+
+
+def clone(entity, cls):
+    """A cls instance with entity's attribute values"""
+    copy = cls.__new__(cls)
+    for name in slot_names(type(entity)):
+        if hasattr(entity, name):
+            setattr(copy, name, getattr(entity, name))
+    return copy
+
+
+def bytes_per_instance(entity, cls, count):
+    """Memory a cls instance holding entity's values takes, averaged over count"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    copies = [clone(entity, cls) for _ in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    # Don't count the list holding them
+    return (used - copies.__sizeof__()) / count
+
+
+def access_time(horde, passes):
+    """Seconds per pass of moving every entity in horde"""
+    start = time.perf_counter()
+    for _ in range(passes):
+        for entity in horde:
+            entity.x = entity.x + 1
+            entity.y = entity.y - 1
+    return (time.perf_counter() - start) / passes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=5000, help="instances of each class")
+    parser.add_argument('--passes', type=int, default=20)
+    args = parser.parse_args()
+
+    entities = make_entities()
+    backed_classes = {type(entity): dict_backed(type(entity)) for entity in entities}
+    total_slots = total_dict = 0
+    for entity in entities:
+        cls = type(entity)
+        slotted = bytes_per_instance(entity, cls, args.count)
+        backed = bytes_per_instance(entity, backed_classes[cls], args.count)
+        total_slots += slotted
+        total_dict += backed
+        print(f"{cls.__name__:10} attrs={len(slot_names(cls)):2} slots={slotted:5.0f}B dict={backed:5.0f}B")
+    print(f"{'all':10} slots={total_slots:.0f}B dict={total_dict:.0f}B per set of {len(entities)} "
+          f"({100 * (1 - total_slots / total_dict):.0f}% less)")
+
+    slotted = [clone(entity, type(entity)) for entity in entities for _ in range(args.count)]
+    backed = [clone(entity, backed_classes[type(entity)]) for entity in entities for _ in range(args.count)]
+    for label, horde in (("dict", backed), ("slots", slotted)):
+        seconds = access_time(horde, args.passes)
+        print(f"{label}: entities={len(horde)} move pass={seconds * 1000:.2f}ms "
+              f"({seconds / len(horde) * 1e9:.0f}ns per entity)")
+
+
+if __name__ == '__main__':
+    main()
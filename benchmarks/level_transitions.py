@@ -0,0 +1,64 @@
+"""Measure how long portal level changes take, with and without prebuilding.
+
+Plays through every level of a mode by warping the player into the active
+portal, once building each level when the portal is entered and once with a
+FrameScheduler prebuilding the next level in between ticks.
+
+    python benchmarks/level_transitions.py --mode endless --levels 30
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # Level files are loaded relative to the game directory
+
+from game_session import GameSession, FrameInput
+from scheduler import FrameScheduler
+
+TICKS_PER_LEVEL = 120
+SPARE_FRAME_TIME = 0.002  # Scheduler budget per tick
+
+
+def play_through(mode, levels, seed, scheduler):
+    session = GameSession(mode, seed=seed, scheduler=scheduler)
+    times = []
+    prebuilt = 0
+    idle = FrameInput()
+    while len(times) < levels and not (session.game_over or session.victory):
+        for _ in range(TICKS_PER_LEVEL):
+            session.step(idle)
+            if scheduler:
+                scheduler.run(time.perf_counter() + SPARE_FRAME_TIME)
+        # Warp into the portal
+        session.has_spore = True
+        session.portal.activate()
+        session.player.x, session.player.y = session.portal.x + 10, session.portal.y + 10
+        session.transition_ms = 0.0
+        session.step(idle)
+        times.append(session.transition_ms)
+        prebuilt += session.transition_prebuilt
+    return times, prebuilt
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--mode', default='endless', choices=['game', 'tutorial', 'endless'])
+    parser.add_argument('--levels', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    for label, scheduler in (("built on entry", None), ("prebuilt", FrameScheduler())):
+        times, prebuilt = play_through(args.mode, args.levels, args.seed, scheduler)
+        times.sort()
+        print(f"{label}: transitions={len(times)} prebuilt={prebuilt} "
+              f"mean={sum(times) / len(times):.3f}ms p50={times[len(times) // 2]:.3f}ms max={times[-1]:.3f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""Measure collision cost on levels with many platforms.
+
+Generates a test level with a floor, rows of small ledges and a crowd of
+monsters, then runs the scripted player from session_ticks.py against it
+twice: once testing every platform (the old behaviour) and once through the
+level's PlatformGrid. First checks that ground monsters pushed into their
+floor get back on top of it instead of falling through.
+
+    python benchmarks/platform_collisions.py --platforms 500 --monsters 40
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from game_session import GameSession
+from spatial import PlatformGrid
+from session_ticks import scripted_input
+
+MONSTER_TYPES = ['walker', 'spider', 'chompy', 'taterbug', 'snake', 'razorback']
+
+
+class AllPlatforms(PlatformGrid):
+    """No index - every query returns every platform"""
+
+    def query(self, rect):
+        return self.platforms
+
+
+def make_map(platforms, monsters, seed):
+    rnd = random.Random(seed)
+    map_data = {
+        'name': 'Platform benchmark', 'width': 1200, 'height': 800,
+        'background_color': [120, 145, 170], 'player_spawn': {'x': 100, 'y': 600},
+        'platforms': [{'x': 0, 'y': 750, 'width': 1200, 'height': 50, 'color': [100, 100, 100]}],
+        'monsters': [],
+    }
+    for _ in range(platforms - 1):
+        map_data['platforms'].append({'x': rnd.randrange(0, 1160), 'y': rnd.randrange(100, 700, 40),
+                                      'width': rnd.randrange(20, 60), 'height': 10, 'color': [139, 90, 43]})
+    for i in range(monsters):
+        map_data['monsters'].append({'type': MONSTER_TYPES[i % len(MONSTER_TYPES)],
+                                     'x': rnd.randrange(200, 1100), 'y': 700,
+                                     'patrol_range': 100, 'speed': 2, 'health': 1000})
+    return map_data
+
+
+def check_pushed_into_floor():
+    """Every ground monster shoved a few pixels into the floor it stands on
+    (as monster separation can do) must end up back on top of it"""
+    map_data = {
+        'name': 'Pushed into floor', 'width': 1200, 'height': 800,
+        'background_color': [120, 145, 170], 'player_spawn': {'x': 1100, 'y': 400},
+        'platforms': [{'x': 0, 'y': 560, 'width': 1200, 'height': 40, 'color': [100, 100, 100]}],
+        'monsters': [{'type': monster_type, 'x': 500, 'y': 500, 'patrol_range': 100, 'speed': 2, 'health': 3}
+                     for monster_type in ('walker', 'spider', 'chompy', 'taterbug')],
+    }
+    session = GameSession("test", map_data=map_data)
+    for monster in session.monsters:
+        for _ in range(30):
+            monster.update(session.platform_grid, session.player)
+        standing = monster.y
+        monster.y += 4
+        monster.update(session.platform_grid, session.player)
+        if monster.y != standing:
+            raise SystemExit(f"{type(monster).__name__} pushed into the floor ended at y={monster.y}, "
+                             f"not back on it at y={standing}")
+
+
+def run(map_data, ticks, seed, grid_class):
+    session = GameSession("test", map_data=map_data, seed=seed)
+    start = time.perf_counter()
+    for tick in range(ticks):
+        if session.game_over or session.victory:
+            session.start()
+        if not isinstance(session.platform_grid, grid_class):
+            session.platform_grid = grid_class(session.platforms, session.nav)
+        session.step(scripted_input(tick))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--platforms', type=int, default=500)
+    parser.add_argument('--monsters', type=int, default=40)
+    parser.add_argument('--ticks', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    check_pushed_into_floor()
+    map_data = make_map(args.platforms, args.monsters, args.seed)
+    for label, grid_class in (("all platforms", AllPlatforms), ("grid", PlatformGrid)):
+        elapsed = run(map_data, args.ticks, args.seed, grid_class)
+        print(f"{label}: platforms={args.platforms} monsters={args.monsters} ticks={args.ticks} "
+              f"time={elapsed:.2f}s ({args.ticks / elapsed:.0f} ticks/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""Measure moving, stopping and hit-testing a screen full of bullets.
+
+Sets up the crowded test level from platform_collisions.py and fires a
+stream of spread shots from across the screen every tick, then moves them,
+stops them at platforms, culls them off screen and finds the ones touching
+monsters, like GameSession does. Once with a list of shot objects handled
+one at a time (the old behaviour) and once with the NumPy ProjectileStore.
+
+    python benchmarks/projectile_store.py --rate 20
+"""
+import argparse
+import random
+import time
+
+from platform_collisions import make_map  # Also sets up the game directory
+
+import pygame
+from bullet import Bullet
+from contacts import Contacts, MONSTER, BULLET
+from game_session import GameSession, SCREEN_WIDTH, SCREEN_HEIGHT
+from projectiles import ProjectileStore
+
+
+class ShotList:
+    """Shot objects in a list, each moved and raycast on its own"""
+
+    def __init__(self):
+        self.shots = []
+
+    def __len__(self):
+        return len(self.shots)
+
+    def append(self, shot):
+        self.shots.append(shot)
+
+    def update(self, platforms):
+        stopped = []
+        for shot in self.shots[:]:
+            start_x, start_y = shot.x, shot.y
+            shot.x += shot.vel_x
+            shot.y += shot.vel_y
+            impact = platforms.raycast(start_x, start_y, shot.width, shot.height,
+                                       shot.x - start_x, shot.y - start_y)
+            if impact is not None:
+                shot.x = start_x + (shot.x - start_x) * impact[0]
+                shot.y = start_y + (shot.y - start_y) * impact[0]
+            if shot.x < 0 or shot.x > SCREEN_WIDTH or shot.y < 0 or shot.y > SCREEN_HEIGHT:
+                self.shots.remove(shot)
+            elif impact is not None:
+                stopped.append(shot)
+        return stopped
+
+    def add_to(self, contacts):
+        for shot in self.shots:
+            contacts.add(shot, BULLET, MONSTER, rect=pygame.Rect(shot.x, shot.y, shot.width, shot.height))
+
+    def remove(self, spent):
+        spent = {id(shot) for shot in spent}
+        self.shots = [shot for shot in self.shots if id(shot) not in spent]
+
+
+class Store(ProjectileStore):
+    """ProjectileStore with the same interface as ShotList"""
+
+    def update(self, platforms):
+        super().update(platforms)
+        self.cull(SCREEN_WIDTH, SCREEN_HEIGHT)
+        return self.stopped_rows()
+
+    def add_to(self, contacts):
+        contacts.add_many(self, BULLET, MONSTER)
+
+
+def run(map_data, ticks, seed, rate, shots):
+    session = GameSession("test", map_data=map_data, seed=seed)
+    rnd = random.Random(seed)
+    in_flight = 0
+    start = time.perf_counter()
+    for tick in range(ticks):
+        for _ in range(rate):
+            direction = rnd.choice((-1, 1))
+            shots.append(Bullet(rnd.uniform(0, SCREEN_WIDTH), rnd.uniform(0, SCREEN_HEIGHT), direction,
+                                speed=rnd.choice((10, 12, 18)), angle=rnd.uniform(-0.3, 0.3)))
+        stopped = shots.update(session.platform_grid)
+        contacts = Contacts()
+        shots.add_to(contacts)
+        for monster in session.monsters:
+            contacts.add(monster, MONSTER)
+        # Shots stop at the first monster or platform they touch
+        spent = {shot for shot, _ in contacts.find().between(BULLET, MONSTER)}
+        spent.update(stopped)
+        if spent:
+            shots.remove(list(spent))
+        in_flight += len(shots)
+    elapsed = time.perf_counter() - start
+    return elapsed, in_flight / ticks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--platforms', type=int, default=50)
+    parser.add_argument('--monsters', type=int, default=40)
+    parser.add_argument('--rate', type=int, default=20, help="shots fired per tick")
+    parser.add_argument('--ticks', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    map_data = make_map(args.platforms, args.monsters, args.seed)
+    for label, shots in (("shot objects", ShotList()), ("projectile store", Store())):
+        elapsed, in_flight = run(map_data, args.ticks, args.seed, args.rate, shots)
+        print(f"{label}: shots/tick={in_flight:.1f} ticks={args.ticks} "
+              f"time={elapsed:.2f}s ({args.ticks / elapsed:.0f} ticks/s)")
+
+
+if __name__ == '__main__':
+    main()
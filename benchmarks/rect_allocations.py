@@ -0,0 +1,72 @@
+"""Count the pygame.Rect objects the simulation allocates per tick.
+
+Runs the crowded test level from platform_collisions.py with the scripted
+player from session_ticks.py, once building a new rect on every get_rect()
+call (the old behaviour) and once with the cached collision.Hitbox rects,
+and reports the rects created per tick and the speed.
+
+    python benchmarks/rect_allocations.py --monsters 40
+"""
+import argparse
+import time
+
+from platform_collisions import make_map  # Also sets up the game directory
+
+import pygame
+from collision import Hitbox
+from game_session import GameSession
+from session_ticks import scripted_input
+
+
+class CountingRect(pygame.Rect):
+    """pygame.Rect that counts how many are made"""
+
+    created = 0
+
+    def __init__(self, *args):
+        CountingRect.created += 1
+        super().__init__(*args)
+
+
+def uncached_get_rect(self):
+    return pygame.Rect(self.rect_box())
+
+
+def run(map_data, ticks, seed, cached):
+    cached_get_rect = Hitbox.get_rect
+    if not cached:
+        Hitbox.get_rect = uncached_get_rect
+    rect_class = pygame.Rect
+    pygame.Rect = CountingRect
+    try:
+        session = GameSession("test", map_data=map_data, seed=seed)
+        CountingRect.created = 0
+        start = time.perf_counter()
+        for tick in range(ticks):
+            if session.game_over or session.victory:
+                session.start()
+            session.step(scripted_input(tick))
+        elapsed = time.perf_counter() - start
+        return elapsed, CountingRect.created / ticks
+    finally:
+        pygame.Rect = rect_class
+        Hitbox.get_rect = cached_get_rect
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--platforms', type=int, default=50)
+    parser.add_argument('--monsters', type=int, default=40)
+    parser.add_argument('--ticks', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    map_data = make_map(args.platforms, args.monsters, args.seed)
+    for label, cached in (("new rect per call", False), ("cached rects", True)):
+        elapsed, rects = run(map_data, args.ticks, args.seed, cached)
+        print(f"{label}: monsters={args.monsters} rects/tick={rects:.1f} ticks={args.ticks} "
+              f"time={elapsed:.2f}s ({args.ticks / elapsed:.0f} ticks/s)")
+
+
+if __name__ == '__main__':
+    main()
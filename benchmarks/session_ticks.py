@@ -0,0 +1,65 @@
+"""Measure headless simulation speed.
+
+Runs a GameSession under the SDL dummy driver with a simple scripted player
+(walk back and forth, jump, hold fire) and reports ticks per second.
+
+    python benchmarks/session_ticks.py --mode endless --ticks 20000
+
+With --replay the inputs come from a recording made with game.py --record,
+so the exact same session can be timed against different builds.
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # Level files are loaded relative to the game directory
+
+import pygame
+from game_session import GameSession, FrameInput
+from replay import Replay
+
+
+def scripted_input(tick):
+    """Walk back and forth every 200 ticks, jump regularly and keep shooting"""
+    walk = pygame.K_d if (tick // 200) % 2 == 0 else pygame.K_a
+    pressed = [pygame.K_SPACE] if tick % 37 == 0 else []
+    return FrameInput([walk, pygame.K_RSHIFT], pressed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--mode', default='endless', choices=['game', 'tutorial', 'endless'])
+    parser.add_argument('--ticks', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--replay', metavar='FILE', help="drive the session from a recording")
+    args = parser.parse_args()
+
+    if args.replay:
+        replay = Replay.load(args.replay)
+        args.mode, args.ticks = replay.mode, len(replay)
+        session = GameSession(replay.mode, map_data=replay.map_data, seed=replay.seed)
+        start = time.perf_counter()
+        for frame_input in replay.inputs():
+            session.step(frame_input)
+        elapsed = time.perf_counter() - start
+    else:
+        session = GameSession(args.mode, seed=args.seed)
+        start = time.perf_counter()
+        for tick in range(args.ticks):
+            if session.game_over or session.victory:
+                session.start()
+            session.step(scripted_input(tick))
+        elapsed = time.perf_counter() - start
+
+    print(f"mode={args.mode} ticks={args.ticks} time={elapsed:.2f}s "
+          f"ticks/s={args.ticks / elapsed:.0f} ({args.ticks / elapsed / 60:.0f}x real time)")
+
+
+if __name__ == '__main__':
+    main()
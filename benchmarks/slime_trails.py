@@ -0,0 +1,94 @@
+"""Measure keeping the slime trails of a crowd of blobs.
+
+Ages every blob's trails once a tick and drops a new trail every few ticks,
+as Blob.update does while sloshing, then draws the blobs with the trails
+they have at the end. Once with the trails in a list of (x, y, ticks
+left) that is rebuilt every tick (the old behaviour) and once with the
+time-stamped ring buffer. A longer --duration leaves more trails lying
+around.
+
+    python benchmarks/slime_trails.py --blobs 50 --duration 180
+"""
+import argparse
+import time
+
+import numpy as np
+
+from session_ticks import ROOT  # Also sets up the game directory
+
+import pygame
+from game_session import SCREEN_WIDTH, SCREEN_HEIGHT
+from monsters.blob import Blob
+
+
+class RingBlob(Blob):
+    """Blob as it is, with room for every trail of the run"""
+
+    __slots__ = ()
+
+    def configure(self, duration, every):
+        self.slime_duration = duration
+        type(self).SLIME_CAPACITY = duration // every + 1
+        self.slime_trails = np.zeros((self.SLIME_CAPACITY, 3))
+
+
+class ListBlob(Blob):
+    """Blob keeping its trails in a list, counting each one down"""
+
+    __slots__ = ()
+
+    def configure(self, duration, every):
+        self.slime_duration = duration
+        self.slime_trails = []
+
+    def _age_slime(self):
+        self.slime_trails = [(sx, sy, t - 1) for sx, sy, t in self.slime_trails if t > 1]
+
+    def _drop_slime(self):
+        self.slime_trails.append((self.back_x, self.pool_y + self.base_radius * 1.5, self.slime_duration))
+
+    def live_slime(self):
+        return self.slime_trails
+
+
+def run(cls, count, duration, every, ticks, frames):
+    blobs = []
+    for i in range(count):
+        blob = cls(100 + i * 20, 500, 100, 2, 3)
+        blob.configure(duration, every)
+        blobs.append(blob)
+    start = time.perf_counter()
+    for tick in range(ticks):
+        for blob in blobs:
+            blob._age_slime()
+            if tick % every == 0:
+                blob.back_x += 5
+                blob._drop_slime()
+    upkeep = (time.perf_counter() - start) / ticks / count
+    trails = sum(len(blob.live_slime()) for blob in blobs) / count
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    start = time.perf_counter()
+    for _ in range(frames):
+        for blob in blobs:
+            blob.draw(screen)
+    draw = (time.perf_counter() - start) / frames / count
+    return upkeep, draw, trails
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--blobs', type=int, default=50)
+    parser.add_argument('--duration', type=int, default=180, help="ticks a trail lasts")
+    parser.add_argument('--every', type=int, default=7, help="ticks between trails")
+    parser.add_argument('--ticks', type=int, default=3000)
+    parser.add_argument('--frames', type=int, default=10, help="frames drawn after the run")
+    args = parser.parse_args()
+
+    for label, cls in (("list of trails", ListBlob), ("ring buffer", RingBlob)):
+        upkeep, draw, trails = run(cls, args.blobs, args.duration, args.every, args.ticks, args.frames)
+        print(f"{label}: blobs={args.blobs} trails/blob={trails:.1f} upkeep={upkeep * 1e6:.2f}us "
+              f"draw={draw * 1e6:.0f}us per blob per tick")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""Measure keeping and sampling snake position histories.
+
+Moves a nest of snakes like they move in play (patrolling, with a fast
+lunge now and then) and records their head positions and samples their body
+segments every tick, as Snake.update and Snake.draw do. Once with the
+history in a list that new positions are inserted at the front of (the old
+behaviour) and once with the ring buffer. --segments makes longer snakes.
+
+    python benchmarks/snake_history.py --snakes 50 --segments 12
+"""
+import argparse
+import math
+import random
+import time
+
+from session_ticks import ROOT  # Also sets up the game directory
+
+from monsters.snake import Snake
+
+
+class RingSnake(Snake):
+    """Snake as it is, with a history long enough for segments"""
+
+    __slots__ = ()
+
+    def resize(self, segments):
+        self.num_segments = segments
+        self.history_length = segments * self.segment_spacing
+        self.position_history = [(self.x + 20, self.y + 30)] * self.history_length
+        self.history_head = 0
+
+
+class ListSnake(Snake):
+    """Snake keeping its history in a list, newest first"""
+
+    __slots__ = ()
+
+    def resize(self, segments):
+        self.num_segments = segments
+        self.history_length = segments * self.segment_spacing
+        self.position_history = [(self.x + 20, self.y + 30)] * self.history_length
+
+    def _update_position_history(self):
+        wave_offset = math.sin(self.slither_phase) * 6
+        head_x = self.x + 20
+        head_y = self.y + 30 + wave_offset
+        last_x, last_y = self.position_history[0]
+        dx = head_x - last_x
+        dy = head_y - last_y
+        dist = math.sqrt(dx * dx + dy * dy)
+        if dist > 2.0:
+            num_steps = max(1, int(dist / 2.0))
+            for i in range(1, num_steps + 1):
+                t = i / num_steps
+                self.position_history.insert(0, (last_x + dx * t, last_y + dy * t))
+        else:
+            self.position_history.insert(0, (head_x, head_y))
+        if len(self.position_history) > self.history_length:
+            self.position_history = self.position_history[:self.history_length]
+
+    def _get_segment_positions(self):
+        positions = []
+        for i in range(self.num_segments):
+            base_x, base_y = self.position_history[i * self.segment_spacing]
+            wave = math.sin(self.slither_phase - i * 0.5) * (4 + i * 0.3)
+            positions.append((base_x + wave * 0.3, base_y))
+        return positions
+
+
+def run(cls, count, segments, ticks, seed):
+    rnd = random.Random(seed)
+    snakes = [cls(300, 500, 100, 2, 3) for _ in range(count)]
+    for snake in snakes:
+        snake.resize(segments)
+    # Mostly crawling, with a fast lunge now and then
+    moves = [rnd.uniform(-40, 40) if rnd.random() < 0.05 else rnd.uniform(-3, 3) for _ in range(ticks)]
+    start = time.perf_counter()
+    for move in moves:
+        for snake in snakes:
+            snake.x += move
+            snake.slither_phase += 0.25
+            snake._update_position_history()
+            snake._get_segment_positions()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--snakes', type=int, default=50)
+    parser.add_argument('--segments', type=int, default=12)
+    parser.add_argument('--ticks', type=int, default=600)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    for label, cls in (("list history", ListSnake), ("ring buffer", RingSnake)):
+        elapsed = run(cls, args.snakes, args.segments, args.ticks, args.seed)
+        print(f"{label}: snakes={args.snakes} segments={args.segments} ticks={args.ticks} "
+              f"time={elapsed:.2f}s ({elapsed / args.ticks / args.snakes * 1e6:.1f}us per snake per tick)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Measure GameSession.snapshot() and restore() cost.
+
+Plays a scripted endless run and, every few hundred ticks, times snapshotting
+the session, restoring it and checking that replaying from the snapshot gives
+the same result.
+
+    python benchmarks/snapshot_restore.py --ticks 6000
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)  # Level files are loaded relative to the game directory
+
+from game_session import GameSession
+from session_ticks import scripted_input
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--mode', default='endless', choices=['game', 'tutorial', 'endless'])
+    parser.add_argument('--ticks', type=int, default=6000)
+    parser.add_argument('--every', type=int, default=300, help="ticks between measurements")
+    parser.add_argument('--branch', type=int, default=120, help="ticks simulated before rewinding")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    session = GameSession(args.mode, seed=args.seed)
+    snapshot_times = []
+    restore_times = []
+    mismatches = 0
+    for tick in range(args.ticks):
+        if session.game_over or session.victory:
+            session.start()
+        if tick % args.every == 0:
+            start = time.perf_counter()
+            snapshot = session.snapshot()
+            snapshot_times.append(time.perf_counter() - start)
+
+            # Branch ahead, rewind, and branch again - both must agree
+            results = []
+            for _ in range(2):
+                for branch_tick in range(tick, tick + args.branch):
+                    session.step(scripted_input(branch_tick))
+                results.append((session.player.x, session.player.y, session.game_state.total_score,
+                                [(m.x, m.y, m.health) for m in session.monsters]))
+                start = time.perf_counter()
+                session.restore(snapshot)
+                restore_times.append(time.perf_counter() - start)
+            mismatches += results[0] != results[1]
+        session.step(scripted_input(tick))
+
+    def report(name, times):
+        times = sorted(times)
+        print(f"{name}: mean={sum(times) / len(times) * 1e6:.0f}us "
+              f"p50={times[len(times) // 2] * 1e6:.0f}us max={times[-1] * 1e6:.0f}us")
+
+    report("snapshot", snapshot_times)
+    report("restore", restore_times)
+    print(f"branches compared={len(snapshot_times)} mismatches={mismatches}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,30 +3,41 @@ import math
 
 
 class Bullet:
+    """A bullet's size, speed and look. Player.shoot has the session's
+    ProjectileStore fire_bullet() straight into a row, so in play no Bullet
+    objects are made; append() still takes one."""
+
+    __slots__ = ('x', 'y', 'width', 'height', 'speed', 'direction', 'angle', 'vel_x', 'vel_y')
+
+    WIDTH = 10
+    HEIGHT = 6
+    COLOR = (255, 255, 0)
+
     def __init__(self, x, y, direction, speed=12, angle=0):
         self.x = x
         self.y = y
-        self.width = 10
-        self.height = 6
+        self.width = self.WIDTH
+        self.height = self.HEIGHT
         self.speed = speed
         self.direction = direction
         self.angle = angle  # Vertical angle for spread shot
-        self.color = (255, 255, 0)
+        self.vel_x = speed * direction
+        self.vel_y = speed * angle
 
-    def get_rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+    @staticmethod
+    def draw_at(screen, x, y, width, height):
+        pygame.draw.rect(screen, Bullet.COLOR, (x, y, width, height))
+        pygame.draw.rect(screen, (255, 200, 0), (x + 2, y + 1, width - 4, height - 2))
 
-    def update(self):
-        self.x += self.speed * self.direction
-        self.y += self.speed * self.angle  # Apply vertical movement
 
-    def draw(self, screen):
-        pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
-        pygame.draw.rect(screen, (255, 200, 0), (self.x + 2, self.y + 1, self.width - 4, self.height - 2))
+class Missile:
+    __slots__ = ('x', 'y', 'width', 'height', 'speed', 'direction', 'vel_x', 'vel_y', 'turn_rate',
+                 'sticky', 'target')
 
+    HOMING_RANGE = 400
+    COLOR = (255, 100, 50)
 
-class Missile:
-    def __init__(self, x, y, direction):
+    def __init__(self, x, y, direction, sticky=False):
         self.x = x
         self.y = y
         self.width = 14
@@ -35,50 +46,47 @@ class Missile:
         self.direction = direction
         self.vel_x = self.speed * direction
         self.vel_y = 0
-        self.color = (255, 100, 50)
         self.turn_rate = 0.15  # How fast it can turn toward target
+        # Sticky missiles keep chasing their target while it's alive and in
+        # range instead of looking for the nearest monster every tick
+        self.sticky = sticky
+        self.target = None
 
-    def get_rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height)
-
-    def update(self, monsters=None):
-        # Find nearest monster and home toward it
-        if monsters:
-            nearest = None
-            nearest_dist = float('inf')
-            for monster in monsters:
-                if monster.health <= 0:
-                    continue
-                mx = monster.x + monster.width / 2
-                my = monster.y + monster.height / 2
-                dist = math.sqrt((mx - self.x) ** 2 + (my - self.y) ** 2)
-                if dist < nearest_dist:
-                    nearest_dist = dist
-                    nearest = monster
-
-            if nearest and nearest_dist < 400:  # Only home within range
-                mx = nearest.x + nearest.width / 2
-                my = nearest.y + nearest.height / 2
-                # Calculate desired direction
-                dx = mx - self.x
-                dy = my - self.y
-                dist = math.sqrt(dx * dx + dy * dy)
-                if dist > 0:
-                    # Desired velocity
-                    target_vx = (dx / dist) * self.speed
-                    target_vy = (dy / dist) * self.speed
-                    # Gradually turn toward target
-                    self.vel_x += (target_vx - self.vel_x) * self.turn_rate
-                    self.vel_y += (target_vy - self.vel_y) * self.turn_rate
+    def steer(self, targets, x, y, vel_x, vel_y):
+        """Velocity for the next move of this missile, now at (x, y) and
+        moving at (vel_x, vel_y): turned toward the nearest monster, or the
+        one a sticky missile is already chasing (targets is a
+        spatial.TargetIndex)"""
+        nearest = None
+        if self.sticky and self.target is not None:
+            dist = targets.distance(self.target, x, y)
+            if dist is not None and dist < self.HOMING_RANGE:
+                nearest = self.target
+        if nearest is None:
+            nearest = targets.nearest(x, y, self.HOMING_RANGE)
+        self.target = nearest
 
-        # Move
-        self.x += self.vel_x
-        self.y += self.vel_y
+        if nearest:
+            mx = nearest.x + nearest.width / 2
+            my = nearest.y + nearest.height / 2
+            # Calculate desired direction
+            dx = mx - x
+            dy = my - y
+            dist = math.sqrt(dx * dx + dy * dy)
+            if dist > 0:
+                # Desired velocity
+                target_vx = (dx / dist) * self.speed
+                target_vy = (dy / dist) * self.speed
+                # Gradually turn toward target
+                vel_x += (target_vx - vel_x) * self.turn_rate
+                vel_y += (target_vy - vel_y) * self.turn_rate
+        return vel_x, vel_y
 
-    def draw(self, screen):
+    @staticmethod
+    def draw_at(screen, x, y, width, height, vel_x):
         # Missile body
-        pygame.draw.ellipse(screen, self.color, (self.x, self.y, self.width, self.height))
+        pygame.draw.ellipse(screen, Missile.COLOR, (x, y, width, height))
         # Flame trail
-        flame_x = self.x - 6 if self.vel_x > 0 else self.x + self.width
-        pygame.draw.circle(screen, (255, 200, 50), (int(flame_x), int(self.y + self.height / 2)), 4)
-        pygame.draw.circle(screen, (255, 255, 100), (int(flame_x), int(self.y + self.height / 2)), 2)
+        flame_x = x - 6 if vel_x > 0 else x + width
+        pygame.draw.circle(screen, (255, 200, 50), (int(flame_x), int(y + height / 2)), 4)
+        pygame.draw.circle(screen, (255, 255, 100), (int(flame_x), int(y + height / 2)), 2)
@@ -0,0 +1,101 @@
+import pygame
+
+
+class Hitbox:
+    """Collision box shared by the game's entities.
+
+    get_rect() returns a pygame.Rect that is cached until the box it's made
+    from changes, so collision code can ask for it as often as it likes
+    without allocating. Subclasses describe their box in rect_box() (x, y,
+    width and height by default). The cached rect is shared: treat it as
+    read-only. It is replaced, never changed in place, so rects handed out
+    earlier keep the old box."""
+
+    __slots__ = ('_rect', '_rect_box')
+
+    def rect_box(self):
+        return (self.x, self.y, self.width, self.height)
+
+    def get_rect(self):
+        box = self.rect_box()
+        try:
+            if box == self._rect_box:
+                return self._rect
+        except AttributeError:
+            pass  # First call - nothing cached yet
+        self._rect_box = box
+        self._rect = pygame.Rect(box)
+        return self._rect
+
+
+def time_of_impact(x, y, width, height, dx, dy, rect):
+    """When a width x height box at (x, y) moving by (dx, dy) first overlaps
+    rect, as the fraction 0..1 of the move made by then - 0 if they overlap
+    from the start, None if they never do. Touching edges don't count, like
+    Rect.colliderect."""
+    if rect.width <= 0 or rect.height <= 0:
+        return None
+    enter, leave = 0.0, 1.0
+    for pos, size, delta, low, high in ((x, width, dx, rect.left, rect.right),
+                                        (y, height, dy, rect.top, rect.bottom)):
+        if delta == 0:
+            if pos + size <= low or pos >= high:
+                return None
+            continue
+        # Times the leading and trailing edges cross the rect on this axis
+        first = (low - (pos + size)) / delta
+        last = (high - pos) / delta
+        if first > last:
+            first, last = (high - pos) / delta, (low - (pos + size)) / delta
+        enter = max(enter, first)
+        leave = min(leave, last)
+        if enter >= leave:
+            return None
+    return enter
+
+
+def push_out(body, platforms):
+    """Move body out of the platforms it overlaps (pushed into them by
+    another body, or a platform respawned on it) along whichever side it is
+    least far in, so a later sweep() doesn't let it pass through them.
+    A vertical push stops it falling or rising."""
+    rect = body.get_rect()
+    for platform in platforms.query(rect):
+        if rect.colliderect(platform.rect):
+            # Calculate overlap on each axis
+            overlap_left = rect.right - platform.rect.left
+            overlap_right = platform.rect.right - rect.left
+            overlap_top = rect.bottom - platform.rect.top
+            overlap_bottom = platform.rect.bottom - rect.top
+
+            # Find smallest overlap to determine push direction
+            min_overlap = min(overlap_left, overlap_right, overlap_top, overlap_bottom)
+
+            if min_overlap == overlap_left:
+                body.x = platform.rect.left - body.width
+            elif min_overlap == overlap_right:
+                body.x = platform.rect.right
+            elif min_overlap == overlap_top:
+                body.y = platform.rect.top - body.height
+                body.vel_y = 0
+            elif min_overlap == overlap_bottom:
+                body.y = platform.rect.bottom
+                body.vel_y = 0
+
+
+def sweep(body, platforms, dx, dy):
+    """Move body (anything with x, y, width and height) by (dx, dy), stopping
+    where it first touches a platform (platforms is a spatial.PlatformGrid).
+    Returns that platform, or None if the way was clear. Sweep one axis at a
+    time so bodies slide along what they hit; however far the move, nothing
+    in between is skipped. A platform the body is already inside doesn't
+    stop it, so it can't get stuck there - push_out() it first."""
+    hit = platforms.raycast(body.x, body.y, body.width, body.height, dx, dy, ignore_inside=True)
+    if hit is None:
+        body.x += dx
+        body.y += dy
+        return None
+    t, platform = hit
+    body.x += dx * t
+    body.y += dy * t
+    return platform
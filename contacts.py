@@ -0,0 +1,112 @@
+import numpy as np
+import pygame
+from spatial import overlapping_pairs, range_pairs
+
+# Collision layers - a body is on one layer and its mask lists the layers it
+# wants contacts with
+PLAYER = 1
+MONSTER = 2
+BULLET = 4
+SPORE = 8
+PORTAL = 16
+SHOP_ITEM = 32
+SHOPKEEPER = 64
+
+
+class Contacts:
+    """One tick's contact pass.
+
+    Register every body with add(entity, layer, mask), then find() runs a
+    single broadphase over all of them and keeps the touching pairs where
+    either body's mask includes the other's layer. between(layer_a, layer_b)
+    returns those contacts as (a, b) pairs, in the order the bodies were
+    added. Rects are taken when a body is added (get_rect() unless a rect is
+    given), so handlers should re-test contacts that earlier ones may have
+    moved.
+
+    add_many(batch, layer, mask) registers every row of a
+    projectiles.ProjectileStore in one go; their contacts come back with
+    the row number in place of an entity, ordered by row. Batches are only
+    tested against bodies, not against each other, and each row only
+    against the bodies near it along x."""
+
+    FEW_ROWS = 16  # Batches up to this size are tested row by row
+
+    def __init__(self):
+        self.bodies = []  # (entity, layer, mask)
+        self.rects = []
+        self.batches = []  # (boxes, layer, mask)
+        self.found = {}
+
+    def add(self, entity, layer, mask=0, rect=None):
+        self.bodies.append((entity, layer, mask))
+        self.rects.append(entity.get_rect() if rect is None else rect)
+
+    def add_many(self, batch, layer, mask=0):
+        self.batches.append((batch.boxes(), layer, mask))
+
+    def _pairs(self):
+        """Index pairs (i, j), i < j, of the bodies whose rects collide"""
+        return overlapping_pairs(self.rects)
+
+    def _batch_pairs(self, boxes, layer, mask):
+        """(row, i) pairs of the batch rows touching body i, for the bodies
+        the batch's layer and mask pick out, in order"""
+        indices = [index for index, (_, body_layer, body_mask) in enumerate(self.bodies)
+                   if (mask & body_layer or body_mask & layer) and
+                   self.rects[index].width > 0 and self.rects[index].height > 0]
+        if not indices:
+            return []
+        rects = [self.rects[index] for index in indices]
+        if len(boxes[0]) <= self.FEW_ROWS:
+            # Not worth the arrays - test each row's rect against the bodies
+            pairs = []
+            for row, (left, top, right, bottom) in enumerate(zip(*(column.tolist() for column in boxes))):
+                touching = pygame.Rect(left, top, right - left, bottom - top).collidelistall(rects)
+                pairs.extend((row, indices[i]) for i in touching)
+            return pairs
+        left, top, right, bottom = np.array([(rect.left, rect.top, rect.right, rect.bottom)
+                                             for rect in rects]).T
+        lefts, tops, rights, bottoms = boxes
+        # With the bodies sorted by left edge, the ones a row may touch are a
+        # run starting within the widest body's width left of the row and
+        # ending at its right edge
+        order = np.argsort(left, kind='stable')
+        sorted_left = left[order]
+        starts = np.searchsorted(sorted_left, lefts - (right - left).max(), 'right')
+        stops = np.searchsorted(sorted_left, rights, 'left')
+        rows, found = range_pairs(starts, stops)
+        found = order[found]
+        touching = ((lefts[rows] < right[found]) & (rights[rows] > left[found]) &
+                    (tops[rows] < bottom[found]) & (bottoms[rows] > top[found]))
+        # Back in row, then body order
+        rows, found = np.divmod(np.sort(rows[touching] * len(indices) + found[touching]), len(indices))
+        return list(zip(rows.tolist(), [indices[i] for i in found.tolist()]))
+
+    def find(self):
+        bodies = self.bodies
+        found = {}
+        for i, j in sorted(self._pairs()):
+            a, layer_a, mask_a = bodies[i]
+            b, layer_b, mask_b = bodies[j]
+            if mask_a & layer_b or mask_b & layer_a:
+                if layer_a <= layer_b:
+                    found.setdefault((layer_a, layer_b), []).append((a, b))
+                else:
+                    found.setdefault((layer_b, layer_a), []).append((b, a))
+        for boxes, layer, mask in self.batches:
+            if not len(boxes[0]):
+                continue
+            for row, index in self._batch_pairs(boxes, layer, mask):
+                entity, body_layer, _ = bodies[index]
+                if layer <= body_layer:
+                    found.setdefault((layer, body_layer), []).append((row, entity))
+                else:
+                    found.setdefault((body_layer, layer), []).append((entity, row))
+        self.found = found
+        return self
+
+    def between(self, layer_a, layer_b):
+        if layer_a <= layer_b:
+            return self.found.get((layer_a, layer_b), [])
+        return [(a, b) for b, a in self.found.get((layer_b, layer_a), ())]
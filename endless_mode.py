@@ -1,18 +1,28 @@
 import random
 import math
 
+import pygame
+from game_platform import Platform
+from navigation import NavGraph
+
 
 class EndlessLevelGenerator:
-    def __init__(self):
+    MAX_LAYOUT_TRIES = 10  # Layouts to try before settling for one that can't be finished
+
+    def __init__(self, rng=None):
         self.difficulty = 1.0
         self.level_count = 0
         self.screen_width = 1200
         self.screen_height = 800
+        # random.Random-compatible source for every random choice
+        self.rng = rng if rng is not None else random.Random()
 
-    def reset(self):
+    def reset(self, rng=None):
         """Reset generator for new endless run"""
         self.difficulty = 1.0
         self.level_count = 0
+        if rng is not None:
+            self.rng = rng
 
     def generate_level(self):
         """Generate a random level, returns dict matching level JSON format"""
@@ -22,13 +32,21 @@ class EndlessLevelGenerator:
         if self.level_count % 5 == 0:
             return self._generate_shop_level()
 
+        background_color = self._random_background()
+        # Re-roll layouts where the player couldn't get to the spore or the portal
+        for _ in range(self.MAX_LAYOUT_TRIES):
+            spawn = self._generate_spawn()
+            platforms = self._generate_platforms()
+            if self._is_solvable(spawn, platforms):
+                break
+
         level_data = {
             "name": f"Endless Level {self.level_count}",
             "width": self.screen_width,
             "height": self.screen_height,
-            "background_color": self._random_background(),
-            "player_spawn": self._generate_spawn(),
-            "platforms": self._generate_platforms(),
+            "background_color": background_color,
+            "player_spawn": spawn,
+            "platforms": platforms,
             "monsters": [],
             "is_shop": False
         }
@@ -54,10 +72,11 @@ class EndlessLevelGenerator:
             {"name": "Damage Boost", "type": "damage_boost", "cost": base_cost, "description": "2x bullet damage"},
             {"name": "Speed Boost", "type": "speed_boost", "cost": base_cost, "description": "Move 50% faster"},
             {"name": "Magnet", "type": "magnet", "cost": base_cost - 2, "description": "Attract spores"},
+            {"name": "Lock-On", "type": "missile_lock", "cost": base_cost - 2, "description": "Missiles lock on"},
         ]
 
         # Pick 3 random items
-        selected = random.sample(all_items, 3)
+        selected = self.rng.sample(all_items, 3)
         positions = [270, 570, 870]
         shop_items = []
         for i, item in enumerate(selected):
@@ -102,18 +121,31 @@ class EndlessLevelGenerator:
             [125, 145, 165],   # Soft blue
             [155, 150, 130],   # Soft tan
         ]
-        base = random.choice(themes)
+        base = self.rng.choice(themes)
         # Add some variation
         return [
-            max(100, min(180, base[0] + random.randint(-15, 15))),
-            max(100, min(180, base[1] + random.randint(-15, 15))),
-            max(100, min(180, base[2] + random.randint(-15, 15)))
+            max(100, min(180, base[0] + self.rng.randint(-15, 15))),
+            max(100, min(180, base[1] + self.rng.randint(-15, 15))),
+            max(100, min(180, base[2] + self.rng.randint(-15, 15)))
         ]
 
+    def _is_solvable(self, spawn, platforms):
+        """Check the player can get from the spawn point to where the spore
+        appears and to the portal (same positions as GameSession uses)"""
+        nav = NavGraph([Platform(p["x"], p["y"], p["width"], p["height"], p["color"],
+                                 p.get("bouncy", False), p.get("unstable", False))
+                        for p in platforms])
+        start = nav.node_below(spawn["x"], spawn["y"])
+        if start is None:
+            return False
+        spore = pygame.Rect(self.screen_width // 2 - 15, self.screen_height // 2 - 15, 30, 30)
+        portal = pygame.Rect(self.screen_width // 2 - 40, 10, 80, 60)
+        return nav.can_touch(start, spore) and nav.can_touch(start, portal)
+
     def _generate_spawn(self):
         """Generate player spawn point"""
         return {
-            "x": random.randint(50, 200),
+            "x": self.rng.randint(50, 200),
             "y": 650
         }
 
@@ -129,7 +161,7 @@ class EndlessLevelGenerator:
             [90, 60, 40],    # Clay
             [60, 60, 80],    # Purple stone
         ]
-        main_color = random.choice(color_themes)
+        main_color = self.rng.choice(color_themes)
 
         # Always add ground
         platforms.append({
@@ -146,27 +178,27 @@ class EndlessLevelGenerator:
 
         for layer in range(num_layers):
             y = 700 - (layer + 1) * y_spacing
-            num_platforms = random.randint(2, 4)
+            num_platforms = self.rng.randint(2, 4)
 
             # Distribute platforms across the width
             section_width = self.screen_width // num_platforms
 
             for p in range(num_platforms):
-                x = section_width * p + random.randint(20, section_width - 120)
-                width = random.randint(80, 160)
+                x = section_width * p + self.rng.randint(20, section_width - 120)
+                width = self.rng.randint(80, 160)
 
                 # Ensure platforms don't go off screen
                 x = max(0, min(x, self.screen_width - width))
 
                 # Vary the y position slightly
-                platform_y = y + random.randint(-30, 30)
+                platform_y = y + self.rng.randint(-30, 30)
                 platform_y = max(100, min(platform_y, 700))
 
                 # Slightly vary color
                 platform_color = [
-                    max(0, min(255, main_color[0] + random.randint(-15, 15))),
-                    max(0, min(255, main_color[1] + random.randint(-15, 15))),
-                    max(0, min(255, main_color[2] + random.randint(-15, 15)))
+                    max(0, min(255, main_color[0] + self.rng.randint(-15, 15))),
+                    max(0, min(255, main_color[1] + self.rng.randint(-15, 15))),
+                    max(0, min(255, main_color[2] + self.rng.randint(-15, 15)))
                 ]
 
                 platform_data = {
@@ -177,7 +209,7 @@ class EndlessLevelGenerator:
                     "color": platform_color
                 }
                 # 15% chance to be bouncy, 10% chance to be unstable
-                roll = random.random()
+                roll = self.rng.random()
                 if roll < 0.15:
                     platform_data["bouncy"] = True
                     platform_data["color"] = [200, 80, 150]  # Pink for bouncy
@@ -187,17 +219,17 @@ class EndlessLevelGenerator:
                 platforms.append(platform_data)
 
         # Add some extra floating platforms
-        extra_platforms = random.randint(1, 3)
+        extra_platforms = self.rng.randint(1, 3)
         for _ in range(extra_platforms):
             extra_platform = {
-                "x": random.randint(100, self.screen_width - 150),
-                "y": random.randint(150, 400),
-                "width": random.randint(60, 100),
+                "x": self.rng.randint(100, self.screen_width - 150),
+                "y": self.rng.randint(150, 400),
+                "width": self.rng.randint(60, 100),
                 "height": 20,
                 "color": [max(0, c + 20) for c in main_color]
             }
             # 25% chance for floating platforms to be bouncy, 15% unstable
-            roll = random.random()
+            roll = self.rng.random()
             if roll < 0.25:
                 extra_platform["bouncy"] = True
                 extra_platform["color"] = [200, 80, 150]  # Pink for bouncy
@@ -232,11 +264,11 @@ class EndlessLevelGenerator:
             if not valid_platforms:
                 break
 
-            platform = random.choice(valid_platforms)
-            monster_type = random.choice(available_types)
+            platform = self.rng.choice(valid_platforms)
+            monster_type = self.rng.choice(available_types)
 
             # Position monster on platform
-            x = platform["x"] + random.randint(10, max(10, platform["width"] - 50))
+            x = platform["x"] + self.rng.randint(10, max(10, platform["width"] - 50))
             y = platform["y"] - 45
 
             # Scale stats with difficulty
@@ -245,7 +277,7 @@ class EndlessLevelGenerator:
 
             speed = base_speed + int(self.difficulty * 0.3)
             health = base_health + int(self.difficulty * 0.4)
-            patrol_range = random.randint(40, min(120, platform["width"] - 20))
+            patrol_range = self.rng.randint(40, min(120, platform["width"] - 20))
 
             monster = {
                 "type": monster_type,
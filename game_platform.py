@@ -1,10 +1,16 @@
 import pygame
 import math
-import random
+from rng import default_streams
 
 
 class Platform:
-    def __init__(self, x, y, width, height, color, bouncy=False, unstable=False):
+    __slots__ = ('x', 'y', 'width', 'height', 'rect', 'color', 'bouncy', 'bounce_power', 'anim',
+                 'unstable', 'stand_timer', 'crumble_time', 'crumbled', 'respawn_timer',
+                 'respawn_time', 'shake_offset', 'rng')
+
+    frame_attrs = ('rect', 'anim', 'stand_timer', 'crumbled', 'respawn_timer', 'shake_offset')
+
+    def __init__(self, x, y, width, height, color, bouncy=False, unstable=False, rng=None):
         self.x = x
         self.y = y
         self.width = width
@@ -22,9 +28,11 @@ class Platform:
         self.respawn_timer = 0
         self.respawn_time = 300  # 5 seconds to respawn
         self.shake_offset = 0
+        self.rng = rng or default_streams
 
     def update(self, player_rect=None):
-        """Update platform animation"""
+        """Update platform animation. Returns True if the platform crumbled or
+        respawned this tick (its rect changed)"""
         if self.bouncy:
             self.anim += 0.15
 
@@ -38,6 +46,7 @@ class Platform:
                     self.respawn_timer = 0
                     self.stand_timer = 0
                     self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+                    return True
             else:
                 # Check if player is standing on this platform
                 if player_rect:
@@ -52,11 +61,12 @@ class Platform:
                         self.stand_timer += 1
                         # Shake more as it gets closer to crumbling
                         shake_intensity = (self.stand_timer / self.crumble_time) * 4
-                        self.shake_offset = random.uniform(-shake_intensity, shake_intensity)
+                        self.shake_offset = self.rng.cosmetic.uniform(-shake_intensity, shake_intensity)
 
                         if self.stand_timer >= self.crumble_time:
                             self.crumbled = True
                             self.rect = pygame.Rect(0, 0, 0, 0)  # Make it non-solid
+                            return True
                     else:
                         # Slowly recover if player steps off
                         if self.stand_timer > 0:
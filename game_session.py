@@ -0,0 +1,799 @@
+import pygame
+import json
+import time
+from heapq import heapify, heappop, heappush
+
+from player import Player
+from spore import Spore
+from portal import Portal
+from shop_item import ShopItem
+from shop_ant import ShopAnt
+from game_platform import Platform
+from monsters import create_monster
+from endless_mode import EndlessLevelGenerator
+from rng import RandomStreams
+from projectiles import ProjectileStore
+from snapshot import Snapshot, capture_state
+from spatial import PlatformGrid, TargetIndex, overlapping_pairs
+from contacts import Contacts, PLAYER, MONSTER, BULLET, SPORE, PORTAL, SHOP_ITEM, SHOPKEEPER
+
+SCREEN_WIDTH = 1200
+SCREEN_HEIGHT = 800
+
+# Simulation rate - every speed and timer in the game counts ticks at this rate
+TICKS_PER_SECOND = 60
+SIM_DT = 1.0 / TICKS_PER_SECOND
+MAX_CATCHUP_STEPS = 5  # Drop time instead of spiralling when a frame takes far too long
+
+IMPACT_TICKS = 10  # How long bullet impacts on platforms stay in session.impacts
+
+# Level files - level 5 is a shop
+LEVELS = ['map.json', 'level2.json', 'level3.json', 'level4.json',
+          'level5_shop.json', 'level6.json', 'level7.json']
+
+# Tutorial levels
+TUTORIAL_LEVELS = [
+    'tutorial_levels/tutorial1.json', 'tutorial_levels/tutorial2.json',
+    'tutorial_levels/tutorial3.json', 'tutorial_levels/tutorial4.json',
+    'tutorial_levels/tutorial5.json', 'tutorial_levels/tutorial6.json',
+    'tutorial_levels/tutorial7.json', 'tutorial_levels/tutorial8.json',
+    'tutorial_levels/tutorial9.json', 'tutorial_levels/tutorial10.json',
+    'tutorial_levels/tutorial11.json', 'tutorial_levels/tutorial12.json'
+]
+
+# Items offered by story/tutorial shop levels
+SHOP_CATALOGUE = [
+    {"name": "Life Bundle", "type": "life_bundle", "cost": 12, "description": "+3 Lives"},
+    {"name": "Rapid Fire", "type": "weapon_rapid", "cost": 10, "description": "Faster shooting"},
+    {"name": "Spread Shot", "type": "weapon_spread", "cost": 10, "description": "3-way shot"},
+    {"name": "Missile", "type": "weapon_missile", "cost": 12, "description": "Homing missiles"},
+    {"name": "Damage Boost", "type": "damage_boost", "cost": 8, "description": "2x bullet damage"},
+    {"name": "Speed Boost", "type": "speed_boost", "cost": 8, "description": "Move 50% faster"},
+    {"name": "Magnet", "type": "magnet", "cost": 6, "description": "Attract spores"},
+    {"name": "Lock-On", "type": "missile_lock", "cost": 6, "description": "Missiles lock on"},
+]
+
+# Power-up flags carried from one level to the next
+POWERUP_FLAGS = ['has_rapid', 'has_spread', 'has_missile', 'damage_boost', 'speed_boost',
+                 'has_magnet', 'has_pierce', 'has_shield', 'extra_jump', 'missile_lock']
+
+
+def load_map(filename):
+    with open(filename, 'r') as f:
+        return json.load(f)
+
+
+class GameState:
+    """Progress that persists across levels of one play-through"""
+    frame_attrs = ('current_level', 'total_score', 'lives', 'spore_count')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.current_level = 0
+        self.total_score = 0
+        self.lives = 3
+        self.spore_count = 0
+        self.has_rapid = False
+        self.has_spread = False
+        self.has_missile = False
+        self.damage_boost = False
+        self.speed_boost = False
+        self.has_magnet = False
+        self.has_pierce = False
+        self.has_shield = False
+        self.extra_jump = False
+        self.missile_lock = False
+
+
+class PreparedLevel:
+    """Objects of a level that has been built but not entered yet"""
+    def __init__(self, key, map_data, level_rng, portal, is_shop, shop_items):
+        self.key = key
+        self.map_data = map_data
+        self.level_rng = level_rng
+        self.portal = portal
+        self.is_shop = is_shop
+        self.shop_items = shop_items
+        self.platforms = []
+        self.platform_grid = None
+        self.nav = None
+        self.monsters = []
+        self.shop_ant = None
+
+
+class LevelBuild:
+    """A level being built step by step - a FrameScheduler task that can be
+    finished on the spot when the level is needed before it is done"""
+    def __init__(self, key, steps):
+        self.key = key
+        self.steps = steps
+        self.level = None
+        self.done = False
+
+    def __next__(self):
+        if self.done:
+            raise StopIteration
+        try:
+            return next(self.steps)
+        except StopIteration as finished:
+            self.level = finished.value
+            self.done = True
+            raise
+
+    def finish(self):
+        while not self.done:
+            next(self, None)
+        return self.level
+
+
+class FrameInput:
+    """Keyboard input for a single simulation tick.
+
+    held is the set of key codes that are down, pressed the key codes that went
+    down this tick (in order). Indexing works like pygame.key.get_pressed(), so
+    the object can be passed straight to Player.handle_input."""
+
+    # Keys the simulation reads as held state
+    HELD_KEYS = (pygame.K_a, pygame.K_d, pygame.K_1, pygame.K_2, pygame.K_3,
+                 pygame.K_4, pygame.K_RSHIFT)
+
+    def __init__(self, held=(), pressed=()):
+        self.held = frozenset(held)
+        self.pressed = tuple(pressed)
+
+    def __getitem__(self, key):
+        return key in self.held
+
+    @classmethod
+    def from_keyboard(cls, pressed=()):
+        """Build input from the live pygame keyboard state"""
+        keys = pygame.key.get_pressed()
+        return cls([key for key in cls.HELD_KEYS if keys[key]], pressed)
+
+
+class GameSession:
+    """Gameplay simulation for one play-through.
+
+    step() advances player, bullets, monsters, spores, portal and shop logic by
+    one tick. Nothing here touches the display, so a session can run under the
+    SDL dummy driver as fast as the CPU allows. Sounds go through sound_gen and
+    progress through save_manager when they are given; music is exposed as the
+    track name in self.music for the caller to play.
+
+    All randomness comes from RandomStreams seeded with seed, so the same seed
+    and the same inputs always give the same simulation."""
+
+    def __init__(self, mode="game", map_data=None, sound_gen=None, save_manager=None, seed=None,
+                 scheduler=None):
+        # mode is "game", "tutorial", "endless" or "test" (plays map_data once)
+        self.mode = mode
+        self.test_map = map_data
+        self.sound_gen = sound_gen
+        self.save_manager = save_manager
+        self.scheduler = scheduler  # FrameScheduler for deferred work - None does it right away
+        self.seed = seed if seed is not None else RandomStreams().seed
+        self.game_state = GameState()
+        self.endless_gen = EndlessLevelGenerator()
+        self.start()
+
+    def start(self):
+        """(Re)start the play-through from its first level"""
+        self.rng = RandomStreams(self.seed)
+        self.game_state.reset()
+        self.tick = 0
+        self.game_over = False
+        self.victory = False
+        self.respawn_timer = 0
+        self.endless_level = 0
+        self.tutorial_level = 0
+        self.music = 'main_theme'
+        self.endless_map = None  # (level number, map) - see _endless_map()
+        self.next_level = None  # LevelBuild of the upcoming level
+        self.transition_ms = 0.0  # How long the last level change took
+        self.transition_prebuilt = False
+        self.stats = {'separation_pairs': 0}  # Per-tick work counters (F3 overlay)
+
+        if self.mode == "endless":
+            self.endless_gen.reset(self.rng.level_gen)
+            self.endless_level = 1
+            self._enter_endless_level()
+        else:
+            self._enter_level_file()
+
+    @property
+    def is_endless_mode(self):
+        return self.mode == "endless"
+
+    @property
+    def is_tutorial_mode(self):
+        return self.mode == "tutorial"
+
+    def moving_entities(self):
+        """Entities whose position changes from tick to tick"""
+        entities = [self.player]
+        entities.extend(self.monsters)
+        entities.append(self.bullets)
+        if self.spore and not self.spore.collected:
+            entities.append(self.spore)
+        return entities
+
+    # Shared services - never rolled back
+    SNAPSHOT_SKIP = ('sound_gen', 'save_manager', 'scheduler')
+
+    def snapshot(self):
+        """Capture the complete mutable state; restore() jumps back to it"""
+        objects = [self.player, self.portal, self.game_state, self.endless_gen]
+        objects.extend(obj for obj in (self.spore, self.shop_ant) if obj is not None)
+        objects.extend(self.monsters)
+        objects.append(self.bullets)
+        objects.extend(self.bullets.live_missiles())
+        # Plain platforms never change after the level is built
+        objects.extend(p for p in self.platforms if p.bouncy or p.unstable)
+        objects.extend(self.shop_items)
+        states = [(obj, capture_state(obj)) for obj in objects]
+        states.append((self, capture_state(self, self.SNAPSHOT_SKIP)))
+        rng_states = [(streams, streams.getstate()) for streams in (self.rng, self.level_rng)]
+        return Snapshot(states, rng_states)
+
+    def restore(self, snapshot):
+        # Keep the services the session was given, even if they changed since
+        services = {name: getattr(self, name) for name in self.SNAPSHOT_SKIP}
+        snapshot.restore()
+        self.__dict__.update(services)
+        # Unstable platforms may have crumbled or respawned in between
+        self.platform_grid.rebuild()
+        # A prebuilt level may have been played since - build it again
+        self.next_level = None
+        self._queue_next_level()
+
+    def _play(self, sound_name):
+        if self.sound_gen:
+            self.sound_gen.play(sound_name)
+
+    def _save_progress(self):
+        if not self.save_manager:
+            return
+        if self.scheduler:
+            # Only the newest data matters - replace a save that hasn't finished
+            self.scheduler.cancel('save')
+            self.scheduler.add(self.save_manager.save_steps(), 'save')
+        else:
+            self.save_manager.save()
+
+    # --- Level setup ---
+
+    def _level_key(self):
+        """(mode, level number) of the current level - seeds its random streams"""
+        if self.mode == "endless":
+            return ("endless", self.endless_level)
+        if self.mode == "tutorial":
+            return ("tutorial", self.tutorial_level)
+        return (self.mode, self.game_state.current_level)
+
+    def _endless_map(self, level_number):
+        """Generated map of an endless level. endless_gen has to produce the levels
+        strictly in order, so the newest one is kept for whichever build asks first."""
+        if self.endless_map is None or self.endless_map[0] != level_number:
+            self.endless_map = (level_number, self.endless_gen.generate_level())
+        return self.endless_map[1]
+
+    def _level_steps(self, key):
+        """Build the objects of level key, one piece per step. Returns a
+        PreparedLevel, or None when there is no such level file."""
+        mode, index = key
+        level_rng = self.rng.derive(*key)
+        if mode == "endless":
+            map_data = self._endless_map(index)
+            portal = Portal(SCREEN_WIDTH // 2 - 40, 10)
+            is_shop = map_data.get('is_shop', False)
+            shop_items = []
+            for item_data in map_data.get('shop_items', []) if is_shop else []:
+                shop_items.append(ShopItem(item_data['name'], item_data['type'], item_data['cost'],
+                                           item_data['description'], item_data['x'], item_data['y']))
+        else:
+            if mode == "test":
+                map_data = self.test_map
+            else:
+                level_list = TUTORIAL_LEVELS if mode == "tutorial" else LEVELS
+                if index >= len(level_list):
+                    return None
+                map_data = load_map(level_list[index])
+                yield
+            portal_pos = map_data.get('portal_position', {'x': SCREEN_WIDTH // 2 - 40, 'y': 10})
+            portal = Portal(portal_pos['x'], portal_pos['y'])
+            is_shop = map_data.get('is_shop', False)
+            shop_items = []
+            if is_shop:
+                # Pick 3 random items
+                selected = level_rng.level_gen.sample(SHOP_CATALOGUE, 3)
+                positions = [270, 570, 870]  # x positions for 3 items
+                for i, item_data in enumerate(selected):
+                    shop_items.append(ShopItem(item_data['name'], item_data['type'], item_data['cost'],
+                                               item_data['description'], positions[i], 550))
+        yield
+
+        level = PreparedLevel(key, map_data, level_rng, portal, is_shop, shop_items)
+        level.platforms = [Platform(p['x'], p['y'], p['width'], p['height'], p['color'],
+                                    p.get('bouncy', False), p.get('unstable', False), rng=level_rng)
+                           for p in map_data['platforms']]
+        level.platform_grid = PlatformGrid(level.platforms)
+        yield
+        level.nav = level.platform_grid.nav  # Built between frames rather than on the first tick
+        yield
+        for monster_data in map_data['monsters']:
+            monster = create_monster(monster_data, level_rng)
+            if monster is not None:
+                level.monsters.append(monster)
+            yield
+        level.shop_ant = ShopAnt(600, 680, rng=level_rng) if is_shop else None
+        return level
+
+    def _queue_next_level(self):
+        """Build the level after this one in spare frame time"""
+        if not self.scheduler or self.mode == "test":
+            return
+        mode, index = self._level_key()
+        self.next_level = LevelBuild((mode, index + 1), self._level_steps((mode, index + 1)))
+        self.scheduler.cancel('prepare_level')
+        self.scheduler.add(self.next_level, 'prepare_level')
+
+    def _build_level(self):
+        """The current level key's objects - prebuilt if ready, finished or built now otherwise"""
+        key = self._level_key()
+        build, self.next_level = self.next_level, None
+        if self.scheduler:
+            self.scheduler.cancel('prepare_level')
+        self.transition_prebuilt = build is not None and build.key == key and build.done
+        if build is None or build.key != key:
+            build = LevelBuild(key, self._level_steps(key))
+        return build.finish()
+
+    def _enter_level(self, level):
+        """Make a built level current, with a fresh player at its spawn point"""
+        map_data = level.map_data
+        self.map_data = map_data
+        self.level_rng = level.level_rng
+        self.player = Player(map_data['player_spawn']['x'], map_data['player_spawn']['y'])
+        self.platforms = level.platforms
+        self.platform_grid = level.platform_grid
+        self.nav = level.nav  # Where the player can get to, for bots and tools
+        self.monsters = level.monsters
+        self.bullets = ProjectileStore()
+        self.impacts = []  # (x, y, tick) of recent bullet hits on platforms
+        self.portal = level.portal
+        self.spore = None
+        self.bg_color = tuple(map_data['background_color'])
+        self.has_spore = False
+        self.spore_spawned = False
+        self.is_shop = level.is_shop
+        self.shop_items = level.shop_items
+        self.shop_ant = level.shop_ant
+        self.tutorial_prompt = map_data.get('tutorial_prompt', '') if self.mode == "tutorial" else ''
+        if level.is_shop:
+            level.portal.activate()  # Portal is always active in shop
+        self._queue_next_level()
+
+    def _enter_level_file(self, player_state=None):
+        """Enter the current story, tutorial or test level. Returns False when there are no more levels."""
+        level = self._build_level()
+        if level is None:
+            return False
+        self._enter_level(level)
+
+        # Preserve weapon unlocks and power-ups from previous levels
+        if player_state:
+            for flag in POWERUP_FLAGS:
+                setattr(self.player, flag, player_state.get(flag, False))
+            self.player.weapon = player_state.get('weapon', 'normal')
+        else:
+            for flag in POWERUP_FLAGS:
+                setattr(self.player, flag, getattr(self.game_state, flag))
+
+        # For tutorial levels with no enemies, pre-activate portal
+        if self.mode == "tutorial" and len(self.monsters) == 0 and not self.is_shop:
+            self.portal.activate()
+        return True
+
+    def _enter_endless_level(self, player_state=None):
+        self._enter_level(self._build_level())
+        if player_state:
+            self.player.has_rapid = player_state['has_rapid']
+            self.player.has_spread = player_state['has_spread']
+            self.player.weapon = player_state['weapon']
+
+    # --- Simulation ---
+
+    def step(self, inputs):
+        """Advance the simulation by one tick using a FrameInput"""
+        if self.game_over or self.victory:
+            return
+        self.tick += 1
+
+        if self.respawn_timer <= 0:
+            for key in inputs.pressed:
+                self._handle_key(key)
+
+        # Handle respawn timer
+        if self.respawn_timer > 0:
+            self.respawn_timer -= 1
+            if self.respawn_timer == 0:
+                self.player.health = self.player.max_health
+        else:
+            self._update_play(inputs)
+
+        player_rect = self.player.get_rect()
+        moved = False
+        for platform in self.platforms:
+            if platform.update(player_rect):
+                moved = True
+        if moved:
+            self.platform_grid.rebuild()
+            # Don't leave the player inside a platform that respawned on them
+            self.player.resolve_pushed_collision(self.platform_grid)
+
+    def _handle_key(self, key):
+        player = self.player
+        if key == pygame.K_SPACE or key == pygame.K_w:
+            player.jump(self.sound_gen)
+        # Shoot with Right Shift
+        if key == pygame.K_RSHIFT:
+            player.shoot(self.bullets, self.sound_gen)
+        # Shop purchase
+        if key == pygame.K_e and self.is_shop:
+            for item in self.shop_items:
+                if item.hover and not item.purchased:
+                    self._buy(item)
+        # Cycle shop ant dialogue with Enter
+        if key == pygame.K_RETURN and self.is_shop and self.shop_ant:
+            self.shop_ant.cycle_dialogue()
+
+    def _buy(self, item):
+        game_state = self.game_state
+        player = self.player
+        if game_state.spore_count < item.cost:
+            self._play("shop_error")
+            return
+
+        game_state.spore_count -= item.cost
+        item.purchased = True
+        self._play("shop_buy")
+
+        if item.item_type == 'life':
+            game_state.lives += 1
+            self._play("extra_life")
+        elif item.item_type == 'life_bundle':
+            game_state.lives += 3
+            self._play("extra_life")
+        elif item.item_type == 'weapon_rapid':
+            game_state.has_rapid = True
+            player.has_rapid = True
+        elif item.item_type == 'weapon_spread':
+            game_state.has_spread = True
+            player.has_spread = True
+        elif item.item_type == 'weapon_missile':
+            player.has_missile = True
+        elif item.item_type == 'damage_boost':
+            player.damage_boost = True
+        elif item.item_type == 'speed_boost':
+            player.speed_boost = True
+        elif item.item_type == 'magnet':
+            player.has_magnet = True
+        elif item.item_type == 'pierce':
+            player.has_pierce = True
+        elif item.item_type == 'shield':
+            player.has_shield = True
+        elif item.item_type == 'extra_jump':
+            player.extra_jump = True
+        elif item.item_type == 'missile_lock':
+            player.missile_lock = True
+
+    def _update_play(self, inputs):
+        player = self.player
+        player.handle_input(inputs)
+
+        # Handle continuous shooting when key is held (needed for rapid fire)
+        if inputs[pygame.K_RSHIFT]:
+            player.shoot(self.bullets, self.sound_gen)
+
+        player.update(self.platform_grid)
+
+        # Keep player in bounds
+        if player.x < 0:
+            player.x = 0
+        if player.x > SCREEN_WIDTH - player.width:
+            player.x = SCREEN_WIDTH - player.width
+        if player.y > SCREEN_HEIGHT:
+            player.health = 0
+
+        stopped = self._update_bullets()
+        # Bullets hit monsters where they stand before moving this tick
+        self._hit_monsters(self._find_bullet_contacts(), stopped)
+
+        # Update monsters (not in shop)
+        if not self.is_shop:
+            self._update_monsters()
+
+        self._update_spore()
+        if self.is_shop and self.shop_ant:
+            self.shop_ant.update()
+        self.portal.update()
+
+        # Everything has moved - find this tick's other contacts in one pass
+        contacts = self._find_contacts()
+        if not self.is_shop:
+            self._touch_monsters(contacts)
+        self._collect_spore(contacts)
+        if self.is_shop:
+            self._touch_shop(contacts)
+
+        # Check if all enemies defeated - spawn spore (not in shop)
+        if not self.is_shop and len(self.monsters) == 0 and not self.spore_spawned:
+            # Use custom spore position if available
+            spore_pos = self.map_data.get('spore_position', {})
+            self.spore = Spore(spore_pos.get('x', SCREEN_WIDTH // 2), spore_pos.get('y', SCREEN_HEIGHT // 2))
+            self.spore_spawned = True
+            self._play("spore_spawn")
+
+        # Switch to intense music when health is low (not in shop)
+        if not self.is_shop:
+            if player.health <= 30 and self.music != 'intense_theme':
+                self.music = 'intense_theme'
+            elif player.health > 30 and self.music == 'intense_theme':
+                self.music = 'main_theme'
+
+        # Check if player enters active portal
+        if self.portal.active and contacts.between(PLAYER, PORTAL):
+            self._enter_portal()
+
+        self._check_player_death()
+
+    def _update_bullets(self):
+        """Move the bullets. Returns the rows of the ones that hit a platform
+        this tick - they still hit monsters at the impact point before they go."""
+        bullets = self.bullets
+        if self.impacts:
+            self.impacts = [impact for impact in self.impacts if self.tick - impact[2] < IMPACT_TICKS]
+        if not bullets:
+            return []
+        # Missiles need monsters for homing
+        homing = TargetIndex(self.monsters) if bullets.has_missiles() else None
+        # Stops each bullet at the first platform on the way, however fast it is
+        bullets.update(self.platform_grid, homing)
+        bullets.cull(SCREEN_WIDTH, SCREEN_HEIGHT)
+        return bullets.stopped_rows()
+
+    def _find_bullet_contacts(self):
+        """Contacts between the bullets, just moved, and the monsters"""
+        contacts = Contacts()
+        contacts.add_many(self.bullets, BULLET, MONSTER)
+        for monster in self.monsters:
+            contacts.add(monster, MONSTER)
+        return contacts.find()
+
+    def _find_contacts(self):
+        """Put this tick's other bodies on their collision layers and find
+        every contact between them in a single broadphase pass"""
+        contacts = Contacts()
+        contacts.add(self.player, PLAYER, MONSTER | SPORE | PORTAL | SHOP_ITEM | SHOPKEEPER)
+        for monster in self.monsters:
+            contacts.add(monster, MONSTER)
+        if self.spore and not self.spore.collected:
+            contacts.add(self.spore, SPORE)
+        if self.is_shop:
+            for item in self.shop_items:
+                contacts.add(item, SHOP_ITEM)
+            if self.shop_ant:
+                contacts.add(self.shop_ant, SHOPKEEPER, rect=self.shop_ant.detection_rect())
+        contacts.add(self.portal, PORTAL)
+        return contacts.find()
+
+    def _hit_monsters(self, contacts, stopped):
+        player = self.player
+        bullets = self.bullets
+        monsters = self.monsters
+        spent = set()
+        killed = set()
+        for row, monster in contacts.between(BULLET, MONSTER):
+            if row in spent or id(monster) in killed:
+                continue
+            # An earlier hit may have changed the monster's rect (a scared Blob flattens)
+            if not bullets.get_rect(row).colliderect(monster.get_rect()):
+                continue
+            # Damage boost doubles damage
+            damage = 2 if player.damage_boost else 1
+            if monster.take_damage(damage):
+                monsters.remove(monster)
+                killed.add(id(monster))
+                self.game_state.total_score += 100
+                self._play("enemy_death")
+            else:
+                self._play("enemy_hit")
+            # Pierce bullets go through enemies
+            if not player.has_pierce:
+                spent.add(row)
+
+        # Even pierce bullets stop at platforms
+        for row in stopped:
+            if row not in spent:
+                spent.add(row)
+                x, y = bullets.center(row)
+                self.impacts.append((float(x), float(y), self.tick))
+        if spent:
+            bullets.remove(list(spent))
+
+    def _update_monsters(self):
+        player = self.player
+        monsters = self.monsters
+        for monster in monsters[:]:
+            monster.update(self.platform_grid, player)
+
+        self._separate_monsters()
+
+        for monster in monsters[:]:
+            # Remove monsters that fall off the map
+            if monster.y > SCREEN_HEIGHT:
+                monsters.remove(monster)
+                self.game_state.total_score += 50  # Partial points for fall death
+
+    def _touch_monsters(self, contacts):
+        player = self.player
+        for _, monster in contacts.between(PLAYER, MONSTER):
+            # Only the first monster touching the player hurts (once per frame)
+            # Shield reduces damage to half (rounded up)
+            damage = 1 if not player.has_shield else 0.5
+            player.health -= damage
+            self._play("player_hit")
+            # Knockback
+            if player.x < monster.x:
+                player.x -= 20
+            else:
+                player.x += 20
+            # Resolve any collisions from knockback (don't push into walls)
+            player.resolve_pushed_collision(self.platform_grid)
+            break
+
+    def _separate_monsters(self):
+        """Push overlapping monsters apart. Pairs are handled in the same order
+        as a loop over every pair (i, j), i < j, but only pairs whose rects
+        overlap get there: sweep and prune finds them, and a pushed monster is
+        checked again against the pairs still to come."""
+        monsters = self.monsters
+        rects = [monster.get_rect() for monster in monsters]
+        pending = overlapping_pairs(rects)
+        heapify(pending)
+        queued = set(pending)
+        checked = 0
+        while pending:
+            pair = heappop(pending)
+            checked += 1
+            if not monsters[pair[0]].separate_from(monsters[pair[1]]):
+                continue
+            for moved in pair:
+                rect = rects[moved] = monsters[moved].get_rect()
+                for other, other_rect in enumerate(rects):
+                    later = (moved, other) if moved < other else (other, moved)
+                    if later > pair and later not in queued and other != moved and rect.colliderect(other_rect):
+                        queued.add(later)
+                        heappush(pending, later)
+        self.stats['separation_pairs'] = checked
+
+    def _update_spore(self):
+        player = self.player
+        spore = self.spore
+        if not spore or spore.collected:
+            return
+        spore.update()
+        # Magnet effect - attract spore to player
+        if player.has_magnet:
+            dx = player.x + player.width / 2 - spore.x
+            dy = player.y + player.height / 2 - spore.y
+            dist = (dx * dx + dy * dy) ** 0.5
+            if dist < 300 and dist > 0:  # Attraction range
+                attract_speed = 5
+                spore.x += (dx / dist) * attract_speed
+                spore.y += (dy / dist) * attract_speed
+
+    def _collect_spore(self, contacts):
+        for _, spore in contacts.between(PLAYER, SPORE):
+            spore.collected = True
+            self.has_spore = True
+            # Spore reward scales with level (level 1 = 1 spore, etc.)
+            self.game_state.spore_count += self.game_state.current_level + 1
+            self.portal.activate()
+            self._play("spore_collect")
+
+    def _touch_shop(self, contacts):
+        touching = {id(item) for _, item in contacts.between(PLAYER, SHOP_ITEM)}
+        for item in self.shop_items:
+            item.hover = id(item) in touching
+        if self.shop_ant:
+            gift = self.shop_ant.set_player_near(bool(contacts.between(PLAYER, SHOPKEEPER)))
+            if gift > 0:
+                self.game_state.spore_count += gift
+                self._play("spore_collect")
+
+    def _enter_portal(self):
+        player = self.player
+        game_state = self.game_state
+        started = time.perf_counter()
+        self._play("level_complete")
+
+        # Save weapon state and power-ups
+        player_state = {flag: getattr(player, flag) for flag in POWERUP_FLAGS}
+        player_state['weapon'] = player.weapon
+        for flag in POWERUP_FLAGS:
+            setattr(game_state, flag, player_state[flag])
+
+        if self.mode == "test":
+            # Test play ends at the first portal
+            self.victory = True
+            self.music = 'victory_theme'
+        elif self.mode == "endless":
+            self.endless_level += 1
+            # Spores scale with endless level (not for shop levels)
+            if not self.is_shop:
+                game_state.spore_count += self.endless_level
+            # No automatic life bonus - lives only from shop
+
+            self._enter_endless_level(player_state)
+            self.music = 'shop_theme' if self.is_shop else 'main_theme'
+
+            if self.save_manager:
+                self.save_manager.update_endless_stats(self.endless_level, game_state.total_score)
+                self._save_progress()
+        elif self.mode == "tutorial":
+            self.tutorial_level += 1
+            if not self._enter_level_file(player_state):
+                # Tutorial complete
+                self.victory = True
+                self.music = 'victory_theme'
+            elif self.is_shop:
+                game_state.spore_count = max(game_state.spore_count, 5)
+        else:
+            game_state.current_level += 1
+            if not self._enter_level_file(player_state):
+                self.victory = True
+                self.music = 'victory_theme'
+                # Save progress - game beaten!
+                if self.save_manager:
+                    self.save_manager.mark_game_beaten()
+                    self.save_manager.update_statistics(score=game_state.total_score,
+                                                        spores=game_state.spore_count)
+                    self._save_progress()
+            elif self.is_shop:
+                self.music = 'shop_theme'
+            else:
+                self.music = 'main_theme'
+
+        self.transition_ms = (time.perf_counter() - started) * 1000
+
+    def _check_player_death(self):
+        player = self.player
+        game_state = self.game_state
+        if player.health > 0 or self.respawn_timer > 0:
+            return
+        game_state.lives -= 1
+        self._play("player_death")
+
+        if game_state.lives <= 0:
+            self.game_over = True
+            self._play("game_over")
+            self.music = None
+            return
+
+        # Respawn at level start
+        self.respawn_timer = 120  # 2 seconds
+        if self.mode == "endless":
+            # Use default spawn point for endless mode
+            player.x = 100
+            player.y = 650
+        else:
+            player.x = self.map_data['player_spawn']['x']
+            player.y = self.map_data['player_spawn']['y']
+        player.vel_x = 0
+        player.vel_y = 0
+        # Reset monster aggro so they don't immediately attack the fresh player
+        for monster in self.monsters:
+            monster.reset_aggro()
@@ -0,0 +1,60 @@
+class Interpolator:
+    """Blends entity positions between the previous and current simulation tick.
+
+    capture() is called right before each step() and remembers the positions
+    the entities had. While rendering, blend(entities, alpha) moves every
+    entity to prev + (current - prev) * alpha and restore() puts the real
+    simulation values back afterwards, so drawing code needs no changes.
+
+    Entities list the attributes to blend in interp_attrs (default x and y).
+    Containers of many moving things (projectiles.ProjectileStore) blend
+    themselves instead, with capture_positions(), blend_positions(alpha) and
+    restore_positions().
+    """
+
+    # Jumps larger than this are teleports (respawn, level change) - don't smear them
+    max_jump = 100
+
+    def __init__(self):
+        self.previous = {}
+        self._blended = []
+
+    def capture(self, entities):
+        self.previous = {}
+        for entity in entities:
+            if hasattr(entity, 'capture_positions'):
+                entity.capture_positions()
+                self.previous[id(entity)] = (entity, None)
+                continue
+            attrs = getattr(entity, 'interp_attrs', ('x', 'y'))
+            self.previous[id(entity)] = (entity, [getattr(entity, attr) for attr in attrs])
+
+    def clear(self):
+        self.previous = {}
+
+    def blend(self, entities, alpha):
+        self._blended = []
+        for entity in entities:
+            stored = self.previous.get(id(entity))
+            if stored is None or stored[0] is not entity:
+                continue  # Spawned this tick - draw where it is
+            if stored[1] is None:
+                entity.blend_positions(alpha)
+                self._blended.append((entity, None, None))
+                continue
+            attrs = getattr(entity, 'interp_attrs', ('x', 'y'))
+            current = [getattr(entity, attr) for attr in attrs]
+            if abs(current[0] - stored[1][0]) + abs(current[1] - stored[1][1]) > self.max_jump:
+                continue
+            for attr, old, new in zip(attrs, stored[1], current):
+                setattr(entity, attr, old + (new - old) * alpha)
+            self._blended.append((entity, attrs, current))
+
+    def restore(self):
+        for entity, attrs, values in self._blended:
+            if attrs is None:
+                entity.restore_positions()
+                continue
+            for attr, value in zip(attrs, values):
+                setattr(entity, attr, value)
+        self._blended = []
@@ -9,6 +9,14 @@ class MainMenu:
         self.screen_width = screen.get_width()
         self.screen_height = screen.get_height()
 
+        # Fonts and fixed text are made once, not every frame
+        self.option_font = pygame.font.Font(None, 48)
+        self.stats_font = pygame.font.Font(None, 24)
+        self.title = pygame.font.Font(None, 72).render("ANTS VS SPORES", True, (100, 200, 255))
+        self.badge = pygame.font.Font(None, 36).render("~ THE SHOP UPDATE ~", True, (255, 215, 0))
+        self.hint = pygame.font.Font(None, 28).render("UP/DOWN: Select | ENTER: Confirm | ESC: Quit",
+                                                      True, (120, 120, 140))
+
     def get_options(self):
         """Get menu options with unlock status"""
         game_beaten = self.save_manager.is_game_beaten()
@@ -55,20 +63,16 @@ class MainMenu:
             pygame.draw.circle(self.screen, (50, 60, 80), (x, y), size)
 
         # Title
-        title_font = pygame.font.Font(None, 72)
-        title = title_font.render("ANTS VS SPORES", True, (100, 200, 255))
-        title_rect = title.get_rect(center=(self.screen_width // 2, 120))
-        self.screen.blit(title, title_rect)
+        title_rect = self.title.get_rect(center=(self.screen_width // 2, 120))
+        self.screen.blit(self.title, title_rect)
 
         # Subtitle - The Shop Update
-        subtitle_font = pygame.font.Font(None, 36)
-        badge = subtitle_font.render("~ THE SHOP UPDATE ~", True, (255, 215, 0))
-        badge_rect = badge.get_rect(center=(self.screen_width // 2, 170))
-        self.screen.blit(badge, badge_rect)
+        badge_rect = self.badge.get_rect(center=(self.screen_width // 2, 170))
+        self.screen.blit(self.badge, badge_rect)
 
         # Menu options
         options = self.get_options()
-        option_font = pygame.font.Font(None, 48)
+        option_font = self.option_font
         start_y = 280
 
         for i, (text, unlocked) in enumerate(options):
@@ -97,15 +101,13 @@ class MainMenu:
                 pygame.draw.rect(self.screen, (100, 100, 150), box_rect, 2)
 
         # Controls hint
-        hint_font = pygame.font.Font(None, 28)
-        hint = hint_font.render("UP/DOWN: Select | ENTER: Confirm | ESC: Quit", True, (120, 120, 140))
-        hint_rect = hint.get_rect(center=(self.screen_width // 2, self.screen_height - 50))
-        self.screen.blit(hint, hint_rect)
+        hint_rect = self.hint.get_rect(center=(self.screen_width // 2, self.screen_height - 50))
+        self.screen.blit(self.hint, hint_rect)
 
         # Stats display if game beaten
         if self.save_manager.is_game_beaten():
             stats = self.save_manager.data.get("statistics", {})
-            stats_font = pygame.font.Font(None, 24)
+            stats_font = self.stats_font
 
             best_score = stats.get("best_score", 0)
             endless_best = self.save_manager.data.get("endless_mode", {}).get("highest_level_reached", 0)
@@ -127,6 +129,13 @@ class PauseMenu:
         self.screen_width = screen.get_width()
         self.screen_height = screen.get_height()
 
+        # Overlay, fonts and title are made once, not every frame
+        self.overlay = pygame.Surface((self.screen_width, self.screen_height))
+        self.overlay.fill((0, 0, 0))
+        self.overlay.set_alpha(180)
+        self.option_font = pygame.font.Font(None, 42)
+        self.title = pygame.font.Font(None, 64).render("PAUSED", True, (255, 255, 255))
+
     def handle_event(self, event):
         """Handle input events, return selected option name or None"""
         if event.type == pygame.KEYDOWN:
@@ -145,19 +154,14 @@ class PauseMenu:
     def draw(self):
         """Draw pause menu overlay"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(180)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.overlay, (0, 0))
 
         # Title
-        title_font = pygame.font.Font(None, 64)
-        title = title_font.render("PAUSED", True, (255, 255, 255))
-        title_rect = title.get_rect(center=(self.screen_width // 2, 250))
-        self.screen.blit(title, title_rect)
+        title_rect = self.title.get_rect(center=(self.screen_width // 2, 250))
+        self.screen.blit(self.title, title_rect)
 
         # Options
-        option_font = pygame.font.Font(None, 42)
+        option_font = self.option_font
         for i, text in enumerate(self.options):
             if i == self.selected:
                 color = (255, 255, 100)
@@ -10,37 +10,37 @@ from .snake import Snake
 from .shriek import Shriek
 
 
-def create_monster(data):
+def create_monster(data, rng=None):
     monster_type = data.get('type', 'walker')
     if monster_type == 'walker':
         return Walker(data['x'], data['y'], data['patrol_range'],
-                     data['speed'], data['health'])
+                     data['speed'], data['health'], rng=rng)
     elif monster_type == 'flyer':
         return Flyer(data['x'], data['y'], data['patrol_range'],
-                    data['speed'], data['health'])
+                    data['speed'], data['health'], rng=rng)
     elif monster_type == 'spider':
         return Spider(data['x'], data['y'], data['patrol_range'],
-                     data['speed'], data['health'])
+                     data['speed'], data['health'], rng=rng)
     elif monster_type == 'blob':
         return Blob(data['x'], data['y'], data['patrol_range'],
-                   data['speed'], data['health'])
+                   data['speed'], data['health'], rng=rng)
     elif monster_type == 'taterbug':
         return Taterbug(data['x'], data['y'], data['patrol_range'],
-                        data['speed'], data['health'])
+                        data['speed'], data['health'], rng=rng)
     elif monster_type == 'razorback':
         return Razorback(data['x'], data['y'], data['patrol_range'],
-                         data['speed'], data['health'])
+                         data['speed'], data['health'], rng=rng)
     elif monster_type == 'chompy':
         return Chompy(data['x'], data['y'], data['patrol_range'],
-                     data['speed'], data['health'])
+                     data['speed'], data['health'], rng=rng)
     elif monster_type == 'snake':
         return Snake(data['x'], data['y'], data['patrol_range'],
                     data['speed'], data['health'],
-                    data.get('aggro_duration', 180))
+                    data.get('aggro_duration', 180), rng=rng)
     elif monster_type == 'shriek':
         return Shriek(data['x'], data['y'], data['patrol_range'],
                      data['speed'], data['health'],
-                     data.get('aggro_duration', 180))
+                     data.get('aggro_duration', 180), rng=rng)
     return None
 
 
@@ -1,8 +1,15 @@
 import pygame
+from collision import Hitbox
+from rng import default_streams
 
 
-class Monster:
-    def __init__(self, x, y, patrol_range, speed, health):
+class Monster(Hitbox):
+    __slots__ = ('spawn_x', 'spawn_y', 'x', 'y', 'width', 'height', 'patrol_range', 'speed',
+                 'health', 'direction', 'vel_y', 'gravity', 'rng')
+
+    frame_attrs = ('x', 'y', 'health')
+
+    def __init__(self, x, y, patrol_range, speed, health, rng=None):
         self.spawn_x = x
         self.spawn_y = y
         self.x = x
@@ -15,9 +22,7 @@ class Monster:
         self.direction = 1
         self.vel_y = 0
         self.gravity = 0.8
-
-    def get_rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        self.rng = rng or default_streams  # RandomStreams for AI and cosmetic randomness
 
     def take_damage(self, damage):
         self.health -= damage
@@ -46,10 +51,8 @@ class Monster:
         check_y = self.y + self.height + 5  # Just below the monster's feet
 
         # First, check for immediate ground ahead
-        check_rect = pygame.Rect(check_x, check_y, 5, 10)
-        for platform in platforms:
-            if check_rect.colliderect(platform.rect):
-                return True  # Ground immediately ahead, safe to proceed
+        if platforms.terrain.solid_in(check_x, check_y, 5, 10):
+            return True  # Ground immediately ahead, safe to proceed
 
         # No immediate ground - check if there's any platform below to land on
         # Scan downward from the edge to see if there's a safe landing
@@ -61,24 +64,25 @@ class Monster:
         if max_fall is None:
             max_fall = screen_height  # Check all the way to screen bottom
 
-        # Create a vertical scan line from current position down
-        scan_width = self.width  # Use monster's width for the scan
-        scan_x = x - scan_width // 2  # Center the scan on x position
+        # Scan a column as wide as the monster, centred on x
+        scan_width = self.width
+        scan_x = x - scan_width // 2
 
-        # Check in vertical increments
-        for check_y in range(int(start_y), int(start_y + max_fall), 20):
-            # If we've gone past screen bottom, no safe landing
-            if check_y > screen_height - 50:  # Leave some margin
-                return False
-
-            scan_rect = pygame.Rect(scan_x, check_y, scan_width, 20)
-            for platform in platforms:
-                if scan_rect.colliderect(platform.rect):
-                    # Found a platform to land on!
-                    return True
-
-        # Reached max fall distance without finding platform
-        return False
+        # 20px scan steps down to max_fall, stopping past the screen bottom
+        # (leaving some margin) - together one unbroken band of rows
+        steps = range(int(start_y), min(int(start_y + max_fall), screen_height - 49), 20)
+        if not steps:
+            return False
+        return platforms.terrain.solid_in(scan_x, steps.start, scan_width, len(steps) * 20)
+
+    def chase_direction(self, platforms, player):
+        """Direction to walk to get to the player: along the level's
+        navigation graph when that means walking or dropping onto another
+        platform, straight toward them otherwise"""
+        heading = platforms.nav.heading(self, player)
+        if heading:
+            return heading
+        return 1 if player.x > self.x else -1
 
     def is_safe_to_move(self, platforms, screen_height=800):
         """Comprehensive safety check before moving in current direction.
@@ -1,13 +1,37 @@
 import pygame
 import math
-import random
+import numpy as np
 from .base import Monster
 
 
 class Blob(Monster):
-    """Terrified gooey blob that moves by sloshing its mass forward."""
-    def __init__(self, x, y, patrol_range, speed, health, size=1.0):
-        super().__init__(x, y, patrol_range, speed, health)
+    """Terrified gooey blob that moves by sloshing its mass forward.
+
+    Slime trails go into a ring buffer of SLIME_CAPACITY rows (x, y, the
+    slime_clock tick they were dropped on), oldest first from slime_first.
+    A trail's age is worked out from slime_clock when it's drawn, and the
+    trails that dried up are dropped by moving slime_first past them, so
+    keeping the trails costs the same however many there are."""
+
+    __slots__ = ('color', 'size', 'max_health', 'split_spawned', 'base_radius', 'slosh_phase',
+                 'slosh_speed', 'slosh_distance', 'is_mid_slosh', 'back_mass', 'front_mass',
+                 'back_x', 'front_x', 'pool_y', 'neck_thickness', 'slime_trails', 'slime_first',
+                 'slime_count', 'slime_clock', 'slime_duration', 'slime_timer', 'wobble', 'drip_offset',
+                 'is_scared', 'fear_timer', 'fear_duration', 'detection_range', 'tremble',
+                 'eye_dart_timer', 'eye_dart_offset', 'spread_amount')
+
+    interp_attrs = ('x', 'y', 'back_x', 'front_x', 'pool_y')
+    frame_attrs = Monster.frame_attrs + ('direction', 'back_x', 'front_x', 'back_mass', 'front_mass', 'pool_y',
+                                         'spread_amount', 'is_scared', 'tremble', 'eye_dart_offset',
+                                         'slime_trails', 'slime_first', 'slime_count', 'slime_clock')
+
+    # A blob drops at most one trail every 7 updates while sloshing plus one
+    # per slosh, so fewer than this are left within slime_duration - if it
+    # ever fills up, a new trail replaces the oldest
+    SLIME_CAPACITY = 32
+
+    def __init__(self, x, y, patrol_range, speed, health, size=1.0, rng=None):
+        super().__init__(x, y, patrol_range, speed, health, rng)
         self.color = (70, 180, 70)
         self.size = size
         self.max_health = health
@@ -35,13 +59,16 @@ class Blob(Monster):
         self.neck_thickness = 0.0  # 0 to 1
 
         # Slime
-        self.slime_trails = []
+        self.slime_trails = np.zeros((self.SLIME_CAPACITY, 3))
+        self.slime_first = 0  # Row of the oldest trail
+        self.slime_count = 0
+        self.slime_clock = 0  # Updates so far - trails are stamped with it
         self.slime_duration = 180
         self.slime_timer = 0
 
         # Animation
         self.wobble = 0
-        self.drip_offset = random.random() * math.pi * 2
+        self.drip_offset = self.rng.cosmetic.random() * math.pi * 2
 
         # Fear system
         self.is_scared = False
@@ -55,8 +82,8 @@ class Blob(Monster):
         self.eye_dart_offset = 0
         self.spread_amount = 0.0  # Makes it wider/flatter when scared
 
-    def get_rect(self):
-        """Return collision rect - positioned to cover the visible blob"""
+    def rect_box(self):
+        """Return collision box - positioned to cover the visible blob"""
         # Center the rect on the blob's visual position
         rect_x = min(self.back_x, self.front_x) - self.base_radius
         rect_width = int(abs(self.front_x - self.back_x) + self.base_radius * 2)
@@ -67,7 +94,7 @@ class Blob(Monster):
             rect_height = int(self.base_radius * 2.8)
 
         rect_y = self.pool_y + self.base_radius * 1.5 - rect_height
-        return pygame.Rect(rect_x, rect_y, rect_width, rect_height)
+        return (rect_x, rect_y, rect_width, rect_height)
 
     def take_damage(self, damage):
         self.health -= damage
@@ -84,20 +111,13 @@ class Blob(Monster):
 
     def _has_platform_below(self, check_x, platforms, screen_height=800):
         """Check if there's ANY platform below this x position before screen bottom"""
-        for check_y in range(int(self.pool_y + 50), screen_height - 50, 20):
-            check_rect = pygame.Rect(check_x - 25, check_y, 50, 20)
-            for platform in platforms:
-                if check_rect.colliderect(platform.rect):
-                    return True
-        return False
+        # The 20px scan steps down the screen form one unbroken band of rows
+        steps = range(int(self.pool_y + 50), screen_height - 50, 20)
+        return bool(steps) and platforms.terrain.solid_in(check_x - 25, steps.start, 50, len(steps) * 20)
 
     def _has_ground_at(self, check_x, platforms):
         """Check if there's ground directly at this x position"""
-        ground_rect = pygame.Rect(check_x - 20, self.pool_y + self.base_radius + 5, 40, 20)
-        for platform in platforms:
-            if ground_rect.colliderect(platform.rect):
-                return True
-        return False
+        return platforms.terrain.solid_in(check_x - 20, self.pool_y + self.base_radius + 5, 40, 20)
 
     def _can_slosh_forward(self, platforms, screen_height=800):
         """Check if we can safely slosh in current direction - NEVER go off screen or edges"""
@@ -113,15 +133,13 @@ class Blob(Monster):
 
         # No ground at future position - don't go off the edge
         # Only allow if there's a platform very close below (within one slosh height)
-        close_below_rect = pygame.Rect(
+        if platforms.terrain.solid_in(
             future_x - 20,
             self.pool_y + self.base_radius + 5,
             40,
             self.slosh_distance + 20  # Only check a short distance below
-        )
-        for platform in platforms:
-            if close_below_rect.colliderect(platform.rect):
-                return True
+        ):
+            return True
 
         # No safe ground ahead - turn around
         return False
@@ -134,7 +152,7 @@ class Blob(Monster):
         if self.eye_dart_timer > 12:
             self.eye_dart_timer = 0
             if self.is_scared:
-                self.eye_dart_offset = random.uniform(-2, 2)
+                self.eye_dart_offset = self.rng.cosmetic.uniform(-2, 2)
 
         # Check for player proximity
         dist_to_player = math.sqrt((player.x - self.x) ** 2 + (player.y - self.y) ** 2)
@@ -179,7 +197,7 @@ class Blob(Monster):
             self.vel_y = 20
 
         # Update slime trails
-        self.slime_trails = [(sx, sy, t - 1) for sx, sy, t in self.slime_trails if t > 1]
+        self._age_slime()
 
         # === SLOSHING MOVEMENT ===
         slosh_speed = self.slosh_speed * (1.6 if self.is_scared else 1.0)
@@ -215,7 +233,7 @@ class Blob(Monster):
             # Drop slime from shrinking back pool
             self.slime_timer += 1
             if self.slime_timer > 6:
-                self.slime_trails.append((self.back_x, self.pool_y + self.base_radius * 1.5, self.slime_duration))
+                self._drop_slime()
                 self.slime_timer = 0
 
         elif self.slosh_phase < 1.0:
@@ -241,7 +259,7 @@ class Blob(Monster):
             self.is_mid_slosh = False
 
             # Drop slime at rest position
-            self.slime_trails.append((self.back_x, self.pool_y + self.base_radius * 1.5, self.slime_duration))
+            self._drop_slime()
 
             # Patrol bounds when not scared
             if not self.is_scared:
@@ -278,7 +296,7 @@ class Blob(Monster):
         # Platform collision
         feet_rect = pygame.Rect(self.back_x - self.base_radius, self.pool_y + self.base_radius,
                                 self.base_radius * 2, 10)
-        for platform in platforms:
+        for platform in platforms.query(feet_rect):
             if feet_rect.colliderect(platform.rect):
                 if self.vel_y > 0:
                     # Falling - land on top
@@ -291,9 +309,37 @@ class Blob(Monster):
 
         self.y = self.pool_y
 
+    def _age_slime(self):
+        """Count an update - the trails dropped slime_duration updates ago dry up"""
+        self.slime_clock += 1
+        oldest = self.slime_clock - self.slime_duration
+        while self.slime_count and self.slime_trails[self.slime_first, 2] <= oldest:
+            self.slime_first = (self.slime_first + 1) % self.SLIME_CAPACITY
+            self.slime_count -= 1
+
+    def _drop_slime(self):
+        """Add a slime trail under the back pool"""
+        if self.slime_count == self.SLIME_CAPACITY:
+            # Full - the oldest trail makes room
+            self.slime_first = (self.slime_first + 1) % self.SLIME_CAPACITY
+            self.slime_count -= 1
+        row = (self.slime_first + self.slime_count) % self.SLIME_CAPACITY
+        self.slime_trails[row] = (self.back_x, self.pool_y + self.base_radius * 1.5, self.slime_clock)
+        self.slime_count += 1
+
+    def live_slime(self):
+        """[(x, y, updates left)] of the slime trails, oldest first"""
+        end = self.slime_first + self.slime_count
+        trails = self.slime_trails[self.slime_first:end].tolist()
+        if end > self.SLIME_CAPACITY:
+            # The newest ones wrapped around to the start
+            trails += self.slime_trails[:end - self.SLIME_CAPACITY].tolist()
+        expires = self.slime_clock - self.slime_duration
+        return [(sx, sy, dropped - expires) for sx, sy, dropped in trails]
+
     def draw(self, screen):
         # Draw slime trails
-        for sx, sy, timer in self.slime_trails:
+        for sx, sy, timer in self.live_slime():
             alpha = int(100 * (timer / self.slime_duration))
             size = int(5 + 3 * (timer / self.slime_duration))
             surf = pygame.Surface((size * 2, size), pygame.SRCALPHA)
@@ -1,12 +1,18 @@
 import pygame
 import math
+from collision import push_out, sweep
 from .base import Monster
 
 
 class Chompy(Monster):
     """Charges at player when in line of sight"""
-    def __init__(self, x, y, patrol_range, speed, health):
-        super().__init__(x, y, patrol_range, speed, health)
+
+    __slots__ = ('color', 'is_charging', 'anim', 'charge_speed')
+
+    frame_attrs = Monster.frame_attrs + ('anim', 'is_charging')
+
+    def __init__(self, x, y, patrol_range, speed, health, rng=None):
+        super().__init__(x, y, patrol_range, speed, health, rng)
         self.color = (200, 50, 50)
         self.is_charging = False
         self.anim = 0
@@ -29,8 +35,7 @@ class Chompy(Monster):
 
         if y_diff < 50 and x_diff < 300:
             self.is_charging = True
-            wanted_direction = 1 if player.x > self.x else -1
-            self.direction = wanted_direction
+            self.direction = self.chase_direction(platforms, player)
             # Check if safe to charge toward player
             if on_ground and not self.has_ground_ahead(platforms):
                 # Edge ahead - don't charge off
@@ -49,38 +54,33 @@ class Chompy(Monster):
             elif self.x < self.spawn_x - self.patrol_range:
                 self.direction = 1
 
-        # Move horizontally
-        self.x += move_speed * self.direction
-
-        # Check horizontal collisions - stop at walls, don't climb or push through
-        monster_rect = self.get_rect()
-        for platform in platforms:
-            if monster_rect.colliderect(platform.rect):
-                # Check if this is a side collision (not landing on top)
-                if self.direction > 0 and monster_rect.right > platform.rect.left and monster_rect.left < platform.rect.left:
-                    # Hit left side of platform - push back
-                    self.x = platform.rect.left - self.width
-                    self.is_charging = False  # Stop charging when hitting wall
-                elif self.direction < 0 and monster_rect.left < platform.rect.right and monster_rect.right > platform.rect.right:
-                    # Hit right side of platform - push back
-                    self.x = platform.rect.right
-                    self.is_charging = False  # Stop charging when hitting wall
-
-        # Move vertically
-        self.y += self.vel_y
-
-        # Check vertical collisions
-        monster_rect = self.get_rect()
-        for platform in platforms:
-            if monster_rect.colliderect(platform.rect):
-                if self.vel_y > 0 and monster_rect.bottom > platform.rect.top and monster_rect.top < platform.rect.top:
-                    # Falling - land on top
-                    self.y = platform.rect.top - self.height
-                    self.vel_y = 0
-                elif self.vel_y < 0 and monster_rect.top < platform.rect.bottom and monster_rect.bottom > platform.rect.bottom:
-                    # Moving up - push down from platform bottom
-                    self.y = platform.rect.bottom
-                    self.vel_y = 0
+        # Move horizontally - stop at the first wall in the way, don't climb or push through
+        wall = sweep(self, platforms, move_speed * self.direction, 0)
+        if wall is not None:
+            # Only side hits push back (not being inside a platform already)
+            if self.direction > 0 and self.x < wall.rect.left:
+                # Hit left side of platform - push back
+                self.x = wall.rect.left - self.width
+                self.is_charging = False  # Stop charging when hitting wall
+            elif self.direction < 0 and self.x + self.width > wall.rect.right:
+                # Hit right side of platform - push back
+                self.x = wall.rect.right
+                self.is_charging = False  # Stop charging when hitting wall
+
+        # Pushed into a platform (by another monster, or it respawned) - get out first
+        push_out(self, platforms)
+
+        # Move vertically, stopping at the first floor or ceiling in the way
+        platform = sweep(self, platforms, 0, self.vel_y)
+        if platform is not None:
+            if self.vel_y > 0 and self.y < platform.rect.top:
+                # Falling - land on top
+                self.y = platform.rect.top - self.height
+                self.vel_y = 0
+            elif self.vel_y < 0 and self.y + self.height > platform.rect.bottom:
+                # Moving up - push down from platform bottom
+                self.y = platform.rect.bottom
+                self.vel_y = 0
 
     def draw(self, screen):
         # Round body
@@ -4,11 +4,17 @@ from .base import Monster
 
 
 class Flyer(Monster):
-    def __init__(self, x, y, patrol_range, speed, health):
-        super().__init__(x, y, patrol_range, speed, health)
+    __slots__ = ('color', 'float_offset', 'float_speed', 'actual_y')
+
+    interp_attrs = ('x', 'y', 'actual_y')
+    frame_attrs = Monster.frame_attrs + ('actual_y', 'float_offset')
+
+    def __init__(self, x, y, patrol_range, speed, health, rng=None):
+        super().__init__(x, y, patrol_range, speed, health, rng)
         self.color = (150, 50, 200)
         self.float_offset = 0
         self.float_speed = 0.1
+        self.actual_y = y
 
     def update(self, platforms, player):
         # Float up and down
@@ -27,12 +33,11 @@ class Flyer(Monster):
         # Store actual y for collision
         self.actual_y = self.y + float_y
 
-    def get_rect(self):
-        actual_y = getattr(self, 'actual_y', self.y)
-        return pygame.Rect(self.x, actual_y, self.width, self.height)
+    def rect_box(self):
+        return (self.x, self.actual_y, self.width, self.height)
 
     def draw(self, screen):
-        actual_y = getattr(self, 'actual_y', self.y)
+        actual_y = self.actual_y
         # Body (bat-like)
         pygame.draw.ellipse(screen, self.color,
                            (self.x, actual_y + 10, self.width, self.height - 15))
@@ -1,13 +1,22 @@
 import pygame
 import math
-import random
 from .base import Monster
 
 
 class Razorback(Monster):
     """Aggressive taterbug variant that charges at players with spikes"""
-    def __init__(self, x, y, patrol_range, speed, health):
-        super().__init__(x, y, patrol_range, speed, health)
+
+    __slots__ = ('color', 'stripe_color', 'spike_color', 'is_rolling', 'roll_angle', 'roll_speed',
+                 'aggro', 'aggro_range', 'target_x', 'attack_cooldown', 'attack_cooldown_min',
+                 'attack_cooldown_max', 'backing_off', 'backup_timer', 'backup_duration',
+                 'hit_player', 'defensive_roll', 'defensive_roll_timer', 'defensive_roll_duration',
+                 'spike_length', 'max_spike_length')
+
+    frame_attrs = Monster.frame_attrs + ('is_rolling', 'roll_angle', 'spike_length', 'aggro', 'target_x',
+                                         'backing_off')
+
+    def __init__(self, x, y, patrol_range, speed, health, rng=None):
+        super().__init__(x, y, patrol_range, speed, health, rng)
         self.width = 40
         self.height = 45
         self.color = (120, 40, 40)  # Dark red
@@ -118,7 +127,7 @@ class Razorback(Monster):
                 self.backing_off = False
                 self.is_rolling = False
                 # Set random cooldown before next attack
-                self.attack_cooldown = random.randint(self.attack_cooldown_min, self.attack_cooldown_max)
+                self.attack_cooldown = self.rng.ai.randint(self.attack_cooldown_min, self.attack_cooldown_max)
 
         elif self.is_rolling and self.defensive_roll:
             # Defensive roll - stay in place and count down timer
@@ -141,7 +150,7 @@ class Razorback(Monster):
             if on_ground and not self.has_ground_ahead(platforms):
                 # Stop at edge
                 self.is_rolling = False
-                self.attack_cooldown = random.randint(self.attack_cooldown_min, self.attack_cooldown_max)
+                self.attack_cooldown = self.rng.ai.randint(self.attack_cooldown_min, self.attack_cooldown_max)
             else:
                 self.x += self.roll_speed * roll_dir
                 self.roll_angle += self.roll_speed * roll_dir / 18
@@ -177,7 +186,7 @@ class Razorback(Monster):
 
         # Check vertical collisions
         monster_rect = self.get_rect()
-        for platform in platforms:
+        for platform in platforms.query(monster_rect):
             if monster_rect.colliderect(platform.rect):
                 if self.vel_y > 0:
                     self.y = platform.rect.top - self.height
@@ -5,8 +5,14 @@ from .base import Monster
 
 class Shriek(Monster):
     """Territorial bat that roams freely and dive-bombs when agitated"""
-    def __init__(self, x, y, patrol_range, speed, health, aggro_duration=180):
-        super().__init__(x, y, patrol_range, speed, health)
+
+    __slots__ = ('color', 'anim', 'wing_phase', 'is_agitated', 'agitation_timer',
+                 'agitation_duration', 'roam_angle', 'target_x', 'target_y', 'screech_cooldown')
+
+    frame_attrs = Monster.frame_attrs + ('direction', 'anim', 'wing_phase', 'is_agitated', 'screech_cooldown')
+
+    def __init__(self, x, y, patrol_range, speed, health, aggro_duration=180, rng=None):
+        super().__init__(x, y, patrol_range, speed, health, rng)
         self.color = (60, 20, 80)
         self.spawn_y = y
         self.anim = 0
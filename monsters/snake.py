@@ -1,14 +1,42 @@
 import pygame
 import math
-import random
 from .base import Monster
 
+_segment_waves = {}
+
+
+def segment_waves(num_segments, spacing):
+    """(history steps back, wave phase offset, wave amplitude) of each body
+    segment, worked out once per body shape"""
+    waves = _segment_waves.get((num_segments, spacing))
+    if waves is None:
+        waves = _segment_waves[num_segments, spacing] = [
+            (i * spacing, i * 0.5, 4 + i * 0.3) for i in range(num_segments)]
+    return waves
+
 
 class Snake(Monster):
     """Slithering snake with multiple body segments using position history.
-    Can aggro, lunge at player, wrap around them and bite!"""
-    def __init__(self, x, y, patrol_range, speed, health, aggro_duration=180):
-        super().__init__(x, y, patrol_range, speed, health)
+    Can aggro, lunge at player, wrap around them and bite!
+
+    The history of past head positions is a ring buffer: a list of
+    history_length entries with the newest at history_head. Recording a
+    position overwrites the oldest one instead of inserting at the front and
+    trimming, and an entry i steps older is at history_head - i (Python
+    wraps the negative indices)."""
+
+    __slots__ = ('color', 'belly_color', 'pattern_color', 'aggro_color', 'num_segments',
+                 'segment_spacing', 'head_size', 'body_width', 'history_length', 'position_history',
+                 'history_head', 'anim', 'tongue_out', 'tongue_flick', 'slither_phase', 'aggro_duration',
+                 'is_aggroed', 'aggro_timer', 'detection_range', 'is_lunging', 'lunge_vel_x',
+                 'lunge_vel_y', 'is_wrapped', 'wrap_target', 'wrap_angle', 'wrap_timer',
+                 'wrap_duration', 'bite_cooldown', 'bite_damage')
+
+    frame_attrs = Monster.frame_attrs + ('direction', 'anim', 'slither_phase', 'tongue_out', 'is_aggroed',
+                                         'is_wrapped', 'position_history', 'history_head')
+
+    def __init__(self, x, y, patrol_range, speed, health, aggro_duration=180, rng=None):
+        super().__init__(x, y, patrol_range, speed, health, rng)
         self.color = (80, 140, 50)
         self.belly_color = (120, 180, 80)
         self.pattern_color = (50, 100, 30)
@@ -20,10 +48,11 @@ class Snake(Monster):
         self.head_size = 10
         self.body_width = 7  # max body width
 
-        # Position history - stores past head positions
+        # Position history - stores past head positions, newest at history_head
         # We need enough history to place all segments
         self.history_length = self.num_segments * self.segment_spacing
         self.position_history = [(x + 20, y + 30) for _ in range(self.history_length)]
+        self.history_head = 0
 
         self.anim = 0
         self.tongue_out = False
@@ -126,7 +155,7 @@ class Snake(Monster):
         if self.is_aggroed:
             base_speed = self.speed * 2.0
             # Chase player, but check if it's safe first
-            wanted_direction = 1 if player.x > self.x else -1
+            wanted_direction = self.chase_direction(platforms, player)
             self.direction = wanted_direction
             # Check if safe to go toward player
             if on_ground and not self.has_ground_ahead(platforms):
@@ -157,7 +186,7 @@ class Snake(Monster):
 
         # Check vertical collisions
         monster_rect = self.get_rect()
-        for platform in platforms:
+        for platform in platforms.query(monster_rect):
             if monster_rect.colliderect(platform.rect):
                 if self.vel_y > 0:
                     # Falling - land on top
@@ -199,7 +228,7 @@ class Snake(Monster):
 
             # Check if we'd land on a platform
             sim_rect = pygame.Rect(sim_x, sim_y, self.width, self.height)
-            for platform in platforms:
+            for platform in platforms.query(sim_rect):
                 if sim_rect.colliderect(platform.rect) and vel_y > 0:
                     return True  # Would land on a platform
 
@@ -243,7 +272,7 @@ class Snake(Monster):
 
         # Check for landing on platforms
         monster_rect = self.get_rect()
-        for platform in platforms:
+        for platform in platforms.query(monster_rect):
             if monster_rect.colliderect(platform.rect):
                 if self.lunge_vel_y > 0:
                     # Falling - land on top
@@ -271,7 +300,7 @@ class Snake(Monster):
         self.wrap_target = player
         self.wrap_timer = self.wrap_duration
         self.wrap_angle = math.atan2(self.y - player.y, self.x - player.x)
-        self.bite_cooldown = random.randint(60, 120)  # First bite after 1-2 seconds
+        self.bite_cooldown = self.rng.ai.randint(60, 120)  # First bite after 1-2 seconds
 
     def _update_wrapped(self, player):
         """Update snake while wrapped around player"""
@@ -287,7 +316,7 @@ class Snake(Monster):
         self.bite_cooldown -= 1
         if self.bite_cooldown <= 0:
             player.health -= self.bite_damage
-            self.bite_cooldown = random.randint(60, 120)  # Bite every 1-2 seconds
+            self.bite_cooldown = self.rng.ai.randint(60, 120)  # Bite every 1-2 seconds
             self.tongue_out = True  # Show tongue when biting
 
         # Update position history to wrap around player
@@ -296,12 +325,13 @@ class Snake(Monster):
         center_y = player.y + player.height // 2
         angle_per_entry = 0.25 / self.segment_spacing
         radius_per_entry = 0.5 / self.segment_spacing
-        for i in range(len(self.position_history)):
+        head = self.history_head
+        for i in range(self.history_length):
             angle = self.wrap_angle - i * angle_per_entry
             radius = wrap_radius + (i * radius_per_entry)  # Spiral outward slightly
             hx = center_x + math.cos(angle) * radius
             hy = center_y + math.sin(angle) * radius
-            self.position_history[i] = (hx, hy)
+            self.position_history[head - i] = (hx, hy)
 
         # Release after wrap duration
         if self.wrap_timer <= 0:
@@ -325,45 +355,42 @@ class Snake(Monster):
         head_y = self.y + 30 + wave_offset
 
         # Calculate distance from last recorded position
-        if self.position_history:
-            last_x, last_y = self.position_history[0]
-            dx = head_x - last_x
-            dy = head_y - last_y
-            dist = math.sqrt(dx * dx + dy * dy)
-
-            # Target distance between history entries for smooth segments
-            target_step = 2.0
-
-            if dist > target_step:
-                # Interpolate multiple points to keep segments connected
-                num_steps = max(1, int(dist / target_step))
-                for i in range(1, num_steps + 1):
-                    t = i / num_steps
-                    interp_x = last_x + dx * t
-                    interp_y = last_y + dy * t
-                    self.position_history.insert(0, (interp_x, interp_y))
-            else:
-                self.position_history.insert(0, (head_x, head_y))
+        history = self.position_history
+        head = self.history_head
+        length = self.history_length
+        last_x, last_y = history[head]
+        dx = head_x - last_x
+        dy = head_y - last_y
+        dist = math.sqrt(dx * dx + dy * dy)
+
+        # Target distance between history entries for smooth segments
+        target_step = 2.0
+
+        # Each new entry overwrites the oldest one
+        if dist > target_step:
+            # Interpolate multiple points to keep segments connected - only the
+            # newest history_length of them fit in the buffer
+            num_steps = max(1, int(dist / target_step))
+            for i in range(max(1, num_steps - length + 1), num_steps + 1):
+                t = i / num_steps
+                head = (head + 1) % length
+                history[head] = (last_x + dx * t, last_y + dy * t)
         else:
-            self.position_history.insert(0, (head_x, head_y))
-
-        # Trim history to max length
-        if len(self.position_history) > self.history_length:
-            self.position_history = self.position_history[:self.history_length]
+            head = (head + 1) % length
+            history[head] = (head_x, head_y)
+        self.history_head = head
 
     def _get_segment_positions(self):
         """Get positions for each segment from history with wave motion"""
+        history = self.position_history
+        head = self.history_head
+        phase = self.slither_phase
         positions = []
-        for i in range(self.num_segments):
-            history_index = i * self.segment_spacing
-            if history_index < len(self.position_history):
-                base_x, base_y = self.position_history[history_index]
-                # Add perpendicular wave motion that travels down the body
-                wave = math.sin(self.slither_phase - i * 0.5) * (4 + i * 0.3)
-                positions.append((base_x + wave * 0.3, base_y))
-            else:
-                # Fallback if history isn't long enough yet
-                positions.append(self.position_history[-1])
+        for step, offset, amplitude in segment_waves(self.num_segments, self.segment_spacing):
+            base_x, base_y = history[head - step]
+            # Add perpendicular wave motion that travels down the body
+            wave = math.sin(phase - offset) * amplitude
+            positions.append((base_x + wave * 0.3, base_y))
         return positions
 
     def _get_segment_size(self, index):
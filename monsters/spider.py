@@ -1,12 +1,18 @@
 import pygame
 import math
+from collision import push_out, sweep
 from .base import Monster
 
 
 class Spider(Monster):
     """Crawls on platforms and walls, moves toward player when nearby"""
-    def __init__(self, x, y, patrol_range, speed, health):
-        super().__init__(x, y, patrol_range, speed, health)
+
+    __slots__ = ('color', 'leg_anim', 'is_climbing', 'climb_direction', 'wall_side', 'current_wall')
+
+    frame_attrs = Monster.frame_attrs + ('leg_anim', 'is_climbing', 'wall_side')
+
+    def __init__(self, x, y, patrol_range, speed, health, rng=None):
+        super().__init__(x, y, patrol_range, speed, health, rng)
         self.color = (25, 25, 30)
         self.leg_anim = 0
         self.is_climbing = False
@@ -53,60 +59,56 @@ class Spider(Monster):
             dist_to_player = abs(player.x - self.x)
             if dist_to_player < 250:  # Increased detection range
                 # Determine direction toward player
-                wanted_direction = 1 if player.x > self.x else -1
+                self.direction = self.chase_direction(platforms, player)
 
                 # Check if it's safe to go toward the player
-                self.direction = wanted_direction
                 if self.has_ground_ahead(platforms):
                     # Safe to chase
-                    self.x += self.speed * self.direction * 1.5
+                    move_x = self.speed * self.direction * 1.5
                 else:
                     # Not safe - don't move toward player, stay at edge
                     # Keep facing the player but don't walk off
-                    pass
+                    move_x = 0
             else:
                 # Patrol mode - check for edge before moving
                 if on_ground and not self.has_ground_ahead(platforms):
                     self.direction *= -1
                 # Normal patrol movement
-                self.x += self.speed * self.direction
+                move_x = self.speed * self.direction
+
+            # Move horizontally, stopping at the first wall in the way
+            wall = sweep(self, platforms, move_x, 0)
+            if wall is not None:
+                if self.direction > 0:
+                    self.x = wall.rect.left - self.width
+                else:
+                    self.x = wall.rect.right
+            if dist_to_player >= 250:
                 if self.x > self.spawn_x + self.patrol_range:
                     self.direction = -1
                 elif self.x < self.spawn_x - self.patrol_range:
                     self.direction = 1
 
-            # Move vertically
-            self.y += self.vel_y
-
-            # Check collisions
-            monster_rect = self.get_rect()
-            for platform in platforms:
-                if monster_rect.colliderect(platform.rect):
-                    # Vertical collision (landing)
-                    if self.vel_y > 0 and self.y + self.height > platform.rect.top:
-                        if self.y < platform.rect.top:
-                            self.y = platform.rect.top - self.height
-                            self.vel_y = 0
-                    # Vertical collision (hitting platform from below)
-                    elif self.vel_y < 0 and self.y < platform.rect.bottom:
-                        if self.y + self.height > platform.rect.bottom:
-                            self.y = platform.rect.bottom
-                            self.vel_y = 0
-                    # Horizontal collision (hitting a wall) - start climbing!
-                    elif self.vel_y <= 0 or on_ground:
-                        # Check if we hit the side of a platform
-                        if self.direction > 0 and self.x + self.width > platform.rect.left and self.x < platform.rect.left:
-                            # Hit left side of platform - climb it
-                            self.is_climbing = True
-                            self.wall_side = 1
-                            self.current_wall = platform
-                            self.x = platform.rect.left - self.width
-                        elif self.direction < 0 and self.x < platform.rect.right and self.x + self.width > platform.rect.right:
-                            # Hit right side of platform - climb it
-                            self.is_climbing = True
-                            self.wall_side = -1
-                            self.current_wall = platform
-                            self.x = platform.rect.right
+            # Pushed into a platform (by another monster, or it respawned) - get out first
+            push_out(self, platforms)
+
+            # Move vertically, stopping at the first floor or ceiling in the way
+            platform = sweep(self, platforms, 0, self.vel_y)
+            if platform is not None:
+                if self.vel_y > 0:
+                    # Landing
+                    self.y = platform.rect.top - self.height
+                    self.vel_y = 0
+                elif self.vel_y < 0:
+                    # Hitting platform from below
+                    self.y = platform.rect.bottom
+                    self.vel_y = 0
+
+            # Walking into a wall - start climbing it!
+            if wall is not None and on_ground:
+                self.is_climbing = True
+                self.wall_side = 1 if self.direction > 0 else -1
+                self.current_wall = wall
 
     def draw(self, screen):
         # Body colors - darker, more menacing
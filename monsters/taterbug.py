@@ -1,12 +1,18 @@
 import pygame
 import math
+from collision import push_out, sweep
 from .base import Monster
 
 
 class Taterbug(Monster):
     """Armored bug that curls into invulnerable ball when shot"""
-    def __init__(self, x, y, patrol_range, speed, health):
-        super().__init__(x, y, patrol_range, speed, health)
+
+    __slots__ = ('color', 'stripe_color', 'is_rolled', 'roll_timer', 'roll_duration', 'roll_angle')
+
+    frame_attrs = Monster.frame_attrs + ('is_rolled', 'roll_angle')
+
+    def __init__(self, x, y, patrol_range, speed, health, rng=None):
+        super().__init__(x, y, patrol_range, speed, health, rng)
         self.color = (80, 80, 90)
         self.stripe_color = (40, 40, 50)  # Darker for more contrast
         self.is_rolled = False
@@ -54,21 +60,20 @@ class Taterbug(Monster):
         elif self.x < self.spawn_x - self.patrol_range:
             self.direction = 1
 
-        # Move vertically
-        self.y += self.vel_y
-
-        # Check vertical collisions
-        monster_rect = self.get_rect()
-        for platform in platforms:
-            if monster_rect.colliderect(platform.rect):
-                if self.vel_y > 0:
-                    # Falling - land on top
-                    self.y = platform.rect.top - self.height
-                    self.vel_y = 0
-                elif self.vel_y < 0:
-                    # Moving up - push down from platform bottom
-                    self.y = platform.rect.bottom
-                    self.vel_y = 0
+        # Pushed into a platform (by another monster, or it respawned) - get out first
+        push_out(self, platforms)
+
+        # Move vertically, stopping at the first floor or ceiling in the way
+        platform = sweep(self, platforms, 0, self.vel_y)
+        if platform is not None:
+            if self.vel_y > 0:
+                # Falling - land on top
+                self.y = platform.rect.top - self.height
+                self.vel_y = 0
+            elif self.vel_y < 0:
+                # Moving up - push down from platform bottom
+                self.y = platform.rect.bottom
+                self.vel_y = 0
 
     def draw(self, screen):
         if self.is_rolled:
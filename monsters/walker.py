@@ -1,10 +1,15 @@
 import pygame
+from collision import push_out, sweep
 from .base import Monster
 
 
 class Walker(Monster):
-    def __init__(self, x, y, patrol_range, speed, health):
-        super().__init__(x, y, patrol_range, speed, health)
+    __slots__ = ('color',)
+
+    frame_attrs = Monster.frame_attrs + ('direction',)
+
+    def __init__(self, x, y, patrol_range, speed, health, rng=None):
+        super().__init__(x, y, patrol_range, speed, health, rng)
         self.color = (200, 50, 50)
 
     def update(self, platforms, player):
@@ -18,8 +23,13 @@ class Walker(Monster):
         if on_ground and not self.has_ground_ahead(platforms):
             self.direction *= -1
 
-        # Patrol movement
-        self.x += self.speed * self.direction
+        # Patrol movement, stopping at the first wall in the way
+        wall = sweep(self, platforms, self.speed * self.direction, 0)
+        if wall is not None:
+            if self.direction > 0:
+                self.x = wall.rect.left - self.width
+            else:
+                self.x = wall.rect.right
 
         # Reverse direction at patrol bounds
         if self.x > self.spawn_x + self.patrol_range:
@@ -27,31 +37,24 @@ class Walker(Monster):
         elif self.x < self.spawn_x - self.patrol_range:
             self.direction = 1
 
-        # Check horizontal collisions
-        monster_rect = self.get_rect()
-        for platform in platforms:
-            if monster_rect.colliderect(platform.rect):
-                if self.direction > 0:
-                    self.x = platform.rect.left - self.width
-                else:
-                    self.x = platform.rect.right
-                self.direction *= -1
+        # Turn around at walls
+        if wall is not None:
+            self.direction *= -1
 
-        # Move vertically
-        self.y += self.vel_y
+        # Pushed into a platform (by another monster, or it respawned) - get out first
+        push_out(self, platforms)
 
-        # Check vertical collisions
-        monster_rect = self.get_rect()
-        for platform in platforms:
-            if monster_rect.colliderect(platform.rect):
-                if self.vel_y > 0:
-                    # Falling - land on top
-                    self.y = platform.rect.top - self.height
-                    self.vel_y = 0
-                elif self.vel_y < 0:
-                    # Moving up - push down from platform bottom
-                    self.y = platform.rect.bottom
-                    self.vel_y = 0
+        # Move vertically, stopping at the first floor or ceiling in the way
+        platform = sweep(self, platforms, 0, self.vel_y)
+        if platform is not None:
+            if self.vel_y > 0:
+                # Falling - land on top
+                self.y = platform.rect.top - self.height
+                self.vel_y = 0
+            elif self.vel_y < 0:
+                # Moving up - push down from platform bottom
+                self.y = platform.rect.bottom
+                self.vel_y = 0
 
     def draw(self, screen):
         # Body
@@ -5,7 +5,7 @@ import threading
 
 
 class MusicGenerator:
-    def __init__(self, music_file):
+    def __init__(self, music_file, pregenerate=True):
         self.sample_rate = 22050
         self.current_track = None
         self.is_playing = False
@@ -18,10 +18,19 @@ class MusicGenerator:
             self.tracks = data.get('tracks', {})
             self.note_frequencies = data.get('note_frequencies', {})
 
-        # Pre-generate all tracks
         self.generated_tracks = {}
+        self.sounds = {}  # pygame Sounds made from generated_tracks
+        if pregenerate:
+            # Pre-generate all tracks (otherwise run generate_steps() or generate on first play)
+            for track_name in self.tracks:
+                self.generated_tracks[track_name] = self._generate_track(track_name)
+
+    def generate_steps(self):
+        """Generate every track not generated yet, one note per step"""
         for track_name in self.tracks:
-            self.generated_tracks[track_name] = self._generate_track(track_name)
+            if track_name not in self.generated_tracks:
+                audio = yield from self._track_steps(track_name)
+                self.generated_tracks.setdefault(track_name, audio)
 
     def _generate_waveform(self, freq, duration, waveform_type, volume=0.5):
         """Generate a waveform for a single note"""
@@ -54,8 +63,8 @@ class MusicGenerator:
 
         return wave * envelope * volume
 
-    def _generate_channel(self, channel_data, tempo):
-        """Generate audio for a single channel"""
+    def _channel_steps(self, channel_data, tempo):
+        """Generate audio for a single channel, yielding after every note"""
         waveform_type = channel_data.get('waveform', 'square')
         volume = channel_data.get('volume', 0.3)
         notes = channel_data.get('notes', [])
@@ -63,7 +72,7 @@ class MusicGenerator:
         # Calculate beat duration from tempo
         beat_duration = 60.0 / tempo
 
-        channel_audio = np.array([])
+        note_waves = [np.array([])]
 
         for note_data in notes:
             note_name = note_data.get('note', 'REST')
@@ -71,13 +80,29 @@ class MusicGenerator:
             duration_seconds = duration_beats * beat_duration
 
             freq = self.note_frequencies.get(note_name, 0)
-            note_wave = self._generate_waveform(freq, duration_seconds, waveform_type, volume)
-            channel_audio = np.concatenate([channel_audio, note_wave])
+            note_waves.append(self._generate_waveform(freq, duration_seconds, waveform_type, volume))
+            yield
+
+        return np.concatenate(note_waves)
+
+    def _generate_channel(self, channel_data, tempo):
+        """Generate audio for a single channel"""
+        return self._run_steps(self._channel_steps(channel_data, tempo))
 
-        return channel_audio
+    @staticmethod
+    def _run_steps(steps):
+        try:
+            while True:
+                next(steps)
+        except StopIteration as done:
+            return done.value
 
     def _generate_track(self, track_name):
         """Generate complete audio for a track by mixing all channels"""
+        return self._run_steps(self._track_steps(track_name))
+
+    def _track_steps(self, track_name):
+        """Generator version of _generate_track() - returns the audio when exhausted"""
         if track_name not in self.tracks:
             return None
 
@@ -93,25 +118,29 @@ class MusicGenerator:
         max_length = 0
 
         for channel in channels:
-            audio = self._generate_channel(channel, tempo)
+            audio = yield from self._channel_steps(channel, tempo)
             channel_audios.append(audio)
             max_length = max(max_length, len(audio))
 
-        # Pad channels to same length and mix
+        # Mix channels (shorter ones are silent at the end)
         mixed = np.zeros(max_length)
         for audio in channel_audios:
-            padded = np.zeros(max_length)
-            padded[:len(audio)] = audio
-            mixed += padded
+            mixed[:len(audio)] += audio
+            yield
 
         # Normalize to prevent clipping
         max_val = np.max(np.abs(mixed))
+        yield
         if max_val > 0:
-            mixed = mixed / max_val * 0.7
+            mixed /= max_val
+            mixed *= 0.7
+            yield
 
         # Convert to 16-bit stereo
-        mixed = np.clip(mixed, -1, 1)
-        mixed = (mixed * 32767).astype(np.int16)
+        np.clip(mixed, -1, 1, out=mixed)
+        mixed *= 32767
+        yield
+        mixed = mixed.astype(np.int16)
         stereo = np.column_stack((mixed, mixed))
 
         return stereo
@@ -119,7 +148,10 @@ class MusicGenerator:
     def play(self, track_name, loop=True):
         """Play a music track"""
         if track_name not in self.generated_tracks:
-            return
+            if track_name not in self.tracks:
+                return
+            # Not generated in the background yet - do it now
+            self.generated_tracks[track_name] = self._generate_track(track_name)
 
         # Stop current music
         self.stop()
@@ -131,8 +163,10 @@ class MusicGenerator:
         if audio_data is None:
             return
 
-        # Create pygame sound and play
-        sound = pygame.sndarray.make_sound(audio_data)
+        # Create pygame sound (once per track) and play
+        sound = self.sounds.get(track_name)
+        if sound is None:
+            sound = self.sounds[track_name] = pygame.sndarray.make_sound(audio_data)
 
         loops = -1 if should_loop else 0
         self.current_channel = sound.play(loops=loops)
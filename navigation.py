@@ -0,0 +1,224 @@
+from collections import deque
+
+import numpy as np
+from player import Player
+
+# Ways to get from one platform to another
+WALK = 'walk'      # Across to a touching platform at the same height
+DROP = 'drop'      # Off the edge and down, no jumping
+JUMP = 'jump'      # With up to max_jumps jumps
+BOUNCE = 'bounce'  # Launched by a bouncy platform, with the jumps left after it
+
+ON_FOOT = (WALK, DROP)  # What monsters that can't jump can use
+
+MAX_FALL = 1000  # How far below a take-off flights are followed
+
+
+class NavGraph:
+    """Which platforms can be reached from which, for a level.
+
+    Nodes are the platforms (their top surfaces, by index into the level's
+    platform list). Edges are the walks, drops, jumps and bounces a body
+    moving like `jumper` (a Player by default: its size, speed, jump_power,
+    gravity and max_jumps) can make, worked out tick by tick with the same
+    physics as Player.update. Edges ignore platforms in the way of a flight
+    and power-ups, so they are a good guess rather than a guarantee.
+    Unstable platforms count as always there.
+
+    Built once per level (PlatformGrid.nav); the queries are cheap enough to
+    make every tick."""
+
+    def __init__(self, platforms, jumper=None):
+        jumper = jumper or Player(0, 0)
+        self.platforms = platforms
+        self.width = jumper.width
+        self.height = jumper.height
+        self.speed = jumper.speed
+        self.gravity = jumper.gravity
+        self.jump_power = jumper.jump_power
+        self.max_jumps = jumper.max_jumps
+        # Crumbled platforms have an empty rect, so use where they respawn
+        self.surfaces = [(p.x, p.y, p.x + p.width) for p in platforms]
+        self.by_top = {}
+        for index, (_, top, _) in enumerate(self.surfaces):
+            self.by_top.setdefault(top, []).append(index)
+        self.lefts, self.tops, self.rights = np.array(self.surfaces, dtype=float).reshape(-1, 3).T
+
+        self.jump = self._descent(0, self.max_jumps)
+        self.fall = self._descent(0, 0)
+        self.edges = [[] for _ in platforms]
+        self.into = [[] for _ in platforms]
+        for index, platform in enumerate(platforms):
+            if platform.bouncy:
+                self._link_flights(index, self._descent(platform.bounce_power, self.max_jumps - 1), BOUNCE)
+            else:
+                self._link_ground(index)
+        self._hops = {}
+
+    def _descent(self, velocity, jumps):
+        """Follow a flight that takes off with velocity (negative is up) and
+        uses every jump left at the top of its arc. Returns the heights above
+        the take-off surface on the way down from the highest point, and the
+        tick each is reached at."""
+        vel, height, tick = velocity, 0.0, 0
+        heights, ticks = [], []
+        while height > -MAX_FALL:
+            if jumps and vel >= 0:
+                vel = self.jump_power
+                jumps -= 1
+            vel = min(vel + self.gravity, 20)
+            height -= vel
+            tick += 1
+            if vel > 0 and not jumps:
+                heights.append(-height)  # Negated so they ascend for searchsorted
+                ticks.append(tick)
+        return np.array(heights), np.array(ticks)
+
+    def _reach(self, descent, rises):
+        """How far across a flight can carry the body before it comes down
+        onto a surface rises above the take-off one, -1 where it can't get up
+        there (works on arrays of rises too)"""
+        heights, ticks = descent
+        if not len(heights):
+            return np.full(np.shape(rises), -1.0)
+        index = np.minimum(np.searchsorted(heights, -np.asarray(rises)), len(heights) - 1)
+        # Landing needs the body above the surface first, and still above it at the end
+        reachable = (-heights[0] > rises) & (heights[index] >= -np.asarray(rises))
+        return np.where(reachable, self.speed * ticks[index], -1.0)
+
+    def _gaps(self, a):
+        """Horizontal gaps between platform a and every platform"""
+        left, _, right = self.surfaces[a]
+        return np.maximum(0, np.maximum(self.lefts - right, left - self.rights))
+
+    def _add(self, a, b, kind):
+        self.edges[a].append((b, kind))
+        self.into[b].append((a, kind))
+
+    def _link_flights(self, a, descent, kind):
+        top = self.surfaces[a][1]
+        linked = self._gaps(a) <= self._reach(descent, top - self.tops)
+        linked[a] = False
+        for b in np.flatnonzero(linked):
+            self._add(a, int(b), kind)
+
+    def _link_ground(self, a):
+        top = self.surfaces[a][1]
+        gaps = self._gaps(a)
+        rises = top - self.tops
+        walk = (rises == 0) & (gaps < self.width)
+        drop = ~walk & (rises < 0) & (gaps <= self._reach(self.fall, rises))
+        jump = ~walk & ~drop & (gaps <= self._reach(self.jump, rises))
+        linked = walk | drop | jump
+        linked[a] = False
+        for b in np.flatnonzero(linked):
+            self._add(a, int(b), WALK if walk[b] else DROP if drop[b] else JUMP)
+
+    def node_under(self, body):
+        """The platform body (anything with x, y, width and height) is
+        standing on, or None if it isn't standing on one"""
+        for index in self.by_top.get(body.y + body.height, ()):
+            left, _, right = self.surfaces[index]
+            if body.x < right and body.x + body.width > left:
+                return index
+        return None
+
+    def node_below(self, x, y):
+        """The first platform a jumper-sized body at (x, y) lands on if it
+        falls straight down, or None"""
+        feet = y + self.height
+        best = None
+        for index, (left, top, right) in enumerate(self.surfaces):
+            if top >= feet and x < right and x + self.width > left:
+                if best is None or top < self.surfaces[best][1]:
+                    best = index
+        return best
+
+    def reachable(self, start, kinds=None):
+        """Set of nodes that can be reached from start, using only edges of
+        the given kinds (all of them by default)"""
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            for node, kind in self.edges[queue.popleft()]:
+                if node not in seen and (kinds is None or kind in kinds):
+                    seen.add(node)
+                    queue.append(node)
+        return seen
+
+    def path(self, start, goal, kinds=None):
+        """Fewest-edge list of nodes from start to goal (both included), or
+        None if goal can't be reached"""
+        came_from = {start: None}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            if node == goal:
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = came_from[node]
+                return path[::-1]
+            for other, kind in self.edges[node]:
+                if other not in came_from and (kinds is None or kind in kinds):
+                    came_from[other] = node
+                    queue.append(other)
+        return None
+
+    def _next_hops(self, goal):
+        """For every node that can get to goal on foot, the next node on the
+        way - one search back from goal, cached"""
+        hops = self._hops.get(goal)
+        if hops is None:
+            hops = {goal: goal}
+            queue = deque([goal])
+            while queue:
+                node = queue.popleft()
+                for other, kind in self.into[node]:
+                    if other not in hops and kind in ON_FOOT:
+                        hops[other] = node
+                        queue.append(other)
+            self._hops[goal] = hops
+        return hops
+
+    def heading(self, body, target):
+        """Direction (1 or -1) body should walk to get onto the platform
+        target is standing on, when that means walking or dropping onto
+        another platform past one end of its own. 0 when they're on the same
+        platform, either isn't standing on one, there's no way there on foot
+        or either end will do."""
+        start = self.node_under(body)
+        goal = self.node_under(target)
+        if start is None or goal is None or start == goal:
+            return 0
+        hop = self._next_hops(goal).get(start)
+        if hop is None:
+            return 0
+        left, _, right = self.surfaces[start]
+        hop_left, _, hop_right = self.surfaces[hop]
+        # Walk off whichever end the next platform sticks out past
+        past_right = hop_right > right
+        past_left = hop_left < left
+        if past_right and not past_left:
+            return 1
+        if past_left and not past_right:
+            return -1
+        return 0
+
+    def can_touch(self, start, rect):
+        """Whether a jumper can get from platform start to touching rect:
+        onto some reachable platform and then jumping into it"""
+        heights, ticks = self.jump
+        peak = -heights[0]
+        for node in self.reachable(start):
+            if self.platforms[node].bouncy:
+                continue
+            left, top, right = self.surfaces[node]
+            # Heights above the platform where the body overlaps rect vertically
+            low = max(0, top - self.height - rect.bottom + 1)
+            if low >= min(peak, top - rect.top):
+                continue
+            gap = max(0, rect.left - right, left - rect.right)
+            if gap <= self._reach(self.jump, low):
+                return True
+        return False
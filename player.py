@@ -1,8 +1,17 @@
 import pygame
-from bullet import Bullet, Missile
+from bullet import Missile
+from collision import Hitbox, push_out, sweep
 
 
-class Player:
+class Player(Hitbox):
+    __slots__ = ('x', 'y', 'width', 'height', 'vel_x', 'vel_y', 'speed', 'jump_power', 'gravity',
+                 'on_ground', 'facing_right', 'health', 'max_health', 'shoot_cooldown', 'color',
+                 'jump_count', 'max_jumps', 'weapon', 'has_rapid', 'has_spread', 'has_missile',
+                 'damage_boost', 'speed_boost', 'has_magnet', 'has_pierce', 'has_shield',
+                 'extra_jump', 'missile_lock')
+
+    frame_attrs = ('x', 'y', 'facing_right', 'health')
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -33,9 +42,7 @@ class Player:
         self.has_pierce = False    # Bullets go through enemies
         self.has_shield = False    # Take half damage
         self.extra_jump = False    # Triple jump instead of double
-
-    def get_rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        self.missile_lock = False  # Missiles keep their target while in range
 
     def handle_input(self, keys):
         # Horizontal movement with A and D
@@ -79,25 +86,25 @@ class Player:
             bullet_y = self.y + self.height // 2 - 5
 
             if self.weapon == 'normal':
-                bullets.append(Bullet(bullet_x, bullet_y, direction))
+                bullets.fire_bullet(bullet_x, bullet_y, direction)
                 self.shoot_cooldown = 15
                 if sound_gen:
                     sound_gen.play("shoot")
             elif self.weapon == 'rapid':
-                bullets.append(Bullet(bullet_x, bullet_y, direction, speed=18))
+                bullets.fire_bullet(bullet_x, bullet_y, direction, speed=18)
                 self.shoot_cooldown = 5
                 if sound_gen:
                     sound_gen.play("shoot_rapid")
             elif self.weapon == 'spread':
                 # 3-way shot
-                bullets.append(Bullet(bullet_x, bullet_y, direction, speed=10))
-                bullets.append(Bullet(bullet_x, bullet_y - 15, direction, speed=10, angle=-0.3))
-                bullets.append(Bullet(bullet_x, bullet_y + 15, direction, speed=10, angle=0.3))
+                bullets.fire_bullet(bullet_x, bullet_y, direction, speed=10)
+                bullets.fire_bullet(bullet_x, bullet_y - 15, direction, speed=10, angle=-0.3)
+                bullets.fire_bullet(bullet_x, bullet_y + 15, direction, speed=10, angle=0.3)
                 self.shoot_cooldown = 20
                 if sound_gen:
                     sound_gen.play("shoot_spread")
             elif self.weapon == 'missile':
-                bullets.append(Missile(bullet_x, bullet_y, direction))
+                bullets.append(Missile(bullet_x, bullet_y, direction, sticky=self.missile_lock))
                 self.shoot_cooldown = 25  # Slower fire rate for powerful missiles
                 if sound_gen:
                     sound_gen.play("shoot")
@@ -108,39 +115,31 @@ class Player:
         if self.vel_y > 20:
             self.vel_y = 20
 
-        # Move horizontally
-        self.x += self.vel_x
-
-        # Check horizontal collisions
-        player_rect = self.get_rect()
-        for platform in platforms:
-            if player_rect.colliderect(platform.rect):
-                if self.vel_x > 0:
-                    self.x = platform.rect.left - self.width
-                elif self.vel_x < 0:
-                    self.x = platform.rect.right
+        # Move horizontally, stopping at the first wall in the way
+        platform = sweep(self, platforms, self.vel_x, 0)
+        if platform is not None:
+            if self.vel_x > 0:
+                self.x = platform.rect.left - self.width
+            elif self.vel_x < 0:
+                self.x = platform.rect.right
 
-        # Move vertically
-        self.y += self.vel_y
-
-        # Check vertical collisions
+        # Move vertically, stopping at the first floor or ceiling in the way
         self.on_ground = False
-        player_rect = self.get_rect()
-        for platform in platforms:
-            if player_rect.colliderect(platform.rect):
-                if self.vel_y > 0:
-                    self.y = platform.rect.top - self.height
-                    # Check if platform is bouncy
-                    if getattr(platform, 'bouncy', False):
-                        self.vel_y = platform.bounce_power
-                        self.jump_count = 1  # Allow one more jump after bounce
-                    else:
-                        self.vel_y = 0
-                        self.on_ground = True
-                        self.jump_count = 0
-                elif self.vel_y < 0:
-                    self.y = platform.rect.bottom
+        platform = sweep(self, platforms, 0, self.vel_y)
+        if platform is not None:
+            if self.vel_y > 0:
+                self.y = platform.rect.top - self.height
+                # Check if platform is bouncy
+                if getattr(platform, 'bouncy', False):
+                    self.vel_y = platform.bounce_power
+                    self.jump_count = 1  # Allow one more jump after bounce
+                else:
                     self.vel_y = 0
+                    self.on_ground = True
+                    self.jump_count = 0
+            elif self.vel_y < 0:
+                self.y = platform.rect.bottom
+                self.vel_y = 0
 
         # Update cooldown
         if self.shoot_cooldown > 0:
@@ -149,28 +148,7 @@ class Player:
     def resolve_pushed_collision(self, platforms):
         """Resolve collisions when pushed by external forces (monsters, etc).
         Call this after any external position changes."""
-        player_rect = self.get_rect()
-        for platform in platforms:
-            if player_rect.colliderect(platform.rect):
-                # Calculate overlap on each axis
-                overlap_left = player_rect.right - platform.rect.left
-                overlap_right = platform.rect.right - player_rect.left
-                overlap_top = player_rect.bottom - platform.rect.top
-                overlap_bottom = platform.rect.bottom - player_rect.top
-
-                # Find smallest overlap to determine push direction
-                min_overlap = min(overlap_left, overlap_right, overlap_top, overlap_bottom)
-
-                if min_overlap == overlap_left:
-                    self.x = platform.rect.left - self.width
-                elif min_overlap == overlap_right:
-                    self.x = platform.rect.right
-                elif min_overlap == overlap_top:
-                    self.y = platform.rect.top - self.height
-                    self.vel_y = 0
-                elif min_overlap == overlap_bottom:
-                    self.y = platform.rect.bottom
-                    self.vel_y = 0
+        push_out(self, platforms)
 
     def draw(self, screen):
         # Ant colors
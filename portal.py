@@ -1,8 +1,14 @@
 import pygame
 import math
 
+from collision import Hitbox
+
+
+class Portal(Hitbox):
+    __slots__ = ('x', 'y', 'width', 'height', 'active', 'animation')
+
+    frame_attrs = ('active', 'animation')
 
-class Portal:
     def __init__(self, x, y, width=80, height=60):
         self.x = x
         self.y = y
@@ -11,9 +17,6 @@ class Portal:
         self.active = False
         self.animation = 0
 
-    def get_rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height)
-
     def activate(self):
         self.active = True
 
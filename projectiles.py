@@ -0,0 +1,178 @@
+import numpy as np
+import pygame
+
+from bullet import Bullet, Missile
+
+# Values of the kind column
+BULLET = 0
+MISSILE = 1
+
+
+class ProjectileStore:
+    """Every bullet and missile in flight, as NumPy columns.
+
+    Player.shoot() fire_bullet()s bullets straight into a row of x, y, vx,
+    vy, width, height, kind and alive, and append()s Missile objects, which
+    get a row too and are kept (for homing). Moving, stopping at platforms,
+    culling off-screen shots and hit tests are a few array operations however
+    many shots there are, and dead rows are swap-removed: the last live row
+    moves into the gap, so row numbers change whenever compact() runs. len()
+    is the number of live shots."""
+
+    COLUMNS = ('x', 'y', 'vx', 'vy', 'width', 'height', 'prev_x', 'prev_y')
+    FLAGS = ('kind', 'alive', 'stopped')
+
+    def __init__(self, capacity=64):
+        for name in self.COLUMNS:
+            setattr(self, name, np.zeros(capacity))
+        self.kind = np.zeros(capacity, np.int8)
+        self.alive = np.zeros(capacity, bool)
+        self.stopped = np.zeros(capacity, bool)  # Hit a platform on the last update()
+        self.missiles = [None] * capacity  # Missile objects by row, None for bullets
+        self.count = 0
+        self._drawn = None
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self):
+        capacity = len(self.x) * 2
+        for name in self.COLUMNS + self.FLAGS:
+            column = getattr(self, name)
+            grown = np.zeros(capacity, column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+        self.missiles.extend([None] * (capacity - len(self.missiles)))
+
+    def _add(self, x, y, vel_x, vel_y, width, height, missile):
+        if self.count == len(self.x):
+            self._grow()
+        row = self.count
+        self.count += 1
+        self.x[row] = self.prev_x[row] = x
+        self.y[row] = self.prev_y[row] = y
+        self.vx[row] = vel_x
+        self.vy[row] = vel_y
+        self.width[row] = width
+        self.height[row] = height
+        self.alive[row] = True
+        self.stopped[row] = False
+        self.kind[row] = BULLET if missile is None else MISSILE
+        self.missiles[row] = missile
+
+    def fire_bullet(self, x, y, direction, speed=12, angle=0):
+        """Add a bullet as Bullet(x, y, direction, speed, angle) would be,
+        without making the object"""
+        self._add(x, y, speed * direction, speed * angle, Bullet.WIDTH, Bullet.HEIGHT, None)
+
+    def append(self, projectile):
+        """Add a Bullet or Missile - only missiles are kept"""
+        missile = projectile if isinstance(projectile, Missile) else None
+        self._add(projectile.x, projectile.y, projectile.vel_x, projectile.vel_y,
+                  projectile.width, projectile.height, missile)
+
+    def has_missiles(self):
+        return bool(self.kind[:self.count].any())  # BULLET is 0
+
+    def live_missiles(self):
+        return [missile for missile in self.missiles[:self.count] if missile is not None]
+
+    def update(self, platforms, targets=None):
+        """Steer missiles toward targets (a spatial.TargetIndex) and move
+        every shot, stopping it where it first touches one of platforms (a
+        spatial.PlatformGrid). The stopped column marks the ones that did."""
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        start_x, start_y = x.copy(), y.copy()
+        if targets is not None:
+            vx, vy = self.vx, self.vy
+            for row in np.flatnonzero(self.kind[:n] == MISSILE).tolist():
+                vx[row], vy[row] = self.missiles[row].steer(targets, x[row], y[row], vx[row], vy[row])
+        x += self.vx[:n]
+        y += self.vy[:n]
+        dx, dy = x - start_x, y - start_y
+        t = platforms.raycast_many(start_x, start_y, self.width[:n], self.height[:n], dx, dy)
+        hit = np.isfinite(t)
+        self.stopped[:n] = hit
+        if hit.any():
+            x[hit] = start_x[hit] + dx[hit] * t[hit]
+            y[hit] = start_y[hit] + dy[hit] * t[hit]
+
+    def stopped_rows(self):
+        return np.flatnonzero(self.stopped[:self.count]).tolist()
+
+    def cull(self, width, height):
+        """Drop shots that are off the screen"""
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        outside = (x < 0) | (x > width) | (y < 0) | (y > height)
+        if outside.any():
+            self.alive[:n] &= ~outside
+            self.compact()
+
+    def remove(self, rows):
+        self.alive[rows] = False
+        self.compact()
+
+    def compact(self):
+        """Swap-remove dead rows: live rows past the new end fill the gaps"""
+        n = self.count
+        alive = self.alive[:n]
+        live = int(alive.sum())
+        if live == n:
+            return
+        gaps = np.flatnonzero(~alive[:live])
+        movers = np.flatnonzero(alive[live:]) + live
+        for name in self.COLUMNS + self.FLAGS:
+            column = getattr(self, name)
+            column[gaps] = column[movers]
+        missiles = self.missiles
+        for gap, mover in zip(gaps.tolist(), movers.tolist()):
+            missiles[gap] = missiles[mover]
+        missiles[live:n] = [None] * (n - live)
+        self.alive[live:n] = False
+        self.count = live
+
+    def boxes(self):
+        """Integer (left, top, right, bottom) columns of the live shots, the
+        way pygame.Rect truncates them"""
+        n = self.count
+        left = self.x[:n].astype(int)
+        top = self.y[:n].astype(int)
+        return left, top, left + self.width[:n].astype(int), top + self.height[:n].astype(int)
+
+    def get_rect(self, row):
+        return pygame.Rect(self.x[row], self.y[row], self.width[row], self.height[row])
+
+    def center(self, row):
+        return self.x[row] + self.width[row] / 2, self.y[row] + self.height[row] / 2
+
+    def capture_positions(self):
+        """Remember where every shot is, for blend_positions() (see
+        interpolation.Interpolator)"""
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    def blend_positions(self, alpha):
+        """Move shots to where they'd be between the last capture and now,
+        for drawing; restore_positions() puts them back"""
+        n = self.count
+        self._drawn = (self.x[:n].copy(), self.y[:n].copy())
+        self.x[:n] = self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha
+        self.y[:n] = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha
+
+    def restore_positions(self):
+        if self._drawn is not None:
+            n = len(self._drawn[0])
+            self.x[:n], self.y[:n] = self._drawn
+            self._drawn = None
+
+    def draw(self, screen):
+        for row in range(self.count):
+            x, y = self.x[row], self.y[row]
+            width, height = self.width[row], self.height[row]
+            if self.kind[row] == MISSILE:
+                Missile.draw_at(screen, x, y, width, height, self.vx[row])
+            else:
+                Bullet.draw_at(screen, x, y, width, height)
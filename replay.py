@@ -0,0 +1,128 @@
+import json
+import struct
+import zlib
+
+import pygame
+
+from game_session import FrameInput
+
+# One bit per key - held state first, then key presses (KEYDOWN) of the tick
+HELD_BITS = [pygame.K_a, pygame.K_d, pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_RSHIFT]
+PRESS_BITS = [pygame.K_SPACE, pygame.K_w, pygame.K_RSHIFT, pygame.K_e, pygame.K_RETURN]
+PRESS_SHIFT = len(HELD_BITS)
+
+MAGIC = b'AVSR'
+VERSION = 1
+# magic, version, seed, tick count, mode length, map JSON length
+HEADER = struct.Struct('<4sBQIBI')
+
+
+def encode_input(frame_input):
+    """Pack a FrameInput into an int bitmask (repeated presses of one key collapse)"""
+    mask = 0
+    for bit, key in enumerate(HELD_BITS):
+        if key in frame_input.held:
+            mask |= 1 << bit
+    for bit, key in enumerate(PRESS_BITS):
+        if key in frame_input.pressed:
+            mask |= 1 << (bit + PRESS_SHIFT)
+    return mask
+
+
+def decode_input(mask):
+    held = [key for bit, key in enumerate(HELD_BITS) if mask & (1 << bit)]
+    pressed = [key for bit, key in enumerate(PRESS_BITS) if mask & (1 << (bit + PRESS_SHIFT))]
+    return FrameInput(held, pressed)
+
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class Replay:
+    """Recorded inputs of one GameSession: mode, seed and a run-length encoded
+    stream of per-tick input bitmasks. Replaying the inputs into a session
+    created with the same mode and seed reproduces the run exactly."""
+
+    def __init__(self, mode, seed, map_data=None, runs=None):
+        self.mode = mode
+        self.seed = seed
+        self.map_data = map_data  # Only for editor test plays
+        self.runs = runs if runs is not None else []  # [mask, tick count] pairs
+
+    def __len__(self):
+        return sum(count for _, count in self.runs)
+
+    def append(self, frame_input):
+        mask = encode_input(frame_input)
+        if self.runs and self.runs[-1][0] == mask:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([mask, 1])
+
+    def inputs(self):
+        """Yield one FrameInput per recorded tick"""
+        decoded = {}
+        for mask, count in self.runs:
+            if mask not in decoded:
+                decoded[mask] = decode_input(mask)
+            frame_input = decoded[mask]
+            for _ in range(count):
+                yield frame_input
+
+    def to_bytes(self):
+        body = bytearray()
+        for mask, count in self.runs:
+            _write_varint(body, mask)
+            _write_varint(body, count)
+        mode = self.mode.encode()
+        map_json = json.dumps(self.map_data).encode() if self.map_data else b''
+        header = HEADER.pack(MAGIC, VERSION, self.seed, len(self), len(mode), len(map_json))
+        return header + mode + map_json + zlib.compress(bytes(body), 9)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, seed, ticks, mode_len, map_len = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a replay file (or unsupported version)")
+        pos = HEADER.size
+        mode = data[pos:pos + mode_len].decode()
+        pos += mode_len
+        map_data = json.loads(data[pos:pos + map_len]) if map_len else None
+        pos += map_len
+
+        body = zlib.decompress(data[pos:])
+        runs = []
+        pos = 0
+        while pos < len(body):
+            mask, pos = _read_varint(body, pos)
+            count, pos = _read_varint(body, pos)
+            runs.append([mask, count])
+        replay = cls(mode, seed, map_data, runs)
+        if len(replay) != ticks:
+            raise ValueError("Replay file is truncated")
+        return replay
+
+    def save(self, filename):
+        with open(filename, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, filename):
+        with open(filename, 'rb') as f:
+            return cls.from_bytes(f.read())
@@ -53,6 +53,19 @@ class SaveManager:
         with open(self.SAVE_FILE, 'w') as f:
             json.dump(self.data, f, indent=4)
 
+    def save_steps(self, chunk_parts=256):
+        """Same as save(), split into steps for the frame scheduler"""
+        # Copy now so later changes don't mix into this save half-way
+        data = {key: value.copy() if isinstance(value, (dict, list)) else value
+                for key, value in self.data.items()}
+        parts = []
+        for part in json.JSONEncoder(indent=4).iterencode(data):
+            parts.append(part)
+            if len(parts) % chunk_parts == 0:
+                yield
+        with open(self.SAVE_FILE, 'w') as f:
+            f.write(''.join(parts))
+
     def mark_game_beaten(self):
         """Mark the game as beaten to unlock features"""
         if not self.data["game_beaten"]:
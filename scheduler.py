@@ -0,0 +1,59 @@
+import time
+from collections import deque
+
+
+def _call(func):
+    func()
+    yield
+
+
+class FrameScheduler:
+    """Runs deferred, non-urgent work in the time left before a frame deadline.
+
+    A task is a generator that does one small chunk of work per next() call
+    (a plain function is a single chunk). Tasks take turns, one chunk each,
+    until the deadline passes; at least one chunk runs per frame so work still
+    finishes when a frame has no spare time."""
+
+    def __init__(self):
+        self.tasks = deque()  # (name, generator)
+        # Report for the last run() - shown by the F3 overlay
+        self.budget = 0.0
+        self.used = 0.0
+        self.chunks = 0
+
+    def add(self, task, name=None):
+        if callable(task):
+            task = _call(task)
+        self.tasks.append((name, task))
+
+    def cancel(self, name):
+        self.tasks = deque(entry for entry in self.tasks if entry[0] != name)
+
+    def pending(self, name=None):
+        return sum(1 for entry in self.tasks if name is None or entry[0] == name)
+
+    def _run_chunk(self):
+        entry = self.tasks.popleft()
+        try:
+            next(entry[1])
+        except StopIteration:
+            return
+        self.tasks.append(entry)
+
+    def run(self, deadline):
+        """Work on queued tasks until time.perf_counter() reaches deadline"""
+        start = time.perf_counter()
+        self.budget = max(0.0, deadline - start)
+        self.chunks = 0
+        while self.tasks:
+            self._run_chunk()
+            self.chunks += 1
+            if time.perf_counter() >= deadline:
+                break
+        self.used = time.perf_counter() - start
+
+    def flush(self):
+        """Finish everything now (e.g. pending saves before quitting)"""
+        while self.tasks:
+            self._run_chunk()
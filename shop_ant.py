@@ -0,0 +1,139 @@
+import pygame
+from collision import Hitbox
+from rng import default_streams
+
+
+class ShopAnt(Hitbox):
+    __slots__ = ('rng', 'x', 'y', 'width', 'height', 'tips', 'current_tip', 'gave_gift',
+                 'gift_amount', 'near_player', 'tip_timer')
+
+    frame_attrs = ('tip_index', 'gave_gift', 'gift_amount', 'near_player', 'tip_timer')
+
+    def __init__(self, x, y, rng=None):
+        self.rng = rng or default_streams
+        self.x = x
+        self.y = y
+        self.width = 50
+        self.height = 70
+        self.tips = [
+            "Welcome to my shop!",
+            "Good luck out there!",
+            "Stay safe, friend!",
+            "Damage boost is great for tough enemies!",
+            "Spread shot covers more area!",
+            "Save up for the best items!",
+            "Watch out for spiders!",
+            "The monsters are tough ahead...",
+            "Need some spores?",
+            "Here, take these!",
+        ]
+        self.current_tip = self.rng.cosmetic.choice(self.tips)
+        self.gave_gift = False
+        self.gift_amount = 0
+        self.near_player = False
+        self.tip_timer = 0
+
+    @property
+    def tip_index(self):
+        """current_tip as a position in tips"""
+        return self.tips.index(self.current_tip)
+
+    @tip_index.setter
+    def tip_index(self, index):
+        self.current_tip = self.tips[index]
+
+    def detection_rect(self):
+        """Area where the player counts as near"""
+        return pygame.Rect(self.x - 60, self.y - 40, self.width + 120, self.height + 80)
+
+    def set_player_near(self, near):
+        """Update whether the player is near and handle gift"""
+        was_near = self.near_player
+        self.near_player = near
+
+        # First time approaching - chance to give gift
+        if self.near_player and not was_near and not self.gave_gift:
+            self.current_tip = self.rng.cosmetic.choice(self.tips)
+            self.tip_timer = 180  # Show tip for 3 seconds
+            # 50% chance to give 1-2 spores
+            if self.rng.ai.random() < 0.5:
+                self.gift_amount = self.rng.ai.randint(1, 2)
+                self.gave_gift = True
+                return self.gift_amount
+        return 0
+
+    def update(self):
+        if self.tip_timer > 0:
+            self.tip_timer -= 1
+
+    def cycle_dialogue(self):
+        """Cycle to a new random dialogue"""
+        if self.near_player:
+            self.current_tip = self.rng.cosmetic.choice(self.tips)
+            self.tip_timer = 180
+
+    def draw(self, screen, font):
+        # Draw ant body similar to player but different color
+        body_color = (80, 60, 45)  # Lighter brown
+        highlight_color = (110, 90, 70)
+
+        cx = self.x + self.width // 2
+
+        # Abdomen
+        abdomen_y = self.y + 50
+        pygame.draw.ellipse(screen, body_color, (cx - 15, abdomen_y, 30, 22))
+        pygame.draw.ellipse(screen, highlight_color, (cx - 10, abdomen_y + 3, 12, 8))
+
+        # Thorax
+        thorax_y = self.y + 32
+        pygame.draw.ellipse(screen, body_color, (cx - 10, thorax_y, 20, 22))
+        pygame.draw.ellipse(screen, highlight_color, (cx - 6, thorax_y + 4, 8, 6))
+
+        # Head
+        head_y = self.y + 16
+        pygame.draw.circle(screen, body_color, (int(cx), int(head_y)), 12)
+        pygame.draw.circle(screen, highlight_color, (int(cx - 3), int(head_y - 3)), 4)
+
+        # Friendly eyes
+        pygame.draw.circle(screen, (30, 30, 30), (int(cx - 5), int(head_y - 3)), 4)
+        pygame.draw.circle(screen, (30, 30, 30), (int(cx + 5), int(head_y - 3)), 4)
+        pygame.draw.circle(screen, (255, 255, 255), (int(cx - 4), int(head_y - 4)), 2)
+        pygame.draw.circle(screen, (255, 255, 255), (int(cx + 6), int(head_y - 4)), 2)
+
+        # Antennae
+        pygame.draw.line(screen, body_color, (cx - 6, head_y - 10), (cx - 14, head_y - 22), 2)
+        pygame.draw.line(screen, body_color, (cx - 14, head_y - 22), (cx - 10, head_y - 28), 2)
+        pygame.draw.line(screen, body_color, (cx + 6, head_y - 10), (cx + 14, head_y - 22), 2)
+        pygame.draw.line(screen, body_color, (cx + 14, head_y - 22), (cx + 10, head_y - 28), 2)
+
+        # Legs
+        leg_color = (60, 45, 35)
+        for i, leg_y_off in enumerate([thorax_y + 5, thorax_y + 11, thorax_y + 17]):
+            pygame.draw.line(screen, leg_color, (cx - 10, leg_y_off), (cx - 22, leg_y_off + 10), 2)
+            pygame.draw.line(screen, leg_color, (cx - 22, leg_y_off + 10), (cx - 26, leg_y_off + 20), 2)
+            pygame.draw.line(screen, leg_color, (cx + 10, leg_y_off), (cx + 22, leg_y_off + 10), 2)
+            pygame.draw.line(screen, leg_color, (cx + 22, leg_y_off + 10), (cx + 26, leg_y_off + 20), 2)
+
+        # Speech bubble if showing tip
+        if self.near_player or self.tip_timer > 0:
+            tip_text = self.current_tip
+            if self.gave_gift and self.gift_amount > 0:
+                tip_text = f"Here's {self.gift_amount} spore{'s' if self.gift_amount > 1 else ''} for you!"
+
+            tip_surface = font.render(tip_text, True, (50, 50, 50))
+            tip_rect = tip_surface.get_rect(center=(cx, self.y - 25))
+            bubble_rect = tip_rect.inflate(16, 10)
+
+            # Bubble background
+            pygame.draw.rect(screen, (255, 255, 240), bubble_rect, border_radius=8)
+            pygame.draw.rect(screen, (100, 100, 80), bubble_rect, 2, border_radius=8)
+            # Tail
+            pygame.draw.polygon(screen, (255, 255, 240), [
+                (cx - 8, self.y - 5),
+                (cx + 8, self.y - 5),
+                (cx, self.y + 5)
+            ])
+            pygame.draw.line(screen, (100, 100, 80), (cx - 8, self.y - 5), (cx, self.y + 5), 2)
+            pygame.draw.line(screen, (100, 100, 80), (cx + 8, self.y - 5), (cx, self.y + 5), 2)
+
+            screen.blit(tip_surface, tip_rect)
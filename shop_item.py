@@ -1,7 +1,14 @@
 import pygame
 
+from collision import Hitbox
+
+
+class ShopItem(Hitbox):
+    __slots__ = ('name', 'item_type', 'cost', 'description', 'x', 'y', 'width', 'height',
+                 'purchased', 'hover')
+
+    frame_attrs = ('purchased', 'hover')
 
-class ShopItem:
     def __init__(self, name, item_type, cost, description, x, y):
         self.name = name
         self.item_type = item_type
@@ -14,13 +21,9 @@ class ShopItem:
         self.purchased = False
         self.hover = False
 
-    def get_rect(self):
-        return pygame.Rect(self.x - self.width // 2, self.y - self.height // 2,
-                          self.width, self.height)
-
-    def check_hover(self, player_rect):
-        self.hover = self.get_rect().colliderect(player_rect)
-        return self.hover
+    def rect_box(self):
+        return (self.x - self.width // 2, self.y - self.height // 2,
+                self.width, self.height)
 
     def draw(self, screen, font, spore_count):
         if self.purchased:
@@ -0,0 +1,83 @@
+import numpy as np
+import pygame
+
+
+def copy_value(value):
+    """Copy mutable containers one level deep; everything else is shared.
+
+    Entity state only nests immutable tuples inside its lists and dicts, and
+    references to other entities are restored through their own snapshots."""
+    cls = type(value)
+    if cls is list:
+        return value[:]
+    if cls is pygame.Rect:
+        return value.copy()
+    if cls is dict:
+        return value.copy()
+    if cls is set:
+        return set(value)
+    if cls is np.ndarray:
+        return value.copy()
+    return value
+
+
+_slot_names = {}
+MISSING = object()
+
+
+def slot_names(cls):
+    """Names of the __slots__ attributes of cls and its bases"""
+    names = _slot_names.get(cls)
+    if names is None:
+        names = []
+        for klass in reversed(cls.__mro__):
+            for name in klass.__dict__.get('__slots__', ()):
+                if name not in ('__dict__', '__weakref__') and name not in names:
+                    names.append(name)
+        names = _slot_names[cls] = tuple(names)
+    return names
+
+
+def capture_state(obj, skip=()):
+    """Attribute values of obj, slotted or in its __dict__ - slots that
+    were never set are left out"""
+    state = {}
+    for name in slot_names(type(obj)):
+        value = getattr(obj, name, MISSING)
+        if value is not MISSING and name not in skip:
+            state[name] = copy_value(value)
+    attrs = getattr(obj, '__dict__', None)
+    if attrs:
+        state.update((name, copy_value(value)) for name, value in attrs.items() if name not in skip)
+    return state
+
+
+def apply_state(obj, state):
+    # Drop attributes set after the snapshot
+    for name in slot_names(type(obj)):
+        if name not in state and hasattr(obj, name):
+            delattr(obj, name)
+    attrs = getattr(obj, '__dict__', None)
+    if attrs is not None:
+        for name in [name for name in attrs if name not in state]:
+            del attrs[name]
+    for name, value in state.items():
+        setattr(obj, name, copy_value(value))
+
+
+class Snapshot:
+    """Complete mutable state of a GameSession at one tick.
+
+    Entities are restored in place, so references between them (missile
+    targets, the player held by the session) stay valid and a snapshot can be
+    restored any number of times."""
+
+    def __init__(self, objects, rng_states):
+        self.objects = objects  # [(object, state dict)]
+        self.rng_states = rng_states  # [(RandomStreams, state)]
+
+    def restore(self):
+        for obj, state in self.objects:
+            apply_state(obj, state)
+        for streams, state in self.rng_states:
+            streams.setstate(state)
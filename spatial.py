@@ -0,0 +1,294 @@
+import math
+
+import numpy as np
+from collision import time_of_impact
+from navigation import NavGraph
+from terrain import Terrain
+
+
+def overlapping_pairs(rects):
+    """Index pairs (i, j), i < j, of the rects that collide, by sweep and
+    prune: rects sorted by left edge, each only tested against the earlier
+    ones whose right edge it hasn't passed yet"""
+    pairs = []
+    active = []
+    rights = [rect.right for rect in rects]
+    lefts = [rect.left for rect in rects]
+    for index in sorted(range(len(rects)), key=lefts.__getitem__):
+        left = lefts[index]
+        if active:
+            active = [other for other in active if rights[other] > left]
+            rect = rects[index]
+            for other in active:
+                if rect.colliderect(rects[other]):
+                    pairs.append((other, index) if other < index else (index, other))
+        active.append(index)
+    return pairs
+
+
+def range_pairs(starts, stops):
+    """Arrays (k, i) of every i in range(starts[k], stops[k]), for every k in
+    turn - many small candidate lists expanded in one go"""
+    counts = np.maximum(stops - starts, 0)
+    owners = np.repeat(np.arange(len(counts)), counts)
+    # Each pair's place within its own range
+    offsets = np.arange(len(owners)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return owners, np.repeat(starts, counts) + offsets
+
+
+class RectGrid:
+    """Uniform grid (spatial hash) over a list of rects.
+
+    Each cell lists the indices of the rects overlapping it in ascending
+    order, so candidates come back in list order and a collision loop over
+    them resolves contacts exactly like a loop over the whole list."""
+
+    CELL_SIZE = 128
+
+    def _cell_range(self, rect):
+        if rect.width < 0 or rect.height < 0:
+            rect = rect.copy()
+            rect.normalize()
+        size = self.CELL_SIZE
+        # right/bottom are exclusive; empty rects give an empty range
+        return (rect.left // size, (rect.right - 1) // size,
+                rect.top // size, (rect.bottom - 1) // size)
+
+    def _index(self, rects):
+        cells = {}
+        for index, rect in enumerate(rects):
+            x0, x1, y0, y1 = self._cell_range(rect)
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    cells.setdefault((cx, cy), []).append(index)
+        self.cells = cells
+        # The same lists packed end to end, for _cell_pairs: cell (cx, cy)
+        # holds members[starts[key]:starts[key + 1]], key numbering the cells
+        # of the bounding block column by column
+        xs = [cx for cx, _ in cells] or [0]
+        ys = [cy for _, cy in cells] or [0]
+        self.origin = (min(xs), min(ys))
+        self.shape = (max(xs) - min(xs) + 1, max(ys) - min(ys) + 1)
+        counts = np.zeros(self.shape[0] * self.shape[1] + 1, dtype=int)
+        keys = sorted(((cx - min(xs)) * self.shape[1] + cy - min(ys), indices)
+                      for (cx, cy), indices in cells.items())
+        for key, indices in keys:
+            counts[key + 1] = len(indices)
+        self.starts = np.cumsum(counts)
+        self.members = np.array([index for _, indices in keys for index in indices], dtype=int)
+
+    def _cell_pairs(self, lefts, tops, rights, bottoms):
+        """(box, index) arrays pairing each of many boxes (arrays of their
+        edges) with the rects sharing a cell with it - a box covering several
+        cells can meet a rect more than once"""
+        size = self.CELL_SIZE
+        x0, x1 = (lefts // size).astype(int), (rights // size).astype(int)
+        y0, y1 = (tops // size).astype(int), (bottoms // size).astype(int)
+        if (x0 == x1).all() and (y0 == y1).all():
+            # Common case - every box in one cell
+            boxes, cx, cy = np.arange(len(x0)), x0, y0
+        else:
+            heights = y1 - y0 + 1
+            boxes, cell = range_pairs(np.zeros_like(x0), (x1 - x0 + 1) * heights)
+            cx = x0[boxes] + cell // heights[boxes]
+            cy = y0[boxes] + cell % heights[boxes]
+        cx, cy = cx - self.origin[0], cy - self.origin[1]
+        inside = (cx >= 0) & (cx < self.shape[0]) & (cy >= 0) & (cy < self.shape[1])
+        keys = np.where(inside, cx * self.shape[1] + cy, 0)
+        starts = self.starts[keys]
+        stops = np.where(inside, self.starts[keys + 1], starts)
+        entries, found = range_pairs(starts, stops)
+        return boxes[entries], self.members[found]
+
+    def _candidates(self, rect):
+        """Indices of the rects that may collide with rect, ascending"""
+        x0, x1, y0, y1 = self._cell_range(rect)
+        cells = self.cells
+        if x0 == x1 and y0 == y1:
+            # Common case - one cell, already in order
+            return cells.get((x0, y0), ())
+        found = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                indices = cells.get((cx, cy))
+                if indices:
+                    found.update(indices)
+        return sorted(found)
+
+
+class PlatformGrid(RectGrid):
+    """Spatial grid over the platforms of a level.
+
+    query(rect) returns every platform whose rect may collide with rect, in
+    level order. Iterating the grid yields all platforms, `terrain`
+    answers ground and landing checks and `nav` is the level's navigation
+    graph (pass one in to reuse it). Call rebuild() when platform rects
+    change (unstable platforms crumbling or respawning)."""
+
+    FEW_BOXES = 16  # raycast_many() tests up to this many boxes one by one
+
+    def __init__(self, platforms, nav=None):
+        self.platforms = platforms
+        self.terrain = Terrain(platforms)
+        self._nav = nav
+        self.rebuild()
+
+    def __iter__(self):
+        return iter(self.platforms)
+
+    def __len__(self):
+        return len(self.platforms)
+
+    @property
+    def nav(self):
+        """navigation.NavGraph of the platforms, built on first use"""
+        if self._nav is None:
+            self._nav = NavGraph(self.platforms)
+        return self._nav
+
+    def rebuild(self):
+        rects = [platform.rect for platform in self.platforms]
+        self._index(rects)
+        self.terrain.refresh()
+        # Edges of the platforms as columns, for raycast_many
+        edges = [(rect.left, rect.top, rect.right, rect.bottom) for rect in rects]
+        self.bounds = np.array(edges, dtype=float).reshape(-1, 4).T
+
+    def query(self, rect):
+        platforms = self.platforms
+        return [platforms[index] for index in self._candidates(rect)]
+
+    def raycast(self, x, y, width, height, dx, dy, ignore_inside=False):
+        """First platform a width x height box at (x, y) hits when moving by
+        (dx, dy): (t, platform) with t the fraction of the move made before
+        touching it, or None. The move is marched through the grid at most a
+        cell at a time, so only platforms along the path are tested and fast
+        boxes can't tunnel through thin platforms. With ignore_inside,
+        platforms the box already overlaps at (x, y) don't count."""
+        platforms = self.platforms
+        cells = self.cells
+        size = self.CELL_SIZE
+        steps = int(max(abs(dx), abs(dy)) // size) + 1
+        for step in range(steps):
+            start, end = step / steps, (step + 1) / steps
+            # Everything the box covers during this step
+            left = x + dx * (start if dx >= 0 else end)
+            top = y + dy * (start if dy >= 0 else end)
+            right = left + abs(dx) / steps + width
+            bottom = top + abs(dy) / steps + height
+            x0, x1 = int(left // size), int(right // size)
+            y0, y1 = int(top // size), int(bottom // size)
+            if x0 == x1 and y0 == y1:
+                found = cells.get((x0, y0), ())
+            else:
+                found = set()
+                for cx in range(x0, x1 + 1):
+                    for cy in range(y0, y1 + 1):
+                        indices = cells.get((cx, cy))
+                        if indices:
+                            found.update(indices)
+            hit = None
+            for index in found:
+                rect = platforms[index].rect
+                if rect.right <= left or rect.left >= right or rect.bottom <= top or rect.top >= bottom:
+                    continue
+                if ignore_inside and (x < rect.right and x + width > rect.left and
+                                      y < rect.bottom and y + height > rect.top):
+                    continue
+                t = time_of_impact(x, y, width, height, dx, dy, rect)
+                if t is not None and (hit is None or (t, index) < hit):
+                    hit = (t, index)
+            # A hit later than this step may not be the first one
+            if hit is not None and hit[0] <= end:
+                return hit[0], platforms[hit[1]]
+        return None
+
+    def raycast_many(self, x, y, width, height, dx, dy):
+        """raycast() for many boxes at once, all arguments NumPy arrays of the
+        same length: the fraction of each move made before the box first
+        touches a platform, inf where the way is clear. Boxes are paired with
+        the platforms in the grid cells their moves cover, and the pairs
+        whose swept bounds meet get the same slab test as
+        collision.time_of_impact, all in one go."""
+        if len(x) <= self.FEW_BOXES:
+            # Not worth the arrays - one at a time through the grid
+            hits = [self.raycast(*box) for box in zip(x.tolist(), y.tolist(), width.tolist(),
+                                                     height.tolist(), dx.tolist(), dy.tolist())]
+            return np.array([np.inf if hit is None else hit[0] for hit in hits])
+        times = np.full(len(x), np.inf)
+        # Everything each box covers during its move, a pixel wider so
+        # rounding can't drop a pair the exact test would keep
+        box_left = np.minimum(x, x + dx) - 1
+        box_right = np.maximum(x, x + dx) + width + 1
+        box_top = np.minimum(y, y + dy) - 1
+        box_bottom = np.maximum(y, y + dy) + height + 1
+        rows, cols = self._cell_pairs(box_left, box_top, box_right, box_bottom)
+        lefts, tops, rights, bottoms = self.bounds[:, cols]
+        near = ((box_left[rows] < rights) & (box_right[rows] > lefts) &
+                (box_top[rows] < bottoms) & (box_bottom[rows] > tops))
+        if not near.any():
+            return times
+        rows = rows[near]
+        lefts, tops, rights, bottoms = lefts[near], tops[near], rights[near], bottoms[near]
+        enter = np.zeros(len(rows))
+        leave = np.ones(len(rows))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for pos, size, delta, low, high in ((x[rows], width[rows], dx[rows], lefts, rights),
+                                                (y[rows], height[rows], dy[rows], tops, bottoms)):
+                # Times the leading and trailing edges cross the platform on this axis
+                first = (low - (pos + size)) / delta
+                last = (high - pos) / delta
+                first, last = np.minimum(first, last), np.maximum(first, last)
+                # Not moving on this axis: overlapping on it all the time or never
+                still = delta == 0
+                if still.any():
+                    overlap = (pos + size > low) & (pos < high)
+                    first = np.where(still, np.where(overlap, 0.0, np.inf), first)
+                    last = np.where(still, np.where(overlap, 1.0, -np.inf), last)
+                np.maximum(enter, first, out=enter)
+                np.minimum(leave, last, out=leave)
+        np.minimum.at(times, rows, np.where(enter < leave, enter, np.inf))
+        return times
+
+
+class TargetIndex:
+    """Grid of monster centres for homing missiles, built once per tick and
+    shared by every missile in flight"""
+
+    CELL_SIZE = 200
+
+    def __init__(self, monsters):
+        self.monsters = list(monsters)
+        self.slots = {}
+        self.centers = []
+        self.cells = {}
+        size = self.CELL_SIZE
+        for index, monster in enumerate(self.monsters):
+            self.slots[id(monster)] = index
+            center = (monster.x + monster.width / 2, monster.y + monster.height / 2)
+            self.centers.append(center)
+            self.cells.setdefault((int(center[0] // size), int(center[1] // size)), []).append(index)
+
+    def distance(self, monster, x, y):
+        """Distance from (x, y) to a live monster's centre, None if it's gone"""
+        index = self.slots.get(id(monster))
+        if index is None or monster.health <= 0:
+            return None
+        mx, my = self.centers[index]
+        return math.sqrt((mx - x) ** 2 + (my - y) ** 2)
+
+    def nearest(self, x, y, max_dist):
+        """The live monster whose centre is nearest to (x, y) and closer than
+        max_dist, or None. Ties go to the earlier monster in the list."""
+        size = self.CELL_SIZE
+        best = None
+        for cx in range(int((x - max_dist) // size), int((x + max_dist) // size) + 1):
+            for cy in range(int((y - max_dist) // size), int((y + max_dist) // size) + 1):
+                for index in self.cells.get((cx, cy), ()):
+                    if self.monsters[index].health <= 0:
+                        continue
+                    mx, my = self.centers[index]
+                    dist = math.sqrt((mx - x) ** 2 + (my - y) ** 2)
+                    if dist < max_dist and (best is None or (dist, index) < best):
+                        best = (dist, index)
+        return self.monsters[best[1]] if best else None
@@ -0,0 +1,429 @@
+"""Optional two-process mode: the GameSession runs in a child process at a
+fixed tick rate and publishes every tick's drawable state into shared memory,
+while the main process only handles input, sound and drawing.
+
+A level's drawable objects are pickled across once, when the level starts
+(or when something new appears in it, like the spore). After that each
+frame is a flat array of floats: for every object, the attributes its class
+lists in frame_attrs, plus the live bullets and missiles as columns. Plain
+platforms aren't in frames at all, and neither is the level's terrain or
+navigation graph - drawing doesn't need them."""
+import io
+import multiprocessing
+import pickle
+import queue
+import struct
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+import pygame
+
+from game_session import GameSession, FrameInput, SIM_DT, MAX_CATCHUP_STEPS
+from projectiles import ProjectileStore
+from rng import RandomStreams, default_streams
+from save_manager import SaveManager
+
+SLOT_SIZE = 1 << 20  # Largest frame (a busy level is a few KB of floats)
+LEVEL_SIZE = 1 << 22  # Largest pickled level
+LATEST = struct.Struct('<Q')  # Number of the newest completed frame
+SLOT_HEADER = struct.Struct('<QI')  # Seqlock counter, payload length
+LEVEL_HEADER = struct.Struct('<QQI')  # Seqlock counter, level number, payload length
+
+MUSIC = (None, 'main_theme', 'intense_theme', 'victory_theme', 'shop_theme')
+SHOT_COLUMNS = ('x', 'y', 'width', 'height', 'kind', 'vx')  # What ProjectileStore.draw() reads
+
+
+class FrameBuffer:
+    """Two frame slots and a level slot in shared memory, each guarded by a
+    seqlock.
+
+    The single writer alternates frame slots, bumping the slot's counter to
+    odd before writing and back to even afterwards, then publishes the frame
+    number. Readers copy the newest slot and retry if its counter was odd or
+    changed meanwhile, so they never block the writer and never see a torn
+    frame. The level slot works the same way and is written before the
+    first frame that needs it."""
+
+    def __init__(self, name=None):
+        size = self._level_offset() + LEVEL_HEADER.size + LEVEL_SIZE
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            self.shm.buf[:size] = bytes(size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.name = self.shm.name
+        self.buf = self.shm.buf
+
+    def _slot_offset(self, frame_no):
+        return LATEST.size + (frame_no % 2) * (SLOT_HEADER.size + SLOT_SIZE)
+
+    def _level_offset(self):
+        return LATEST.size + 2 * (SLOT_HEADER.size + SLOT_SIZE)
+
+    def write(self, frame_no, payload):
+        if len(payload) > SLOT_SIZE:
+            raise ValueError(f"Frame too large for shared memory slot ({len(payload)} bytes)")
+        offset = self._slot_offset(frame_no)
+        seq, _ = SLOT_HEADER.unpack_from(self.buf, offset)
+        SLOT_HEADER.pack_into(self.buf, offset, seq + 1, len(payload))  # Odd: write in progress
+        start = offset + SLOT_HEADER.size
+        self.buf[start:start + len(payload)] = payload
+        SLOT_HEADER.pack_into(self.buf, offset, seq + 2, len(payload))
+        LATEST.pack_into(self.buf, 0, frame_no)
+
+    def read(self, last_frame_no=0):
+        """Return (frame_no, payload) of the newest frame, payload None if nothing new"""
+        while True:
+            frame_no, = LATEST.unpack_from(self.buf, 0)
+            if frame_no == last_frame_no:
+                return frame_no, None
+            offset = self._slot_offset(frame_no)
+            seq, length = SLOT_HEADER.unpack_from(self.buf, offset)
+            if seq % 2:
+                continue
+            start = offset + SLOT_HEADER.size
+            payload = bytes(self.buf[start:start + length])
+            if SLOT_HEADER.unpack_from(self.buf, offset)[0] == seq:
+                return frame_no, payload
+
+    def write_level(self, level_no, payload):
+        if len(payload) > LEVEL_SIZE:
+            raise ValueError(f"Level too large for shared memory slot ({len(payload)} bytes)")
+        offset = self._level_offset()
+        seq, _, _ = LEVEL_HEADER.unpack_from(self.buf, offset)
+        LEVEL_HEADER.pack_into(self.buf, offset, seq + 1, level_no, len(payload))
+        start = offset + LEVEL_HEADER.size
+        self.buf[start:start + len(payload)] = payload
+        LEVEL_HEADER.pack_into(self.buf, offset, seq + 2, level_no, len(payload))
+
+    def read_level(self):
+        """Return (level_no, payload) of the newest level"""
+        offset = self._level_offset()
+        while True:
+            seq, level_no, length = LEVEL_HEADER.unpack_from(self.buf, offset)
+            if seq % 2:
+                continue
+            start = offset + LEVEL_HEADER.size
+            payload = bytes(self.buf[start:start + length])
+            if LEVEL_HEADER.unpack_from(self.buf, offset)[0] == seq:
+                return level_no, payload
+
+    def close(self):
+        self.buf = None
+        self.shm.close()
+
+    def unlink(self):
+        self.shm.unlink()
+
+
+class SessionView:
+    """The parts of a GameSession that draw_session() reads.
+
+    `updated` lists the objects whose frame_attrs every frame carries, in
+    frame order; monsters follow, each with its index in `all_monsters`."""
+
+    LEVEL_ATTRS = ('mode', 'bg_color', 'is_shop', 'tutorial_prompt', 'endless_level', 'tutorial_level')
+    OBJECT_ATTRS = ('player', 'game_state', 'portal', 'spore', 'shop_ant', 'platforms', 'shop_items')
+    TICK_ATTRS = ('tick', 'respawn_timer', 'has_spore', 'spore_spawned', 'game_over', 'victory')
+
+    def __init__(self, session):
+        for name in self.LEVEL_ATTRS + self.OBJECT_ATTRS + self.TICK_ATTRS:
+            setattr(self, name, getattr(session, name))
+        self.music = session.music
+        self.all_monsters = list(session.monsters)
+        self.monsters = self.all_monsters
+        self.bullets = ProjectileStore(capacity=0)
+        self.impacts = []
+        self.updated = [obj for obj in (self.player, self.game_state, self.portal, self.spore, self.shop_ant)
+                        if obj is not None]
+        # Plain platforms never change after the level is built
+        self.updated += [platform for platform in self.platforms if platform.bouncy or platform.unstable]
+        if self.is_shop:
+            self.updated += self.shop_items
+
+    @property
+    def is_endless_mode(self):
+        return self.mode == "endless"
+
+    @property
+    def is_tutorial_mode(self):
+        return self.mode == "tutorial"
+
+
+class _FramePickler(pickle.Pickler):
+    # Random streams stay in the simulation; drawing only needs cosmetic randomness
+    def persistent_id(self, obj):
+        return 'rng' if isinstance(obj, RandomStreams) else None
+
+
+class _FrameUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid):
+        return default_streams
+
+
+def _flatten(value, out):
+    """Append value to the list out as numbers: tuples, Rects and arrays
+    element by element, lists with their length first"""
+    if isinstance(value, np.ndarray):
+        out.extend(value.ravel().tolist())
+    elif isinstance(value, (tuple, pygame.Rect)):
+        for item in value:
+            _flatten(item, out)
+    elif isinstance(value, list):
+        out.append(len(value))
+        for item in value:
+            _flatten(item, out)
+    else:
+        out.append(value)
+
+
+def _unflatten(template, values, pos):
+    """Read back a value _flatten() wrote at values[pos], shaped like
+    template (the last value seen); returns (value, position after it)"""
+    if isinstance(template, bool):
+        return values[pos] != 0, pos + 1
+    if isinstance(template, int):
+        value = values[pos]
+        return (int(value) if value.is_integer() else value), pos + 1
+    if isinstance(template, np.ndarray):
+        end = pos + template.size
+        return np.array(values[pos:end], template.dtype).reshape(template.shape), end
+    if isinstance(template, pygame.Rect):
+        return pygame.Rect(values[pos:pos + 4]), pos + 4
+    if isinstance(template, tuple):
+        items = []
+        for item in template:
+            item, pos = _unflatten(item, values, pos)
+            items.append(item)
+        return tuple(items), pos
+    if isinstance(template, list):
+        count = int(values[pos])
+        pos += 1
+        items = []
+        for index in range(count):
+            item, pos = _unflatten(template[min(index, len(template) - 1)], values, pos)
+            items.append(item)
+        return items, pos
+    return values[pos], pos + 1
+
+
+def _read_attrs(obj, values, pos):
+    for name in obj.frame_attrs:
+        value, pos = _unflatten(getattr(obj, name), values, pos)
+        setattr(obj, name, value)
+    return pos
+
+
+class FrameWriter:
+    """Simulation side: turns the session into frame payloads, publishing
+    its level to the buffer first whenever that changed"""
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.level_no = 0
+        self.view = None
+        self.monster_keys = {}
+
+    def _level_changed(self, session):
+        view = self.view
+        if view is None:
+            return True
+        if any(getattr(session, name) is not getattr(view, name) for name in SessionView.OBJECT_ATTRS):
+            return True
+        if any(getattr(session, name) != getattr(view, name) for name in SessionView.LEVEL_ATTRS):
+            return True
+        keys = self.monster_keys
+        return any(id(monster) not in keys for monster in session.monsters)
+
+    def _publish_level(self, session):
+        # The view holds the session's own objects, so the ids stay valid
+        self.view = SessionView(session)
+        self.monster_keys = {id(monster): key for key, monster in enumerate(self.view.all_monsters)}
+        self.level_no += 1
+        out = io.BytesIO()
+        _FramePickler(out, protocol=pickle.HIGHEST_PROTOCOL).dump(self.view)
+        self.buffer.write_level(self.level_no, out.getbuffer())
+
+    def encode(self, session):
+        if self._level_changed(session):
+            self._publish_level(session)
+        shots = session.bullets
+        values = [self.level_no, MUSIC.index(session.music), len(session.monsters), len(session.impacts),
+                  len(shots)]
+        for name in SessionView.TICK_ATTRS:
+            _flatten(getattr(session, name), values)
+        for obj in self.view.updated:
+            for name in obj.frame_attrs:
+                _flatten(getattr(obj, name), values)
+        keys = self.monster_keys
+        for monster in session.monsters:
+            values.append(keys[id(monster)])
+            for name in monster.frame_attrs:
+                _flatten(getattr(monster, name), values)
+        for impact in session.impacts:
+            values.extend(impact)
+        columns = [getattr(shots, name)[:shots.count] for name in SHOT_COLUMNS]
+        return np.array(values, float).tobytes() + np.concatenate(columns, dtype=float).tobytes()
+
+
+def decode_frame(view, payload):
+    """Bring the level's view up to the frame in payload"""
+    columns = np.frombuffer(payload)
+    values = columns.tolist()
+    music, monsters, impacts, shots = values[1:5]
+    view.music = MUSIC[int(music)]
+    pos = 5
+    for name in SessionView.TICK_ATTRS:
+        value, pos = _unflatten(getattr(view, name), values, pos)
+        setattr(view, name, value)
+    for obj in view.updated:
+        pos = _read_attrs(obj, values, pos)
+    view.monsters = []
+    for _ in range(int(monsters)):
+        monster = view.all_monsters[int(values[pos])]
+        pos = _read_attrs(monster, values, pos + 1)
+        view.monsters.append(monster)
+    end = pos + 3 * int(impacts)
+    view.impacts = [tuple(values[index:index + 3]) for index in range(pos, end, 3)]
+    bullets = view.bullets
+    for name, column in zip(SHOT_COLUMNS, columns[end:].reshape(len(SHOT_COLUMNS), int(shots))):
+        setattr(bullets, name, column)
+    bullets.count = int(shots)
+    return view
+
+
+class SoundEvents:
+    """Stands in for SoundGenerator in the simulation process"""
+
+    def __init__(self, events):
+        self.events = events
+
+    def play(self, sound_name):
+        self.events.put(sound_name)
+
+
+def run_simulation(mode, map_data, seed, buffer_name, conn, sound_events):
+    """Child process: step the session in real time and publish every tick"""
+    buffer = FrameBuffer(buffer_name)
+    session = GameSession(mode, map_data=map_data, sound_gen=SoundEvents(sound_events),
+                          save_manager=SaveManager(), seed=seed)
+    held = frozenset()
+    pressed = []
+    paused = False
+    frames = FrameWriter(buffer)
+    frame_no = 1
+    buffer.write(frame_no, frames.encode(session))
+    next_tick = time.perf_counter()
+    try:
+        while True:
+            while conn.poll():
+                message = conn.recv()
+                if message[0] == 'input':
+                    held = message[1].held
+                    pressed.extend(message[1].pressed)
+                elif message[0] == 'pause':
+                    paused = message[1]
+                elif message[0] == 'stop':
+                    return
+
+            now = time.perf_counter()
+            if paused:
+                next_tick = now
+                time.sleep(0.01)
+                continue
+
+            steps = 0
+            while now >= next_tick and steps < MAX_CATCHUP_STEPS:
+                session.step(FrameInput(held, pressed))
+                pressed = []
+                next_tick += SIM_DT
+                steps += 1
+            if steps == MAX_CATCHUP_STEPS:
+                next_tick = max(next_tick, now)
+            if steps:
+                frame_no += 1
+                buffer.write(frame_no, frames.encode(session))
+            time.sleep(max(0.0, next_tick - time.perf_counter()))
+    finally:
+        buffer.close()
+
+
+class SimulationProcess:
+    """Render-side handle of a session running in a child process.
+
+    Exposes the latest published frame as `view` plus the flags the game loop
+    checks (game_over, victory, mode, music)."""
+
+    def __init__(self, mode, map_data=None, seed=None):
+        self.mode = mode
+        context = multiprocessing.get_context('spawn')
+        self.buffer = FrameBuffer()
+        self.conn, child_conn = context.Pipe()
+        self.sound_events = context.Queue()
+        self.process = context.Process(target=run_simulation, daemon=True,
+                                       args=(mode, map_data, seed, self.buffer.name, child_conn,
+                                             self.sound_events))
+        self.process.start()
+        self.frame_no = 0
+        self.level_no = 0
+        self.level = None
+        self.view = None
+        self.paused = False
+        self.last_held = None
+
+    @property
+    def game_over(self):
+        return self.view is not None and self.view.game_over
+
+    @property
+    def victory(self):
+        return self.view is not None and self.view.victory
+
+    @property
+    def music(self):
+        return self.view.music if self.view is not None else 'main_theme'
+
+    def send_input(self, frame_input):
+        # Held keys only need sending when they change
+        if frame_input.pressed or frame_input.held != self.last_held:
+            self.conn.send(('input', frame_input))
+            self.last_held = frame_input.held
+
+    def set_paused(self, paused):
+        if paused != self.paused:
+            self.conn.send(('pause', paused))
+            self.paused = paused
+
+    def poll(self):
+        """Pick up the newest frame; True if it changed"""
+        frame_no, payload = self.buffer.read(self.frame_no)
+        if payload is None:
+            return False
+        level_no = int(np.frombuffer(payload, count=1)[0])
+        if level_no != self.level_no:
+            found, level = self.buffer.read_level()
+            if found != level_no:
+                return False  # Already replaced by the next level; a newer frame is on its way
+            self.level_no = level_no
+            self.level = _FrameUnpickler(io.BytesIO(level)).load()
+        self.frame_no = frame_no
+        self.view = decode_frame(self.level, payload)
+        return True
+
+    def pending_sounds(self):
+        sounds = []
+        while True:
+            try:
+                sounds.append(self.sound_events.get_nowait())
+            except queue.Empty:
+                return sounds
+
+    def stop(self):
+        if self.process.is_alive():
+            self.conn.send(('stop',))
+            self.process.join(timeout=2)
+            if self.process.is_alive():
+                self.process.terminate()
+        self.buffer.close()
+        self.buffer.unlink()
@@ -1,8 +1,14 @@
 import pygame
 import math
 
+from collision import Hitbox
+
+
+class Spore(Hitbox):
+    __slots__ = ('x', 'y', 'radius', 'float_offset', 'collected', 'color', 'glow_color')
+
+    frame_attrs = ('x', 'y', 'float_offset', 'collected')
 
-class Spore:
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -12,10 +18,10 @@ class Spore:
         self.color = (100, 255, 150)
         self.glow_color = (150, 255, 200)
 
-    def get_rect(self):
+    def rect_box(self):
         actual_y = self.y + math.sin(self.float_offset) * 8
-        return pygame.Rect(self.x - self.radius, actual_y - self.radius,
-                          self.radius * 2, self.radius * 2)
+        return (self.x - self.radius, actual_y - self.radius,
+                self.radius * 2, self.radius * 2)
 
     def update(self):
         self.float_offset += 0.05
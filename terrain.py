@@ -0,0 +1,89 @@
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+import pygame
+
+
+class Terrain:
+    """Pixel-exact terrain lookups over the platforms of a level.
+
+    Rows are grouped into bands between consecutive platform tops and
+    bottoms, since nothing changes inside a band. For every pixel column the
+    level keeps, per band, the band's own top if the column is solid there,
+    else the first solid row below it (a column heightmap for every height at
+    once), so "is there ground in this box" and "where is the first surface
+    below this point" are one array slice instead of a loop over platforms.
+    Answers match testing pygame.Rect(x, y, width, height) against every
+    platform rect. Call refresh() after unstable platforms crumble or
+    respawn - only the columns they cover are recomputed."""
+
+    def __init__(self, platforms):
+        self.platforms = platforms
+        # Crumbled platforms have an empty rect, so size the map by where they respawn
+        rects = [pygame.Rect(p.x, p.y, p.width, p.height) for p in platforms]
+        bounds = rects[0].unionall(rects[1:]) if rects else pygame.Rect(0, 0, 0, 0)
+        # Nothing is left of / above the bounds, so lookups there clamp to the edge
+        self.left, self.top = bounds.left, bounds.top
+        self.columns, self.rows = bounds.width, bounds.height
+        # First row of each band; the last band, starting at rows, is "nothing further down"
+        edges = {0, self.rows}
+        for rect in rects:
+            edges.update((rect.top - self.top, rect.bottom - self.top))
+        self.band_tops = sorted(edges)
+        self.below = np.empty((len(self.band_tops), self.columns), np.min_scalar_type(self.rows))
+        self.below[-1] = self.rows
+        self.painted = {index: tuple(platform.rect) for index, platform in enumerate(platforms)
+                        if platform.unstable}
+        self._paint(0, self.columns)
+
+    def _paint(self, c0, c1):
+        """Recompute columns c0..c1 from the platform rects"""
+        below = self.below[:, c0:c1]
+        below[:-1] = self.rows
+        band_tops = np.array(self.band_tops, below.dtype)[:, None]
+        for platform in self.platforms:
+            rect = platform.rect
+            left = max(rect.left - self.left, c0)
+            right = min(rect.right - self.left, c1)
+            if rect.height > 0 and left < right:
+                first = bisect_left(self.band_tops, rect.top - self.top)
+                last = bisect_left(self.band_tops, rect.bottom - self.top)
+                below[first:last, left - c0:right - c0] = band_tops[first:last]
+        # Carry the nearest solid row up each column, bottom to top
+        np.minimum.accumulate(below[::-1], axis=0, out=below[::-1])
+
+    def refresh(self):
+        left = right = None
+        for index, old in self.painted.items():
+            rect = tuple(self.platforms[index].rect)
+            if rect == old:
+                continue
+            self.painted[index] = rect
+            for x, _, width, _ in (old, rect):
+                if width > 0:
+                    left = x if left is None else min(left, x)
+                    right = x + width if right is None else max(right, x + width)
+        if left is not None:
+            self._paint(max(left - self.left, 0), min(right - self.left, self.columns))
+
+    def surface_below(self, x, y, width):
+        """Top of the first solid pixel at or below row y within columns
+        x..x+width, or None if there is nothing but the void below"""
+        x, y, width = int(x), int(y), int(width)
+        c0 = max(x - self.left, 0)
+        c1 = min(x + width - self.left, self.columns)
+        if c0 >= c1:
+            return None
+        y = min(max(y - self.top, 0), self.rows)
+        band = bisect_right(self.band_tops, y) - 1
+        # A solid column gives its band's top, at or above y
+        row = max(int(self.below[band, c0:c1].min()), y)
+        return None if row == self.rows else row + self.top
+
+    def solid_in(self, x, y, width, height):
+        """Whether a width x height box at (x, y) touches any platform"""
+        if int(height) <= 0:
+            return False
+        surface = self.surface_below(x, y, width)
+        return surface is not None and surface < int(y) + int(height)
+